@@ -13,10 +13,8 @@ set ST within T ordered; #START TIMESLOTS FOR EACH DAY
 
 set DT {D} within T ordered; #ALL TIMESLOTS FOR EACH DAY
 set AT {G} within T ordered; #AVAILABLE STARTING TIMESLOTS FOR EACH GROUP
-set PT {G} within T ordered; #PREFERED STARTING TIMESLOTS (enten denne eller parametre p_st1 osv.)
 set AAT {F, G} within T ordered; # ALREADY ASSIGNED TIMESLOTS FOR A TEAM ON A FIELD
 set UT {F} within T ordered; #UNAVAILABLE STARTING TIMES FOR EACH FIELD
-set PF {G} within F ordered default {}; #PREFERRED FIELDS PER GROUP (ordered for rank weighting). Defaults to empty set per group if not provided in data
 
 # Pairs of groups that should not train simultaneously i.e. because of having the same coach
 # Example data input: set INCOMPATIBLE_GROUPS_SAME_TIME := ("TeamA","TeamB") ("TeamC","TeamD") etc..;  (provide each unordered pair only once)
@@ -25,6 +23,20 @@ set INCOMPATIBLE_GROUPS_SAME_TIME within {G, G};
 # Pairs of groups that should not have activities during the same day
 set INCOMPATIBLE_GROUPS_SAME_DAY within {G, G};
 
+# Interchangeable groups/fields (identical parameters), consecutive members of each class.
+# Any solution can be permuted within a class, so ordering them cuts equivalent branches.
+set GROUP_SYMMETRY_PAIRS within {G, G} default {};
+set FIELD_SYMMETRY_PAIRS within {F, F} default {};
+
+# Mutually same-time incompatible groups of equal priority (e.g. one coach's teams).
+# Their pairs are penalized together through clique_excess instead of pairwise.
+set SAME_TIME_CLIQUES default {};
+set SAME_TIME_CLIQUE {SAME_TIME_CLIQUES} within G;
+
+# Start sets of schedules already returned as alternatives (diversity cuts)
+set ALTERNATIVE_CUTS default {};
+set CUT_STARTS {ALTERNATIVE_CUTS} within {F, G, T};
+
 ###############################################################
 # PARAMS
 ###############################################################
@@ -40,30 +52,38 @@ param d{G} >= 0; #How long an activity for group g should be
 param n_min{G} >= 0; #minimum number of activities
 param n_max{G} >= 0; #maximum number of activities
 param size{F} >= 0; #size of field measured in zones
+param max_group_size {f in F} >= 0 default size[f]; #largest group a field takes (one member's size for pooled identical fields)
 param size_req{G} >= 0; #size required for each group
 param prio{G} in 1..3; # Group priority: option to prioritize activities of specific groups
-param slots_per_day {day in D} := card(DT[day]); #number of slots per day
-param mid_slot {day in D} := ceil(slots_per_day[day] / 2); #middle slot index per day (early/late weights go to zero here)
-param early_weight {day in D, s in DT[day]} := max(0, mid_slot[day] - ord(s, DT[day])); #starts high on slot 1, 0 at mid_slot
-param late_weight {day in D, s in DT[day]} := max(0, ord(s, DT[day]) - mid_slot[day]); #0 at mid_slot, increases toward the final slot
-param middle_weight {day in D, s in DT[day]} := max(0, max(mid_slot[day] - 1, slots_per_day[day] - mid_slot[day]) - abs(ord(s, DT[day]) - mid_slot[day])); #peaks at mid_slot, 0 at edges
+param clique_prio {c in SAME_TIME_CLIQUES} = max {g in SAME_TIME_CLIQUE[c]} prio[g]; #uniform within a clique
+param cut_min_changes {ALTERNATIVE_CUTS} integer >= 1 default 1; #starts of a cut schedule that must change
+param grid_factor integer >= 1 default 1; #15-minute slots per timeslot (2 or 4 when solving on a 30/60-minute grid)
 
 #Group parameters (preferences)
 param p_st1{G} default 0; #prefered start time 1
 param p_st2{G} default 0; #prefered start time 2
-param p_early_starts {G} integer >= 0 default 0; #preference for early-day starts
-param p_middle_starts {G} integer >= 0 default 0; #preference for mid-day starts
-param p_late_starts {G} integer >= 0 default 0; #preference for late-day starts
+# Objective value of an activity start of g at t on f: priority, preferred start
+# time and field, early-start reward and late-start penalty. Computed in Python
+# (compute_start_coefficients), only given for t in AT[g]
+param start_value {F, G, T} default 0;
+
+#Where incompatible groups can meet (penalty terms exist only there)
+# Timeslots a group can occupy: covered from an allowed start, or predefined
+set REACH {g in G} = (setof {day in D, s in DT[day] inter AT[g], t in DT[day]: t >= s and t <= s + d[g] - 1} t)
+    union (union {f in F} AAT[f,g]);
+# Days a group can be active on
+set ACTIVE_D {g in G} = {day in D: card(DT[day] inter REACH[g]) > 0};
+# Incompatible pairs not covered by a clique, and where the members can meet
+set SAME_TIME_PAIRS = {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_TIME:
+    not exists {c in SAME_TIME_CLIQUES} (g1 in SAME_TIME_CLIQUE[c] and g2 in SAME_TIME_CLIQUE[c])};
+set SAME_TIME_OVERLAP_T {(g1,g2) in SAME_TIME_PAIRS} = REACH[g1] inter REACH[g2];
+set SAME_DAY_OVERLAP_D {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_DAY} = ACTIVE_D[g1] inter ACTIVE_D[g2];
+param clique_reach {c in SAME_TIME_CLIQUES, t in T} = card {g in SAME_TIME_CLIQUE[c]: t in REACH[g]}; #members able to occupy t
 
 #Objective function reward and penalty parameters
-param preference_value = 2;
-param field_preference_value default 0.5; # reward weight for preferred fields
-param field_pref_weight {g in G, f in F} default (if f in PF[g] then 1 else 0); # per-group field weight (0 if not preferred, 1 if preferred). Can be overwritten in the input i.e. field_pref_weight := [G12, Haslumbanen] 0.8 [G12, Haslumbanen_2] 0.5; etc.
 param penalty_incompatible_group_same_time >= 0 default 0.5; # Global penalty for simultaneous activities of incompatible groups
 param penalty_incompatible_group_same_day >= 0 default 10; # Global penalty for same-day activities of incompatible groups
 param penalty_adj_days = 0.5; #penalty weight for consecutive-day activities
-param penalty_late_starts default 0.01; #generally it is considered better to start early rather than late
-param reward_start_time_preference >= 0 default 1; #reward weight for start-time preferences
 param penalty_shortfall_tier1 >= 0 default 300;  # 1st missing activity
 param penalty_shortfall_tier2 >= 0 default 1500; # 2nd missing activity (5x tier1)
 param penalty_shortfall_tier3 >= 0 default 6000; # 3rd+ missing activity (20x tier1)
@@ -77,13 +97,16 @@ var x {F,G,T} binary;
 var y {F,G,T} binary;
 var has_activity_day {G, D} binary; # 1 if group g has any activity start on day
 var has_activity_adjacent_days {G, (day_1,day_2) in ADJ_D} binary; # 1 if group has activities on adjacent days
+var same_time_overlap {(g1,g2) in SAME_TIME_PAIRS, t in SAME_TIME_OVERLAP_T[g1,g2]} >= 0; # 1 if both groups occupy t
+var same_day_overlap {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_DAY, day in SAME_DAY_OVERLAP_D[g1,g2]} >= 0; # 1 if both groups are active on day
+var clique_excess {c in SAME_TIME_CLIQUES, t in T, k in 1..clique_reach[c,t] - 1} >= 0; # max(0, members occupying t - k)
 var min_activity_shortfall {g in G} >= 0; # shortfall vs n_min[g]
 var shortfall_tier1 {G} >= 0, <= 1; # 1st missing activity (cheapest)
 var shortfall_tier2 {G} >= 0, <= 1; # 2nd missing activity
 var shortfall_tier3 {G} >= 0;       # 3rd+ missing activities (most expensive)
 
 
-# Sum of activity starts
+# Sum of activity starts (start terms are precomputed into start_value)
 # + sum of activity starts at preferred starting times
 # + sum of activity starts at preferred fields
 # - penalty for having activities on adjacent days (linearized)
@@ -94,19 +117,14 @@ var shortfall_tier3 {G} >= 0;       # 3rd+ missing activities (most expensive)
 # * group priority weight, typically varies from 1 to 3 (1=low, 2=medium, 3=high), pairwise penalties/rewards are averaged between the two groups
 
 maximize preference_score:
-    sum {f in F, g in G, t in T} y[f,g,t] * prio[g]
-  + sum {f in F, g in G, t in PT[g]} y[f,g,t] * preference_value * prio[g]
-  + sum {g in G, f in F, t in T}
-        y[f,g,t] * field_preference_value * field_pref_weight[g,f] * prio[g]
+    sum {f in F, g in G, t in AT[g]} start_value[f,g,t] * y[f,g,t]
   - penalty_adj_days * sum {g in G, (day_1,day_2) in ADJ_D} has_activity_adjacent_days[g,day_1,day_2] * prio[g]
-  - sum {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_TIME, t in T}
-        penalty_incompatible_group_same_time * ((prio[g1] + prio[g2]) / 2) * (sum {f in F} x[f,g1,t]) * (sum {f in F} x[f,g2,t])
-  - sum {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_DAY, day in D}
-        penalty_incompatible_group_same_day * ((prio[g1] + prio[g2]) / 2) * has_activity_day[g1,day] * has_activity_day[g2,day]
-  - penalty_late_starts * sum {f in F, g in G, day in D, s in DT[day]} (ord(s, DT[day]) - 1) * y[f,g,s] * prio[g]
-  + reward_start_time_preference * sum {f in F, g in G, day in D, s in DT[day]} p_early_starts[g] * early_weight[day,s] * y[f,g,s] * prio[g]
-  + reward_start_time_preference * sum {f in F, g in G, day in D, s in DT[day]} p_middle_starts[g] * middle_weight[day,s] * y[f,g,s] * prio[g]
-  + reward_start_time_preference * sum {f in F, g in G, day in D, s in DT[day]} p_late_starts[g] * late_weight[day,s] * y[f,g,s] * prio[g]
+  - sum {(g1,g2) in SAME_TIME_PAIRS, t in SAME_TIME_OVERLAP_T[g1,g2]}
+        penalty_incompatible_group_same_time * grid_factor * ((prio[g1] + prio[g2]) / 2) * same_time_overlap[g1,g2,t]
+  - sum {c in SAME_TIME_CLIQUES, t in T, k in 1..clique_reach[c,t] - 1}
+        penalty_incompatible_group_same_time * grid_factor * clique_prio[c] * clique_excess[c,t,k]
+  - sum {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_DAY, day in SAME_DAY_OVERLAP_D[g1,g2]}
+        penalty_incompatible_group_same_day * ((prio[g1] + prio[g2]) / 2) * same_day_overlap[g1,g2,day]
   - sum {g in G} (
       penalty_shortfall_tier1 * shortfall_tier1[g] * prio[g]
     + penalty_shortfall_tier2 * shortfall_tier2[g] * prio[g]
@@ -150,9 +168,9 @@ subject to activity_can_not_start {g in G, t in T diff AT[g]}:
 subject to field_capacity {t in T, f in F}:
 	sum {g in G} x[f,g,t]*size_req[g] <= size[f];
 
-# Max one activity per day
-subject to one_activity_per_day {g in G, day in D}:
-    sum {t in DT[day], f in F} y[f,g,t] <= 1;
+# Groups larger than a single member field can not use a pooled field
+subject to group_fits_field {f in F, g in G, t in T: size_req[g] > max_group_size[f]}:
+	x[f,g,t] = 0;
 
 # Activity must fit within same day
 #subject to activity_fit_within_same_day {f in F, g in G, st in ST}:
@@ -162,16 +180,45 @@ subject to one_activity_per_day {g in G, day in D}:
 subject to no_late_starts {f in F, g in G, day in D, s in DT[day] : s + d[g] - 1 > last_t[day]}:
 	y[f,g,s] = 0;
 
+# Symmetry breaking: interchangeable groups ordered by their start positions
+subject to group_symmetry {(g1,g2) in GROUP_SYMMETRY_PAIRS}:
+    sum {f in F, t in AT[g1]} t * y[f,g1,t] <= sum {f in F, t in AT[g2]} t * y[f,g2,t];
+
+# Symmetry breaking: interchangeable fields ordered by their occupied capacity
+# (unchanged by group permutations, so both orderings hold together)
+subject to field_symmetry {(f1,f2) in FIELD_SYMMETRY_PAIRS}:
+    sum {g in G, t in T} size_req[g] * x[f1,g,t] >= sum {g in G, t in T} size_req[g] * x[f2,g,t];
+
+# Alternatives: drop at least cut_min_changes starts of every earlier schedule
+subject to alternative_cut {c in ALTERNATIVE_CUTS}:
+    sum {(f,g,t) in CUT_STARTS[c]} y[f,g,t] <= card(CUT_STARTS[c]) - cut_min_changes[c];
+
 ###############################################################
-# ADJACENT DAY ACTIVITY HANDLING
+# INCOMPATIBLE GROUP PENALTIES (linearized)
 ###############################################################
 
-# Link day-level indicator to whether any activity starts that day
-subject to has_activity_day_sum {g in G, day in D}:
-    has_activity_day[g,day] <= sum {f in F, t in DT[day]} y[f,g,t];
+# The penalties are >= 0 and the objective is maximized, so each overlap settles
+# at max(0, a + b - 1) = a * b for binary a, b. Pairs/timeslots where the groups
+# can never meet have no variable.
+subject to same_time_overlap_lb {(g1,g2) in SAME_TIME_PAIRS, t in SAME_TIME_OVERLAP_T[g1,g2]}:
+    same_time_overlap[g1,g2,t] >= sum {f in F} x[f,g1,t] + sum {f in F} x[f,g2,t] - 1;
+
+subject to same_day_overlap_lb {(g1,g2) in INCOMPATIBLE_GROUPS_SAME_DAY, day in SAME_DAY_OVERLAP_D[g1,g2]}:
+    same_day_overlap[g1,g2,day] >= has_activity_day[g1,day] + has_activity_day[g2,day] - 1;
+
+# With n members at t, sum over k of max(0, n - k) = n(n-1)/2: one penalty per pair, as before
+subject to clique_excess_lb {c in SAME_TIME_CLIQUES, t in T, k in 1..clique_reach[c,t] - 1}:
+    clique_excess[c,t,k] >= sum {g in SAME_TIME_CLIQUE[c], f in F} x[f,g,t] - k;
+
+###############################################################
+# ADJACENT DAY ACTIVITY HANDLING
+###############################################################
 
-subject to has_activity_day_trigger {g in G, day in D, f in F, t in DT[day]}:
-    y[f,g,t] <= has_activity_day[g,day];
+# Day-level indicator equals the number of activity starts that day. As it is
+# binary this also allows max one activity per day (one row per group and day
+# instead of one per field and timeslot)
+subject to has_activity_day_link {g in G, day in D}:
+    has_activity_day[g,day] = sum {f in F, t in DT[day]} y[f,g,t];
 
 # Linearize: has_activity_adjacent_days = AND(has_activity_day[day_1], has_activity_day[day_2])
 subject to has_activity_adjacent_days_lb {g in G, (day_1,day_2) in ADJ_D}:
@@ -0,0 +1,114 @@
+"""
+Check that has_activity_day_link keeps the optima of the three rows it
+replaced (has_activity_day_sum, has_activity_day_trigger and
+one_activity_per_day) on synthetic clubs, and compare model size and time.
+
+Needs AMPL and SCIP (see README). Run from the repository root:
+
+    python -m benchmarks.day_link_benchmark --sizes 8x2 16x3 24x4 --time 120
+"""
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.symmetry_benchmark import build_payload
+from services.field_optimizer_service import MODEL_PATH, FieldOptimizerService
+from utils.field_optimizer import (
+    build_ampl_data,
+    convert_payload_to_input,
+    get_ampl_lifecycle,
+    load_ampl_data,
+    preprocess_existing_activities,
+)
+
+TOLERANCE = 1e-6
+
+DAY_LINK = """subject to has_activity_day_link {g in G, day in D}:
+    has_activity_day[g,day] = sum {f in F, t in DT[day]} y[f,g,t];
+"""
+
+# The formulation before has_activity_day_link
+LEGACY_DAY_LINK = """subject to one_activity_per_day {g in G, day in D}:
+    sum {t in DT[day], f in F} y[f,g,t] <= 1;
+
+subject to has_activity_day_sum {g in G, day in D}:
+    has_activity_day[g,day] <= sum {f in F, t in DT[day]} y[f,g,t];
+
+subject to has_activity_day_trigger {g in G, day in D, f in F, t in DT[day]}:
+    y[f,g,t] <= has_activity_day[g,day];
+"""
+
+
+def write_legacy_model(directory: str) -> str:
+    """Copy of the model with the legacy day link rows; returns its path."""
+    model = Path(MODEL_PATH).read_text()
+    if DAY_LINK not in model:
+        raise RuntimeError("has_activity_day_link not found in the model, update this benchmark")
+    path = Path(directory) / "field_optimizer_legacy.mod"
+    path.write_text(model.replace(DAY_LINK, LEGACY_DAY_LINK))
+    return str(path)
+
+
+def solve_model(model_path: str, ampl_data, time_limit: int) -> dict:
+    """Solve to optimality (within time_limit) and report size and time."""
+    ampl = FieldOptimizerService._create_ampl()
+    try:
+        ampl.read(model_path)
+        load_ampl_data(ampl, ampl_data)
+        ampl.option["scip_options"] = f"lim:time={time_limit} lim:gap=0"
+        ampl.solve()
+        return {
+            "result": ampl.get_value("solve_result"),
+            "objective": ampl.obj["preference_score"].value(),
+            "rows": int(ampl.get_value("_sncons")),
+            "columns": int(ampl.get_value("_snvars")),
+            "seconds": float(ampl.get_value("_solve_elapsed_time")),
+        }
+    finally:
+        get_ampl_lifecycle().close(ampl)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=["8x2", "16x3", "24x4"],
+                        help="teams x stadiums of each synthetic club")
+    parser.add_argument("--time", type=int, default=120, help="time limit per solve in seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as directory:
+        models = {"legacy": write_legacy_model(directory), "link": MODEL_PATH}
+        print(f"{'club':<8}{'model':<8}{'result':>10}{'objective':>14}"
+              f"{'rows':>8}{'columns':>9}{'seconds':>9}")
+        for size in args.sizes:
+            team_count, stadium_count = (int(n) for n in size.split("x"))
+            payload = build_payload(team_count, stadium_count, break_symmetries=True)
+            converted_payload = convert_payload_to_input(payload)
+            preprocessed = preprocess_existing_activities(
+                existing_activities=converted_payload.existing_activities,
+                field_optimizer_input=converted_payload.field_optimizer_input,
+                timeslot_to_index_map=converted_payload.timeslot_to_index_map
+            )
+            ampl_data = build_ampl_data(converted_payload, payload, preprocessed)
+
+            runs = {name: solve_model(path, ampl_data, args.time) for name, path in models.items()}
+            for name, run in runs.items():
+                print(f"{size:<8}{name:<8}{run['result']:>10}{run['objective']:>14.4f}"
+                      f"{run['rows']:>8}{run['columns']:>9}{run['seconds']:>9.2f}")
+
+            # Optima must agree; a run stopped by the time limit proves nothing
+            if all(run["result"] == "solved" for run in runs.values()):
+                legacy, link = runs["legacy"]["objective"], runs["link"]["objective"]
+                if abs(legacy - link) > TOLERANCE * max(1, abs(legacy)):
+                    mismatches += 1
+                    print(f"{size:<8}objective differs: {legacy} vs {link}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
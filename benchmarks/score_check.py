@@ -0,0 +1,53 @@
+"""
+Check solver-free scoring against the solver's objective: solve synthetic
+clubs, score the returned schedules and compare with preference_score.
+
+Needs AMPL and SCIP (see README). Run from the repository root:
+
+    python -m benchmarks.score_check --sizes 8x2 16x3 24x4
+"""
+import argparse
+import logging
+import sys
+import time
+
+from benchmarks.symmetry_benchmark import build_payload
+from models.field_optimizer.schedule_payload import SchedulePayload
+from services.field_optimizer_service import FieldOptimizerService
+
+TOLERANCE = 1e-6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=["8x2", "16x3", "24x4"],
+                        help="teams x stadiums of each synthetic club")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    mismatches = 0
+    print(f"{'club':<8}{'solver':>12}{'scored':>12}{'score ms':>10}")
+    for size in args.sizes:
+        team_count, stadium_count = (int(n) for n in size.split("x"))
+        payload = build_payload(team_count, stadium_count, break_symmetries=True)
+        result = FieldOptimizerService.solve(payload)
+        if result.preference_score is None:
+            print(f"{size:<8}{result.result:>12}")
+            continue
+
+        started = time.perf_counter()
+        score = FieldOptimizerService.score(
+            SchedulePayload(payload=payload, activities=result.activities))
+        milliseconds = (time.perf_counter() - started) * 1000
+
+        if abs(score.preference_score - result.preference_score) > TOLERANCE * max(1, abs(result.preference_score)):
+            mismatches += 1
+        print(f"{size:<8}{result.preference_score:>12.4f}{score.preference_score:>12.4f}"
+              f"{milliseconds:>10.1f}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare solve time and gap with and without symmetry breaking on synthetic
+clubs with batches of identical teams and identical stadiums.
+
+Needs AMPL and SCIP (see README). Run from the repository root:
+
+    python -m benchmarks.symmetry_benchmark --teams 24 --stadiums 4
+"""
+import argparse
+import logging
+import time
+
+from models.field_optimizer.field_optimizer_payload import (
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from services.field_optimizer_service import FieldOptimizerService
+
+# Teams come in batches sharing every parameter, as in a club with several
+# teams per age group
+BATCH_SIZE = 4
+BATCH_WINDOWS = [
+    ("16:00", "19:00", [0, 1, 2, 3]),
+    ("17:00", "21:00", [0, 2, 4]),
+    ("18:00", "22:00", [1, 3]),
+]
+
+
+def build_payload(team_count: int, stadium_count: int, break_symmetries: bool) -> FieldOptimizerPayload:
+    teams = []
+    for i in range(team_count):
+        batch = i // BATCH_SIZE
+        start_time, end_time, day_indexes = BATCH_WINDOWS[batch % len(BATCH_WINDOWS)]
+        teams.append(Team(
+            id=f"team-{i}",
+            name=f"Team {i}",
+            min_number_of_activities=2,
+            max_number_of_activities=3,
+            time_range=TimeRange(start_time=start_time, end_time=end_time, day_indexes=day_indexes),
+            duration=6,
+            size_required=8 if batch % 2 else 16,
+            priority=1 + batch % 3,
+            is_included=True,
+            preferred_stadium_ids=[],
+        ))
+
+    stadiums = [
+        Stadium(id=f"stadium-{j}", name=f"Stadium {j}", size=16, unavailable_start_times=[])
+        for j in range(stadium_count)
+    ]
+
+    return FieldOptimizerPayload(
+        stadiums=stadiums,
+        teams=teams,
+        existing_team_activities=[],
+        start_time="16:00",
+        end_time="22:00",
+        break_symmetries=break_symmetries,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=24)
+    parser.add_argument("--stadiums", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print(f"{'symmetry':<10}{'run':>4}{'result':>10}{'seconds':>10}{'gap %':>8}{'score':>12}")
+    for break_symmetries in (False, True):
+        for run in range(1, args.repeats + 1):
+            payload = build_payload(args.teams, args.stadiums, break_symmetries)
+            started = time.perf_counter()
+            result = FieldOptimizerService.solve(payload)
+            seconds = time.perf_counter() - started
+
+            gap = result.iterations[-1].gap_percent if result.iterations else None
+            print(f"{'on' if break_symmetries else 'off':<10}{run:>4}{result.result:>10}"
+                  f"{seconds:>10.2f}{gap if gap is not None else '-':>8}"
+                  f"{result.preference_score if result.preference_score is not None else '-':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,62 @@
 import logging
-import os
+import time
+from contextlib import asynccontextmanager
+
+_import_start = time.perf_counter()
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
-from amplpy import modules
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from auth import verify_token
 from models.example.example_input import ExampleInput
+from models.field_optimizer.compact_field_optimizer_result import CompactFieldOptimizerResult
 from models.field_optimizer.field_optimizer_result import FieldOptimizerResult
 from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from models.field_optimizer.progressive_result import ProgressiveResult
+from models.field_optimizer.schedule_payload import SchedulePayload
+from models.field_optimizer.schedule_score import ScheduleScore
+from models.field_optimizer.schedule_validation import ScheduleValidation
 from services.example_service import ExampleService
 from services.field_optimizer_service import FieldOptimizerService
+from services.warmup_service import WarmupService
+from utils.field_optimizer import (
+    get_ampl_lifecycle,
+    get_ampl_session_pool,
+    get_solve_scheduler,
+)
+from utils.serialization import (
+    DecodeRequestMiddleware,
+    convert_result_to_compact,
+    encode_response,
+)
 
 logger = logging.getLogger(__name__)
+# amplpy is imported lazily; run `python -X importtime -c "import main"`
+# to see what the remaining imports cost
+logger.info("Imports took %.2f ms", (time.perf_counter() - _import_start) * 1000)
 
 # Load environment variables
 load_dotenv()
 
-# Initialize FastAPI app
-app = FastAPI()
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # License activation, cache priming and a warm-up solve run in the
+    # background; /ready reports when they are done
+    WarmupService.start_in_background()
+    yield
 
-# Activate license when the app starts
-def activate_ampl_license():
-    """Activate AMPL license using environment variable"""
-    license_uuid = os.getenv("AMPL_LICENSE_UUID")
-    if license_uuid:
-        try:
-            modules.activate(license_uuid)
-            logger.info("AMPL license activated successfully: %s", license_uuid)
-        except Exception as e:
-            logger.error("Failed to activate AMPL license: %s", e)
-    else:
-        logger.warning("No AMPL_LICENSE_UUID found in environment variables")
 
+# Initialize FastAPI app
+app = FastAPI(lifespan=lifespan)
 
-activate_ampl_license()
+# Accept msgpack and gzip request bodies in addition to JSON
+app.add_middleware(DecodeRequestMiddleware)
 
 
 @app.get("/")
@@ -53,6 +69,27 @@ async def root():
     }
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 once the startup warm-up finished, also when it
+    ended degraded (see the error), 503 before."""
+    status = WarmupService.get_status()
+    finished = status["status"] in ("ready", "degraded")
+    return JSONResponse(status, status_code=200 if finished else 503)
+
+
+@app.get("/ampl/stats")
+async def ampl_stats(_: str = Depends(verify_token)):
+    """AMPL instances of this worker: created, closed, open and leaked
+    (garbage collected without close), idle sessions in the pool and
+    running and waiting solves per lane."""
+    return {
+        "lifecycle": get_ampl_lifecycle().stats(),
+        "sessions": get_ampl_session_pool().stats(),
+        "lanes": get_solve_scheduler().stats(),
+    }
+
+
 @app.post("/solve-a-b")
 async def solve_a_b(payload: ExampleInput, _: str = Depends(verify_token)):
     result = ExampleService.solve_a_b(payload)
@@ -65,23 +102,110 @@ async def solve_example(payload: ExampleInput, _: str = Depends(verify_token)):
     return result
 
 
-@app.post("/solve-field-optimizer")
+@app.post(
+    "/solve-field-optimizer",
+    response_model=FieldOptimizerResult | CompactFieldOptimizerResult,
+)
 async def solve_field_optimizer(
-    payload: FieldOptimizerPayload, _: str = Depends(verify_token)
-) -> FieldOptimizerResult:
-    result = FieldOptimizerService.solve(payload)
-    return result
+    payload: FieldOptimizerPayload,
+    request: Request,
+    compact: bool = False,
+    _: str = Depends(verify_token),
+):
+    """Solve the field optimizer. `compact=true` returns dictionary-encoded
+    teams/stadiums with column-wise activities; `Accept: application/msgpack`
+    returns msgpack, and large bodies are gzipped when accepted. Waits for
+    its lane on the event loop; only the admitted solve runs in the thread
+    pool."""
+    result = await FieldOptimizerService.solve_async(payload)
+    if compact:
+        return encode_response(convert_result_to_compact(result), request)
+    return encode_response(result, request)
 
 
 @app.post("/solve-field-optimizer-stream")
 async def solve_field_optimizer_stream(
-    payload: FieldOptimizerPayload, _: str = Depends(verify_token)
+    payload: FieldOptimizerPayload,
+    compact: bool = False,
+    _: str = Depends(verify_token),
+):
+    return StreamingResponse(
+        FieldOptimizerService.solve_stream(payload, compact=compact),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@app.post("/solve-field-optimizer-progressive", response_model=ProgressiveResult)
+async def solve_field_optimizer_progressive(
+    payload: FieldOptimizerPayload,
+    compact: bool = False,
+    _: str = Depends(verify_token),
+):
+    """Return a first schedule after a few seconds as version 1 of a result
+    and keep improving it in the background. Poll
+    /field-optimizer/results/{result_id} or subscribe to its events for
+    later versions."""
+    result = await FieldOptimizerService.solve_progressive(payload)
+    if compact and result.result is not None:
+        return result.model_copy(update={"result": convert_result_to_compact(result.result)})
+    return result
+
+
+@app.get("/field-optimizer/results/{result_id}", response_model=ProgressiveResult)
+async def get_field_optimizer_result(
+    result_id: str,
+    compact: bool = False,
+    _: str = Depends(verify_token),
+):
+    """Latest version of a progressive result."""
+    result = FieldOptimizerService.get_progressive_result(result_id, compact=compact)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Result '{result_id}' not found")
+    return result
+
+
+@app.get("/field-optimizer/results/{result_id}/events")
+async def stream_field_optimizer_result(
+    result_id: str,
+    compact: bool = False,
+    last_event_id: str | None = Header(default=None),
+    _: str = Depends(verify_token),
 ):
+    """SSE stream of the versions of a progressive result; reconnecting with
+    Last-Event-ID resumes after that version."""
+    resume_after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
     return StreamingResponse(
-        FieldOptimizerService.solve_stream(payload),
+        FieldOptimizerService.progressive_events(result_id, resume_after, compact=compact),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
         },
     )
+
+
+@app.post("/field-optimizer/score", response_model=ScheduleScore)
+async def score_field_optimizer_schedule(
+    schedule_payload: SchedulePayload,
+    _: str = Depends(verify_token),
+):
+    """Score a concrete schedule (e.g. after a manual edit) with the
+    optimizer's objective, broken down by term, without solving."""
+    try:
+        return FieldOptimizerService.score(schedule_payload)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@app.post("/field-optimizer/validate", response_model=ScheduleValidation)
+async def validate_field_optimizer_schedule(
+    schedule_payload: SchedulePayload,
+    _: str = Depends(verify_token),
+):
+    """Check a concrete schedule against capacity, closures, allowed starts,
+    durations and activity limits; returns every violation."""
+    return FieldOptimizerService.validate(schedule_payload)
@@ -0,0 +1,41 @@
+from typing import Literal
+from pydantic import BaseModel
+from models.field_optimizer.field_optimizer_result import (
+    ActivitiesNotGenerated,
+    CapacityAnalysis,
+    IterationDetail,
+    Stadium,
+    Team,
+)
+
+
+class CompactActivities(BaseModel):
+    # Column i of every list describes activity i; stadium and team are
+    # positions in CompactFieldOptimizerResult.stadiums / .teams
+    stadium: list[int]
+    team: list[int]
+    index_week_day: list[int]
+    start_time: list[str]
+    end_time: list[str]
+    size: list[int]
+
+
+class CompactAlternativeSchedule(BaseModel):
+    rank: int
+    preference_score: float | None
+    activities: CompactActivities  # positions in the result's stadiums / teams
+    activities_not_generated: list[ActivitiesNotGenerated] | None = None
+
+
+class CompactFieldOptimizerResult(BaseModel):
+    result: Literal["solved", "infeasible", "no_objective_value", "failure", "insufficient_capacity"]
+    duration_ms: float
+    preference_score: float | None
+    stadiums: list[Stadium]
+    teams: list[Team]
+    activities: CompactActivities
+    activities_not_generated: list[ActivitiesNotGenerated] | None = None
+    error_message: str | None = None
+    iterations: list[IterationDetail] | None = None
+    alternatives: list[CompactAlternativeSchedule] | None = None
+    capacity_analysis: CapacityAnalysis | None = None
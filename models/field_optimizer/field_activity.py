@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class FieldActivity(BaseModel):
+@dataclass(slots=True)
+class FieldActivity:
     field: str
     group: str
     start_timeslot: int
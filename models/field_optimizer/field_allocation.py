@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class FieldAllocation(BaseModel):
+@dataclass(slots=True)
+class FieldAllocation:
     field: str
     group: str
     timeslot_id: int
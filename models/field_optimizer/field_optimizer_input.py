@@ -1,14 +1,16 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class Field(BaseModel):
+@dataclass(slots=True)
+class Field:
     id: str
     name: str
     size: int
     unavailable_start_times: list[int]
 
 
-class Group(BaseModel):
+@dataclass(slots=True)
+class Group:
     id: str
     name: str
     minimum_number_of_activities: int
@@ -22,9 +24,12 @@ class Group(BaseModel):
     priority: int
     preferred_field_ids: list[str]  # Changed from preferred_field_names
     p_early_starts: int
+    parent_id: str | None = None  # Set for auto-subgroups of predefined activities
 
 
-class FieldOptimizerInput(BaseModel):
+@dataclass(slots=True)
+class FieldOptimizerInput:
     fields: list[Field]
     groups: list[Group]
-    time_slots: list[list[int]]
+    time_slots: list[list[int]]  # timeslot indexes per day in the model
+    week_day_indexes: list[int]  # week day index (0 = Monday) of each time_slots entry
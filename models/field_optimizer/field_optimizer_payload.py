@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import Literal
+from pydantic import BaseModel, Field
+
+# Most alternative schedules one request may ask for
+MAX_ALTERNATIVES = 5
 
 
 class Stadium(BaseModel):
@@ -49,3 +53,24 @@ class FieldOptimizerPayload(BaseModel):
     incompatible_groups: list[list[str]] | None = None
     incompatible_groups_same_day: list[list[str]] | None = None
     extended_time: bool = False
+    # Opt-in: keep the AMPL model of this key (e.g. club id) alive between
+    # solves and only send what changed
+    session_key: str | None = None
+    # Solve on a 30/60-minute grid when every time in the payload is on it
+    auto_time_grid: bool = True
+    # Order interchangeable teams and stadiums to prune equivalent solutions
+    break_symmetries: bool = True
+    # Opt-in: solve identical stadiums as one pool and pick concrete stadiums
+    # afterwards (falls back to the full model when they cannot be assigned)
+    pool_identical_stadiums: bool = False
+    # Number of alternative schedules to return after the main solve, each
+    # with a share of its starts different from every earlier one
+    alternatives: int = Field(default=0, ge=0, le=MAX_ALTERNATIVES)
+    # What to do when the capacity pre-analysis proves that some team
+    # minimum cannot be met: solve as usual, solve with a reduced time
+    # budget, or return insufficient_capacity without solving
+    on_certain_shortfall: Literal["solve", "reduce", "fail"] = "solve"
+    # Scheduling lane; by default extended solves run as batch, streams as
+    # interactive and other solves as standard. A lane of higher priority
+    # than the default is ignored
+    lane: Literal["interactive", "standard", "batch"] | None = None
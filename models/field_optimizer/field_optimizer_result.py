@@ -38,11 +38,46 @@ class IterationDetail(BaseModel):
     abs_gap: float | None
 
 
+class AlternativeSchedule(BaseModel):
+    rank: int  # 1 = highest preference_score among the alternatives
+    preference_score: float | None
+    activities: list[Activity]
+    activities_not_generated: list[ActivitiesNotGenerated] | None = None
+
+
+class DayCapacity(BaseModel):
+    # Capacities in size x minutes
+    index_week_day: int
+    supply: float  # open stadium time, by stadium in stadiums
+    max_demand: float  # one activity of every team that can start this day
+    stadiums: dict[str, float]
+
+
+class TeamCapacity(BaseModel):
+    team: Team
+    valid_start_days: int  # days with a start that fits an open stadium
+    max_activities: int  # upper bound on achievable activities
+    missing_activities: int  # certain shortfall against the minimum
+
+
+class CapacityAnalysis(BaseModel):
+    # Solver-free bounds computed before the solve; a positive
+    # min_total_shortfall proves that some minimum cannot be met
+    required_demand: float  # minimum activities in size x minutes, where reachable
+    achievable_supply: float  # sum over days of min(supply, max_demand)
+    max_activities: int
+    min_total_shortfall: int
+    days: list[DayCapacity]
+    teams: list[TeamCapacity]  # teams that cannot reach their minimum
+
+
 class FieldOptimizerResult(BaseModel):
-    result: Literal["solved", "infeasible", "no_objective_value", "failure"]
+    result: Literal["solved", "infeasible", "no_objective_value", "failure", "insufficient_capacity"]
     duration_ms: float
     preference_score: float | None
     activities: list[Activity]
     activities_not_generated: list[ActivitiesNotGenerated] | None = None
     error_message: str | None = None
     iterations: list[IterationDetail] | None = None
+    alternatives: list[AlternativeSchedule] | None = None
+    capacity_analysis: CapacityAnalysis | None = None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from models.field_optimizer.compact_field_optimizer_result import CompactFieldOptimizerResult
+from models.field_optimizer.field_optimizer_result import FieldOptimizerResult
+
+
+class ProgressiveResult(BaseModel):
+    result_id: str
+    version: int  # number of published versions, 0 before the first
+    done: bool  # no further versions will be published
+    result: FieldOptimizerResult | CompactFieldOptimizerResult | None  # latest version
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from models.field_optimizer.field_optimizer_result import Activity
+
+
+class SchedulePayload(BaseModel):
+    """A request together with a concrete schedule, for scoring or validation"""
+    payload: FieldOptimizerPayload
+    # The schedule as in FieldOptimizerResult.activities; predefined
+    # activities are taken from payload.existing_team_activities
+    activities: list[Activity]
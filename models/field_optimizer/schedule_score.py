@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from models.field_optimizer.field_optimizer_result import ActivitiesNotGenerated
+
+
+class ScoreBreakdown(BaseModel):
+    # Contribution of each objective term, penalties negative
+    activity: float
+    preferred_start: float
+    start_time: float
+    field_preference: float
+    late_start: float
+    adjacent_days: float
+    incompatible_same_time: float
+    incompatible_same_day: float
+    shortfall: float
+
+
+class ScheduleScore(BaseModel):
+    duration_ms: float
+    preference_score: float
+    breakdown: ScoreBreakdown
+    activities_not_generated: list[ActivitiesNotGenerated] | None = None
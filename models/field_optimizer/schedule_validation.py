@@ -0,0 +1,30 @@
+from typing import Literal
+from pydantic import BaseModel
+
+ViolationType = Literal[
+    "unknown_reference",  # team or stadium not in the payload
+    "outside_window",  # activity not inside the planning window
+    "capacity",  # field size exceeded at a timeslot
+    "unavailable",  # field closed at an occupied timeslot
+    "start_not_allowed",  # start outside the team's time ranges
+    "duration",  # length differs from the team's duration
+    "late_start",  # activity would run past the end of the day
+    "one_per_day",  # more than one activity of a team on a day
+    "max_activities",  # more activities than the team's maximum
+]
+
+
+class ScheduleViolation(BaseModel):
+    type: ViolationType
+    message: str
+    team_id: str | None = None
+    stadium_id: str | None = None
+    index_week_day: int | None = None
+    # Positions in SchedulePayload.activities; empty for predefined activities
+    activity_indexes: list[int] = []
+
+
+class ScheduleValidation(BaseModel):
+    duration_ms: float
+    valid: bool
+    violations: list[ScheduleViolation]
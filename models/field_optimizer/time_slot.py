@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class TimeSlot(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TimeSlot:
     id: int
     time: str
+    minutes: int  # minute of day, parsed once from time
     duration_minutes: int
     week_day_index: int
@@ -1,7 +1,7 @@
 from datetime import datetime
-from amplpy import AMPL
 from models.example.example_input import ExampleInput
 from models.example.example_output import ExampleOutput
+from utils.field_optimizer import get_ampl_lifecycle
 
 
 class ExampleService:
@@ -9,10 +9,13 @@ class ExampleService:
     @staticmethod
     def solve_a_b(payload: ExampleInput) -> ExampleOutput:
         start_time = datetime.now()
+        ampl = None
 
         try:
+            from amplpy import AMPL
+
             # Initialize AMPL (no need to specify solver)
-            ampl = AMPL()
+            ampl = get_ampl_lifecycle().track(AMPL())
 
             # Load the model file
             ampl.read("./ampl/a_b.mod")
@@ -54,14 +57,20 @@ class ExampleService:
                 "result": "FAILURE",
                 "error": str(e)
             }
+        finally:
+            if ampl is not None:
+                get_ampl_lifecycle().close(ampl)
 
     @staticmethod
     def solve_example(payload: ExampleInput) -> ExampleOutput:
         start_time = datetime.now()
+        ampl = None
 
         try:
+            from amplpy import AMPL
+
             # Initialize AMPL with SCIP solver
-            ampl = AMPL()
+            ampl = get_ampl_lifecycle().track(AMPL())
             ampl.option["solver"] = "scip"
 
             # Load the model file
@@ -110,3 +119,6 @@ class ExampleService:
                 "result": "FAILURE",
                 "error": str(e)
             }
+        finally:
+            if ampl is not None:
+                get_ampl_lifecycle().close(ampl)
@@ -1,35 +1,69 @@
-import json
 import logging
 import re
+import threading
 import traceback
 from datetime import datetime
-from typing import Generator
-from amplpy import AMPL, OutputHandler
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Generator
+import anyio
+import orjson
 
-
-class SilentOutputHandler(OutputHandler):
-    def output(self, kind, msg):
-        pass
-
-
-from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from models.field_optimizer.field_optimizer_payload import MAX_ALTERNATIVES, FieldOptimizerPayload
 from models.field_optimizer.field_optimizer_result import (
     FieldOptimizerResult,
+    Activity,
     ActivitiesNotGenerated,
+    AlternativeSchedule,
+    CapacityAnalysis,
     IterationDetail,
     Team,
 )
 from models.field_optimizer.field_optimizer_input import Group
+from models.field_optimizer.progressive_result import ProgressiveResult
+from models.field_optimizer.schedule_payload import SchedulePayload
+from models.field_optimizer.schedule_score import ScheduleScore, ScoreBreakdown
+from models.field_optimizer.schedule_validation import ScheduleValidation
 from utils.field_optimizer import (
+    AmplSession,
+    AmplSolution,
+    CachedProblem,
+    analyze_capacity,
+    assign_pooled_activities,
+    build_alternative_cuts,
+    build_ampl_data,
+    estimate_session_bytes,
+    get_ampl_session_pool,
     convert_payload_to_input,
-    convert_ampl_x_values_to_allocations,
     convert_field_activities_to_result,
-    convert_field_allocations_to_activities,
-    build_aat_map,
+    convert_result_activities_to_starts,
+    extract_ampl_solution,
+    extract_variable_values_solution,
+    fingerprint_ampl_data,
+    get_ampl_lifecycle,
+    get_result_store,
+    get_solve_scheduler,
+    get_solver_memory_limit_mb,
+    get_problem_cache_dir,
+    load_ampl_data,
+    lookup_cached_problem,
+    pool_identical_fields,
+    preprocess_existing_activities,
+    requires_model_rebuild,
+    score_schedule,
+    validate_schedule,
+    update_ampl_data,
+    write_problem_to_cache,
 )
+from utils.field_optimizer.build_ampl_data import AmplData
+from utils.field_optimizer.solve_scheduler import LANES
+from utils.serialization import convert_result_to_compact
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
 
 logger = logging.getLogger(__name__)
 
+MODEL_PATH = "./ampl/field_optimizer.mod"
+
 SOLVE_ITERATIONS = [
     {"time": 15, "gap": 0},
     {"time": 90, "gap": 0.05, "pre_settings": 2},
@@ -39,41 +73,45 @@ SOLVE_ITERATIONS_EXTENDED = [
     {"time": 260, "gap": 0.1, "pre_settings": 2},
 ]
 
+# Budget when the capacity pre-analysis proves a shortfall and the payload
+# asks for on_certain_shortfall="reduce"
+SHORTFALL_ITERATIONS = [
+    {"time": 30, "gap": 0.05, "pre_settings": 2},
+]
+
+# First iteration of a progressive solve, meant to return an incumbent within
+# seconds; the regular iteration schedule then continues in the background
+PROGRESSIVE_QUICK_ITERATION = {"time": 3, "gap": 0.05}
+
+# Seconds between keep-alive comments of a progressive event stream
+PROGRESSIVE_KEEPALIVE_SECONDS = 15
+
+# Seconds between queued events while a streamed solve waits for its lane
+QUEUE_UPDATE_SECONDS = 5
+
+# Each alternative is a short re-solve of the loaded model with one more
+# diversity cut; its starts must differ from every earlier schedule by
+# at least ALTERNATIVE_MIN_CHANGE_SHARE of theirs
+ALTERNATIVE_ITERATION = {"time": 15, "gap": 0.05}
+ALTERNATIVE_MIN_CHANGE_SHARE = 0.1
+
 
 def _extract_shortfall_info(
-    ampl: AMPL,
+    solution: AmplSolution,
     groups: list[Group],
 ) -> list[ActivitiesNotGenerated]:
-    """Read min_activity_shortfall from the solved AMPL model.
+    """Map min_activity_shortfall of the solved model to result entries.
     Returns groups with nonzero shortfall."""
     result = []
 
-    activity_counts: dict[str, int] = {}
-    try:
-        y_values = ampl.get_variable("y").get_values().to_dict()
-        for (f, g, t), value in y_values.items():
-            if value > 0.5:
-                activity_counts[g] = activity_counts.get(g, 0) + 1
-    except Exception:
-        pass
-
-    shortfall_values: dict = {}
-    try:
-        shortfall_values = ampl.get_variable(
-            "min_activity_shortfall").get_values().to_dict()
-    except Exception:
-        pass
-
     for group in groups:
         if group.id.startswith("__busyblock_"):
             continue
-        shortfall_value = shortfall_values.get(
-            group.id, shortfall_values.get((group.id,), 0)
-        )
+        shortfall_value = solution.shortfalls.get(group.id, 0)
         if shortfall_value and shortfall_value > 1e-6:
             result.append(ActivitiesNotGenerated(
                 team=Team(id=group.id, name=group.name),
-                activities=activity_counts.get(group.id, 0),
+                activities=solution.activity_counts.get(group.id, 0),
                 missing_activities=float(shortfall_value),
             ))
 
@@ -84,188 +122,66 @@ class FieldOptimizerService:
 
     @staticmethod
     def solve(payload: FieldOptimizerPayload) -> FieldOptimizerResult:
-        start_time = datetime.now()
-        converted_payload = convert_payload_to_input(payload)
-
-        field_optimizer_input = converted_payload.field_optimizer_input
-        time_slots_in_range = converted_payload.time_slots_in_range
-        index_to_timeslot_map = converted_payload.index_to_timeslot_map
-        timeslot_to_index_map = converted_payload.timeslot_to_index_map
-        time_slot_duration_minutes = converted_payload.time_slot_duration_minutes
-        existing_activities = converted_payload.existing_activities
-        auto_incompatible_same_day = converted_payload.auto_incompatible_same_day
-        auto_incompatible_same_time = converted_payload.auto_incompatible_same_time
-
+        """Solve once the request's lane admits it (blocks while queued)."""
+        scheduler = get_solve_scheduler()
+        ticket = scheduler.enqueue(
+            FieldOptimizerService._lane(payload, streaming=False),
+            FieldOptimizerService._expected_seconds(payload))
         try:
-            # Initialize AMPL with SCIP solver
-            ampl = AMPL()
-            ampl.set_output_handler(SilentOutputHandler())
-            ampl.option["solver"] = "scip"
-
-            # Load the model file
-            ampl.read("./ampl/field_optimizer.mod")
-
-            # ------
-            # Set data from JSON payload instead of reading .dat file
-            # ------
-
-            # Set basic sets
-            ampl.set["F"] = [
-                field.id for field in field_optimizer_input.fields]
-            ampl.set["G"] = [
-                group.id for group in field_optimizer_input.groups]
-
-            # Flatten all time slots for set T
-            all_timeslots = []
-            for day_slots in field_optimizer_input.time_slots:
-                all_timeslots.extend(day_slots)
-            ampl.set["T"] = all_timeslots
-
-            # Set up days (explicitly set D)
-            days = list(range(1, len(field_optimizer_input.time_slots) + 1))
-            ampl.set["D"] = days
-
-            # Set timeslots for each day (DT)
-            for day_idx, day_slots in enumerate(field_optimizer_input.time_slots, start=1):
-                ampl.set["DT"][day_idx] = day_slots
-
-            # Get the first timeslot for each day
-            day_start_timeslots: list[int] = [
-                day_slots[0]
-                for day_slots in field_optimizer_input.time_slots
-            ]
-
-            # Set start timeslots for each day (ST)
-            ampl.set["ST"] = day_start_timeslots
-
-            # --- Handle existing activities FIRST so we can expand AT[g] ---
-            aat_map, processed_activities = build_aat_map(
-                existing_activities=existing_activities,
-                field_optimizer_input=field_optimizer_input,
-                timeslot_to_index_map=timeslot_to_index_map
-            )
+            scheduler.wait(ticket)
+            return FieldOptimizerService._solve(payload)
+        finally:
+            scheduler.release(ticket)
 
-            # Include predefined activities' start times in AT[g] to avoid
-            # infeasibility: their y-variables are fixed to 1, but the
-            # activity_can_not_start constraint forces y=0 for times not
-            # in AT[g]. This does NOT allow the solver to place new
-            # activities here — only prevents conflict with the fixed values.
-            for activity in processed_activities:
-                group = next(
-                    (g for g in field_optimizer_input.groups
-                     if g.id == activity.group_id), None
-                )
-                if group and activity.start_index not in group.possible_start_times:
-                    group.possible_start_times.append(activity.start_index)
-                    group.possible_start_times.sort()
-
-            # Set available starting times for each group (AT)
-            for group in field_optimizer_input.groups:
-                ampl.set["AT"][group.id] = group.possible_start_times
-
-            # Set preferred starting times for each group (PT)
-            for group in field_optimizer_input.groups:
-                ampl.set["PT"][group.id] = group.preferred_start_times
-
-            # Set preferred fields for each group (PF)
-            for group in field_optimizer_input.groups:
-                ampl.set["PF"][group.id] = group.preferred_field_ids
-
-            # Set group parameters
-            for group in field_optimizer_input.groups:
-                ampl.param["d"][group.id] = group.duration
-                ampl.param["n_min"][group.id] = group.minimum_number_of_activities
-                ampl.param["n_max"][group.id] = group.maximum_number_of_activities
-                ampl.param["size_req"][group.id] = group.size_required
-                ampl.param["prio"][group.id] = group.priority
-                ampl.param["p_st1"][group.id] = group.preferred_start_time_activity_1
-                ampl.param["p_st2"][group.id] = group.preferred_start_time_activity_2
-                ampl.param["p_early_starts"][group.id] = group.p_early_starts
-
-            # Set field parameters
-            for field in field_optimizer_input.fields:
-                ampl.param["size"][field.id] = field.size
-
-            # Set incompatible groups (teams that should not have simultaneous activities)
-            # Include auto-generated pairs from predefined activity subgroups
-            incomp_same_time = list(payload.incompatible_groups or [])
-            incomp_same_time.extend(auto_incompatible_same_time)
-            ampl.set["INCOMPATIBLE_GROUPS_SAME_TIME"] = incomp_same_time
-
-            # Set incompatible groups same day (subgroups from same team)
-            # Include auto-generated pairs from predefined activity subgroups
-            incomp_same_day = list(payload.incompatible_groups_same_day or [])
-            incomp_same_day.extend(auto_incompatible_same_day)
-            ampl.set["INCOMPATIBLE_GROUPS_SAME_DAY"] = incomp_same_day
-
-            # Set AAT (Already Assigned Timeslots) for existing activities
-            for field in field_optimizer_input.fields:
-                for group in field_optimizer_input.groups:
-                    key = (field.id, group.id)
-                    if key in aat_map:
-                        ampl.set["AAT"][field.id, group.id] = aat_map[key]
-                    else:
-                        ampl.set["AAT"][field.id, group.id] = []
-
-            # Fix x and y variables for existing activities
-            for activity in processed_activities:
-                try:
-                    ampl.var["y"][activity.field_id,
-                                  activity.group_id, activity.start_index].fix(1)
-                except Exception as e:
-                    logger.error("Could not fix y variable for %s: %s", activity.group_id, e)
-                    continue
+    @staticmethod
+    async def solve_async(payload: FieldOptimizerPayload) -> FieldOptimizerResult:
+        """Like solve, for the API: the request waits for its lane without
+        holding a thread pool worker."""
+        return await FieldOptimizerService._run_when_admitted(
+            FieldOptimizerService._lane(payload, streaming=False),
+            FieldOptimizerService._expected_seconds(payload),
+            FieldOptimizerService._solve, payload)
 
-                for idx in activity.timeslot_indexes:
-                    try:
-                        ampl.var["x"][activity.field_id,
-                                      activity.group_id, idx].fix(1)
-                    except Exception as e:
-                        logger.error("Could not fix x variable for %s at index %s: %s", activity.group_id, idx, e)
+    @staticmethod
+    async def _run_when_admitted(lane: str, expected_seconds: float, function: Callable, *args):
+        """Queue in lane, wait for admission on the event loop and only then
+        run function in a worker thread. Queued requests hold no thread, so
+        waiting standard and batch solves cannot take every worker from
+        interactive ones. The ticket is released when function returns or
+        the request is cancelled while queued."""
+        scheduler = get_solve_scheduler()
+        ticket = scheduler.enqueue(lane, expected_seconds)
+        try:
+            await scheduler.wait_async(ticket)
+            return await anyio.to_thread.run_sync(function, *args)
+        finally:
+            scheduler.release(ticket)
 
-            # Set unavailable times for each field (UT)
-            for field in field_optimizer_input.fields:
-                ampl.set["UT"][field.id] = field.unavailable_start_times
+    @staticmethod
+    def _solve(payload: FieldOptimizerPayload) -> FieldOptimizerResult:
+        start_time = datetime.now()
+        ampl = None
+        reusable = False
 
-            logger.info("Model: %d fields, %d groups, %d fixed activities, %d timeslots",
-                         len(field_optimizer_input.fields), len(field_optimizer_input.groups),
-                         len(processed_activities), len(all_timeslots))
+        try:
+            ampl, converted_payload, processed_activities = \
+                FieldOptimizerService._setup_ampl(payload)
+            if ampl is None:
+                return FieldOptimizerService._insufficient_capacity_result(
+                    converted_payload.capacity_analysis, start_time)
 
             solve_result = None
             preference_score_value = None
             iteration_details = []
-            iterations_config = SOLVE_ITERATIONS_EXTENDED if payload.extended_time else SOLVE_ITERATIONS
+            iterations_config = FieldOptimizerService._iterations_config(
+                payload, converted_payload.capacity_analysis)
             for i, iteration in enumerate(iterations_config):
-                scip_opts = f"lim:time={iteration['time']} lim:gap={iteration['gap']}"
-                if "absgap" in iteration:
-                    scip_opts += f" lim:absgap={iteration['absgap']}"
-                if "pre_settings" in iteration:
-                    scip_opts += f" pre:settings={iteration['pre_settings']}"
-                ampl.option["scip_options"] = scip_opts
-                ampl.solve()
-
-                solve_result = ampl.get_value("solve_result")
-
-                try:
-                    preference_score = ampl.obj["preference_score"]
-                    preference_score_value = preference_score.value()
-                except Exception:
-                    preference_score_value = None
-
-                gap_pct, abs_gap = FieldOptimizerService._extract_solver_gap(ampl, solve_result)
-                elapsed_ms = round(
-                    (datetime.now() - start_time).total_seconds() * 1000, 2)
-
-                iteration_details.append(IterationDetail(
-                    iteration=i + 1,
-                    time_limit=iteration["time"],
-                    gap_limit=iteration["gap"],
-                    elapsed_ms=elapsed_ms,
-                    solve_result=solve_result,
-                    preference_score=preference_score_value,
-                    gap_percent=gap_pct,
-                    abs_gap=abs_gap,
-                ))
+                iteration_detail = FieldOptimizerService._solve_iteration(
+                    ampl, i, iteration, start_time)
+                iteration_details.append(iteration_detail)
+
+                solve_result = iteration_detail.solve_result
+                preference_score_value = iteration_detail.preference_score
 
                 if solve_result == "infeasible":
                     break
@@ -275,77 +191,18 @@ class FieldOptimizerService:
                 if solve_result == "solved":
                     break
 
-            # 1. Infeasible solution
-            if solve_result == "infeasible":
-                end_time = datetime.now()
-                duration_ms = round(
-                    (end_time - start_time).total_seconds() * 1000, 2)
-                return FieldOptimizerResult(
-                    result="infeasible",
-                    duration_ms=duration_ms,
-                    preference_score=None,
-                    activities=[],
-                    iterations=iteration_details,
-                )
-
-            # 2. No objective value (solver error / edge case)
-            if preference_score_value is None:
-                end_time = datetime.now()
-                duration_ms = round(
-                    (end_time - start_time).total_seconds() * 1000, 2)
-                return FieldOptimizerResult(
-                    result="no_objective_value",
-                    duration_ms=duration_ms,
-                    preference_score=None,
-                    activities=[],
-                    iterations=iteration_details,
-                )
-
-            # 3. Solved (possibly with shortfall from soft constraints)
-            field_allocations = convert_ampl_x_values_to_allocations(
-                ampl, field_optimizer_input.groups)
-
-            existing_allocation_keys = set()
-            for activity in processed_activities:
-                for idx in activity.timeslot_indexes:
-                    existing_allocation_keys.add(
-                        (activity.field_id, activity.group_id, idx))
-
-            field_allocations = [
-                alloc for alloc in field_allocations
-                if (alloc.field, alloc.group, alloc.timeslot_id)
-                not in existing_allocation_keys
-            ]
-
-            field_activities = convert_field_allocations_to_activities(
-                field_allocations,
-                field_optimizer_input.time_slots
-            )
-
-            result_activities = convert_field_activities_to_result(
-                payload=payload,
-                field_activities=field_activities,
-                time_slot_duration_minutes=time_slot_duration_minutes,
-                time_slots_in_range=time_slots_in_range,
-                index_to_timeslot_map=index_to_timeslot_map
-            )
-
-            activities_not_generated = _extract_shortfall_info(
-                ampl, field_optimizer_input.groups
-            )
-
-            end_time = datetime.now()
-            duration_ms = round(
-                (end_time - start_time).total_seconds() * 1000, 2)
-
-            return FieldOptimizerResult(
-                result="solved",
-                duration_ms=duration_ms,
-                preference_score=preference_score_value,
-                activities=result_activities,
-                activities_not_generated=activities_not_generated if activities_not_generated else None,
+            result = FieldOptimizerService._build_result(
+                ampl, payload, converted_payload, processed_activities,
+                solve_result, preference_score_value, start_time,
                 iterations=iteration_details,
             )
+            reusable = True
+            if result is None:
+                FieldOptimizerService._release_ampl(ampl, reusable)
+                ampl = None
+                return FieldOptimizerService._solve(
+                    FieldOptimizerService._without_pooling(payload))
+            return result
         except Exception as e:
             logger.error("Optimization error: %s", e, exc_info=True)
             end_time = datetime.now()
@@ -358,124 +215,501 @@ class FieldOptimizerService:
                 activities=[],
                 error_message=str(e),
             )
+        finally:
+            if ampl is not None:
+                FieldOptimizerService._release_ampl(ampl, reusable)
 
     @staticmethod
-    def _setup_ampl(payload: FieldOptimizerPayload):
-        """Shared AMPL setup used by both solve() and solve_stream().
-        Returns (ampl, converted_payload, processed_activities) tuple."""
+    def _lane(payload: FieldOptimizerPayload, streaming: bool) -> str:
+        """Scheduling lane of a request: batch for extended solves,
+        interactive for streams and standard otherwise. The payload's lane
+        may only lower that priority, so no client can take the reserved
+        interactive slots for a long solve."""
+        if payload.extended_time:
+            lane = "batch"
+        else:
+            lane = "interactive" if streaming else "standard"
+        if payload.lane is not None and LANES.index(payload.lane) > LANES.index(lane):
+            return payload.lane
+        return lane
+
+    @staticmethod
+    def _expected_seconds(payload: FieldOptimizerPayload) -> float:
+        """Time budget of a request, used to estimate queue waits."""
+        iterations_config = SOLVE_ITERATIONS_EXTENDED if payload.extended_time else SOLVE_ITERATIONS
+        alternatives = min(payload.alternatives, MAX_ALTERNATIVES)
+        return (sum(iteration["time"] for iteration in iterations_config)
+                + alternatives * ALTERNATIVE_ITERATION["time"])
+
+    @staticmethod
+    def _iterations_config(payload: FieldOptimizerPayload, analysis: CapacityAnalysis) -> list[dict]:
+        """Iteration schedule of a request; reduced when a shortfall is
+        certain and the payload asks for it."""
+        if analysis.min_total_shortfall and payload.on_certain_shortfall == "reduce":
+            return SHORTFALL_ITERATIONS
+        return SOLVE_ITERATIONS_EXTENDED if payload.extended_time else SOLVE_ITERATIONS
+
+    @staticmethod
+    def _insufficient_capacity_result(
+        analysis: CapacityAnalysis,
+        start_time: datetime,
+    ) -> FieldOptimizerResult:
+        """Result of a request rejected by the capacity pre-analysis."""
+        duration_ms = round(
+            (datetime.now() - start_time).total_seconds() * 1000, 2)
+        return FieldOptimizerResult(
+            result="insufficient_capacity",
+            duration_ms=duration_ms,
+            preference_score=None,
+            activities=[],
+            capacity_analysis=analysis,
+        )
+
+    @staticmethod
+    async def solve_progressive(payload: FieldOptimizerPayload) -> ProgressiveResult:
+        """
+        Return the incumbent of a short first iteration as version 1 of a new
+        result, and keep solving in a background thread with what is left of
+        the regular iteration schedule. Each improved schedule is published
+        as a new version of the same result_id (see get_progressive_result
+        and progressive_events); the last one carries any alternatives.
+
+        Only the first iteration runs in the lane of a stream, interactive by
+        default; its ticket is released once version 1 is published and the
+        background phase queues again in the standard or batch lane.
+
+        Identical stadiums are never pooled here: a version is published as
+        soon as it is found, so there is no room for the pooled fallback.
+        """
+        payload = payload.model_copy(update={"pool_identical_stadiums": False})
+        # Progressive clients wait for the first version like stream clients
+        return await FieldOptimizerService._run_when_admitted(
+            FieldOptimizerService._lane(payload, streaming=True),
+            PROGRESSIVE_QUICK_ITERATION["time"],
+            FieldOptimizerService._solve_progressive, payload)
+
+    @staticmethod
+    def _solve_progressive(payload: FieldOptimizerPayload) -> ProgressiveResult:
+        """First iteration of solve_progressive, run once admitted; hands the
+        model to _improve_in_background unless it already finished."""
+        store = get_result_store()
+        result_id = store.create()
+        start_time = datetime.now()
+        ampl = None
+        reusable = False
+        handed_over = False
+
+        try:
+            ampl, converted_payload, processed_activities = \
+                FieldOptimizerService._setup_ampl(payload)
+            if ampl is None:
+                store.publish(result_id, FieldOptimizerService._insufficient_capacity_result(
+                    converted_payload.capacity_analysis, start_time), done=True)
+                return FieldOptimizerService.get_progressive_result(result_id)
+
+            quick = FieldOptimizerService._solve_iteration(
+                ampl, 0, PROGRESSIVE_QUICK_ITERATION, start_time)
+            done = quick.solve_result in ("solved", "infeasible")
+            result = FieldOptimizerService._build_result(
+                ampl, payload if done else payload.model_copy(update={"alternatives": 0}),
+                converted_payload, processed_activities,
+                quick.solve_result, quick.preference_score, start_time,
+                iterations=[quick],
+            )
+            store.publish(result_id, result, done=done)
+            reusable = True
+
+            if not done:
+                threading.Thread(
+                    target=FieldOptimizerService._improve_in_background,
+                    args=(ampl, result_id, payload, converted_payload,
+                          processed_activities, quick, start_time),
+                    name=f"progressive-{result_id[:8]}",
+                    daemon=True,
+                ).start()
+                handed_over = True
+        except Exception as e:
+            logger.error("Progressive optimization error: %s", e, exc_info=True)
+            duration_ms = round(
+                (datetime.now() - start_time).total_seconds() * 1000, 2)
+            store.publish(result_id, FieldOptimizerResult(
+                result="failure",
+                duration_ms=duration_ms,
+                preference_score=None,
+                activities=[],
+                error_message=str(e),
+            ), done=True)
+        finally:
+            if not handed_over and ampl is not None:
+                FieldOptimizerService._release_ampl(ampl, reusable)
+
+        return FieldOptimizerService.get_progressive_result(result_id)
+
+    @staticmethod
+    def _background_lane(payload: FieldOptimizerPayload) -> str:
+        """Lane of the background phase of a progressive solve: batch for
+        extended or batch requests, standard otherwise."""
+        if payload.extended_time or payload.lane == "batch":
+            return "batch"
+        return "standard"
+
+    @staticmethod
+    def _remaining_iterations(iterations_config: list[dict], spent_seconds: int) -> list[dict]:
+        """The iteration schedule without its first spent_seconds, so a
+        progressive solve stays within the budget of a plain one."""
+        remaining = []
+        for iteration in iterations_config:
+            time_limit = iteration["time"] - spent_seconds
+            spent_seconds = max(0, -time_limit)
+            if time_limit > 0:
+                remaining.append({**iteration, "time": time_limit})
+        return remaining
+
+    @staticmethod
+    def _improve_in_background(
+        ampl: "AMPL | CachedProblem",
+        result_id: str,
+        payload: FieldOptimizerPayload,
+        converted_payload,
+        processed_activities,
+        quick: IterationDetail,
+        start_time: datetime,
+    ):
+        """Run the rest of the iteration schedule after the quick iteration
+        of solve_progressive once its own standard or batch ticket is
+        admitted, and publish every improvement. Owns the model from here
+        on and keeps it loaded while the ticket waits. Stops early when the
+        result was evicted."""
+        store = get_result_store()
+        scheduler = get_solve_scheduler()
+        ticket = scheduler.enqueue(
+            FieldOptimizerService._background_lane(payload),
+            FieldOptimizerService._expected_seconds(payload) - quick.time_limit)
+        reusable = False
+        best_score = quick.preference_score
+        iteration_details = [quick]
+        iterations_config = FieldOptimizerService._remaining_iterations(
+            FieldOptimizerService._iterations_config(payload, converted_payload.capacity_analysis),
+            quick.time_limit)
+
+        try:
+            scheduler.wait(ticket)
+            for i, iteration in enumerate(iterations_config):
+                iteration_detail = FieldOptimizerService._solve_iteration(
+                    ampl, i + 1, iteration, start_time)
+                iteration_details.append(iteration_detail)
+                score = iteration_detail.preference_score
+
+                last = (i == len(iterations_config) - 1
+                        or iteration_detail.solve_result in ("solved", "infeasible"))
+                improved = score is not None and (best_score is None or score > best_score + 1e-6)
+                # The last version also carries the alternatives, if any
+                if improved or (last and payload.alternatives):
+                    result = FieldOptimizerService._build_result(
+                        ampl, payload if last else payload.model_copy(update={"alternatives": 0}),
+                        converted_payload, processed_activities,
+                        iteration_detail.solve_result, score, start_time,
+                        iterations=list(iteration_details),
+                    )
+                    version = store.publish(result_id, result, done=last)
+                    if not version:
+                        break
+                    logger.info("Result %s: version %d, preference_score %s",
+                                result_id[:8], version, score)
+                    best_score = score if improved else best_score
+                if last:
+                    break
+            reusable = True
+        except Exception as e:
+            logger.error("Background optimization error for result %s: %s",
+                         result_id[:8], e, exc_info=True)
+        finally:
+            store.finish(result_id)
+            FieldOptimizerService._release_ampl(ampl, reusable)
+            scheduler.release(ticket)
+
+    @staticmethod
+    def get_progressive_result(result_id: str, compact: bool = False) -> ProgressiveResult | None:
+        """Latest version of a progressive result, or None when unknown or
+        expired."""
+        stored = get_result_store().get(result_id)
+        if stored is None:
+            return None
+        latest = stored.versions[-1] if stored.versions else None
+        if latest is not None and compact:
+            latest = convert_result_to_compact(latest)
+        return ProgressiveResult(
+            result_id=result_id,
+            version=len(stored.versions),
+            done=stored.done,
+            result=latest,
+        )
+
+    @staticmethod
+    def progressive_events(
+        result_id: str,
+        last_event_id: int = 0,
+        compact: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        SSE subscription to a progressive result: a version event (SSE id =
+        version number) for every version after last_event_id, so a client
+        reconnecting with Last-Event-ID resumes where it stopped, then done.
+        Sends keep-alive comments while the solve has nothing new.
+        """
+        store = get_result_store()
+        sent = last_event_id
+        while True:
+            stored = store.wait_for_update(result_id, sent, PROGRESSIVE_KEEPALIVE_SECONDS)
+            if stored is None:
+                yield FieldOptimizerService._sse_event({
+                    "type": "error",
+                    "message": f"Result '{result_id}' not found",
+                })
+                return
+
+            for version in range(sent + 1, len(stored.versions) + 1):
+                result = stored.versions[version - 1]
+                yield FieldOptimizerService._sse_event({
+                    "type": "version",
+                    "version": version,
+                    "data": (convert_result_to_compact(result) if compact else result).model_dump(),
+                }, event_id=version)
+            if stored.done:
+                yield FieldOptimizerService._sse_event({
+                    "type": "done",
+                    "version": len(stored.versions),
+                })
+                return
+            if len(stored.versions) == sent:
+                yield ": keepalive\n\n"
+            sent = len(stored.versions)
+
+    @staticmethod
+    def _convert_schedule_payload(schedule_payload: SchedulePayload):
+        """Convert the payload of a given schedule on the 15-minute model (no
+        time grid, no pooling), so any start time can be placed.
+        Returns (payload, converted_payload, preprocessed)."""
+        payload = schedule_payload.payload.model_copy(
+            update={"auto_time_grid": False, "pool_identical_stadiums": False})
         converted_payload = convert_payload_to_input(payload)
+        preprocessed = preprocess_existing_activities(
+            existing_activities=converted_payload.existing_activities,
+            field_optimizer_input=converted_payload.field_optimizer_input,
+            timeslot_to_index_map=converted_payload.timeslot_to_index_map
+        )
+        return payload, converted_payload, preprocessed
 
-        field_optimizer_input = converted_payload.field_optimizer_input
-        timeslot_to_index_map = converted_payload.timeslot_to_index_map
-        existing_activities = converted_payload.existing_activities
-        auto_incompatible_same_day = converted_payload.auto_incompatible_same_day
-        auto_incompatible_same_time = converted_payload.auto_incompatible_same_time
+    @staticmethod
+    def score(schedule_payload: SchedulePayload) -> ScheduleScore:
+        """Evaluate preference_score of a given schedule without a solver.
+        For schedules on the solve grid the value equals the solver's.
 
-        ampl = AMPL()
-        ampl.set_output_handler(SilentOutputHandler())
-        ampl.option["solver"] = "scip"
-        ampl.read("./ampl/field_optimizer.mod")
+        Raises:
+            ValueError: If an activity is outside the window or unknown
+        """
+        start_time = datetime.now()
+        payload, converted_payload, preprocessed = \
+            FieldOptimizerService._convert_schedule_payload(schedule_payload)
+        starts = preprocessed.processed_activities + convert_result_activities_to_starts(
+            schedule_payload.activities, converted_payload.timeslot_to_index_map)
+
+        scored = score_schedule(
+            converted_payload,
+            incompatible_same_time=(list(payload.incompatible_groups or [])
+                                    + converted_payload.auto_incompatible_same_time),
+            incompatible_same_day=(list(payload.incompatible_groups_same_day or [])
+                                   + converted_payload.auto_incompatible_same_day),
+            starts=starts,
+        )
+        activities_not_generated = _extract_shortfall_info(
+            AmplSolution(field_activities=[], activity_counts=scored.activity_counts,
+                         shortfalls=scored.shortfalls),
+            converted_payload.field_optimizer_input.groups,
+        )
 
-        ampl.set["F"] = [
-            field.id for field in field_optimizer_input.fields]
-        ampl.set["G"] = [
-            group.id for group in field_optimizer_input.groups]
+        duration_ms = round(
+            (datetime.now() - start_time).total_seconds() * 1000, 2)
+        return ScheduleScore(
+            duration_ms=duration_ms,
+            preference_score=scored.preference_score,
+            breakdown=ScoreBreakdown(**scored.breakdown),
+            activities_not_generated=activities_not_generated or None,
+        )
 
-        all_timeslots = []
-        for day_slots in field_optimizer_input.time_slots:
-            all_timeslots.extend(day_slots)
-        ampl.set["T"] = all_timeslots
+    @staticmethod
+    def validate(schedule_payload: SchedulePayload) -> ScheduleValidation:
+        """List every hard-constraint violation of a given schedule."""
+        start_time = datetime.now()
+        _, converted_payload, preprocessed = \
+            FieldOptimizerService._convert_schedule_payload(schedule_payload)
+        violations = validate_schedule(
+            converted_payload, schedule_payload.activities,
+            preprocessed.processed_activities)
 
-        days = list(range(1, len(field_optimizer_input.time_slots) + 1))
-        ampl.set["D"] = days
+        duration_ms = round(
+            (datetime.now() - start_time).total_seconds() * 1000, 2)
+        return ScheduleValidation(
+            duration_ms=duration_ms,
+            valid=not violations,
+            violations=violations,
+        )
 
-        for day_idx, day_slots in enumerate(field_optimizer_input.time_slots, start=1):
-            ampl.set["DT"][day_idx] = day_slots
+    @staticmethod
+    def _create_ampl() -> "AMPL":
+        """Create a silent AMPL instance using SCIP. amplpy is imported here
+        instead of at module level because it is slow to import."""
+        from amplpy import AMPL
+        from services.silent_output_handler import SilentOutputHandler
 
-        day_start_timeslots: list[int] = [
-            day_slots[0]
-            for day_slots in field_optimizer_input.time_slots
-        ]
-        ampl.set["ST"] = day_start_timeslots
+        ampl = get_ampl_lifecycle().track(AMPL())
+        ampl.set_output_handler(SilentOutputHandler())
+        ampl.option["solver"] = "scip"
+        return ampl
 
-        aat_map, processed_activities = build_aat_map(
-            existing_activities=existing_activities,
+    @staticmethod
+    def _setup_ampl(payload: FieldOptimizerPayload):
+        """Shared AMPL setup used by both solve() and solve_stream().
+        Returns (ampl, converted_payload, processed_activities) tuple, with
+        ampl None when the capacity pre-analysis proves a shortfall and the
+        payload asks to fail fast (on_certain_shortfall="fail").
+        With a session_key the club's live session is reused. Otherwise, with
+        AMPL_PROBLEM_CACHE_DIR set, a previously generated problem with
+        the same model and data is returned as a CachedProblem instead."""
+        converted_payload = convert_payload_to_input(payload)
+        field_optimizer_input = converted_payload.field_optimizer_input
+
+        # Indexes existing activities and adds their fixed starts to AT[g]
+        preprocessed = preprocess_existing_activities(
+            existing_activities=converted_payload.existing_activities,
             field_optimizer_input=field_optimizer_input,
-            timeslot_to_index_map=timeslot_to_index_map
+            timeslot_to_index_map=converted_payload.timeslot_to_index_map
         )
+        processed_activities = preprocessed.processed_activities
+
+        analysis = analyze_capacity(converted_payload, processed_activities)
+        converted_payload.capacity_analysis = analysis
+        if analysis.min_total_shortfall:
+            logger.warning("Capacity pre-analysis: at least %d activities short, %d teams "
+                           "cannot reach their minimum (on_certain_shortfall=%s)",
+                           analysis.min_total_shortfall, len(analysis.teams),
+                           payload.on_certain_shortfall)
+            if payload.on_certain_shortfall == "fail":
+                return None, converted_payload, processed_activities
+
+        if payload.pool_identical_stadiums:
+            converted_payload.field_pools = pool_identical_fields(
+                field_optimizer_input, preprocessed.aat_map)
+            if converted_payload.field_pools:
+                logger.info("Pooled %d identical fields into %d pools",
+                            sum(len(p.field_ids) for p in converted_payload.field_pools.values()),
+                            len(converted_payload.field_pools))
+        ampl_data = build_ampl_data(converted_payload, payload, preprocessed)
+
+        logger.info("Model: %d fields, %d groups, %d fixed activities, %d timeslots",
+                     len(field_optimizer_input.fields), len(field_optimizer_input.groups),
+                     len(processed_activities), len(ampl_data.sets["T"]))
+        if payload.break_symmetries:
+            logger.info("Symmetry breaking: %d group pairs, %d field pairs",
+                        len(ampl_data.sets["GROUP_SYMMETRY_PAIRS"]),
+                        len(ampl_data.sets["FIELD_SYMMETRY_PAIRS"]))
+
+        if payload.session_key:
+            pool = get_ampl_session_pool()
+            if pool.enabled:
+                ampl = FieldOptimizerService._setup_session(payload.session_key, ampl_data)
+                return ampl, converted_payload, processed_activities
+
+        # Alternatives add cuts to the live model, a cached problem has none
+        cache_dir = get_problem_cache_dir() if not payload.alternatives else None
+        fingerprint = None
+        if cache_dir is not None:
+            fingerprint = fingerprint_ampl_data(ampl_data, MODEL_PATH)
+            cached_problem = lookup_cached_problem(cache_dir, fingerprint)
+            if cached_problem is not None:
+                logger.info("Problem cache hit %s, skipping model generation", fingerprint[:12])
+                return cached_problem, converted_payload, processed_activities
+
+        ampl = FieldOptimizerService._create_ampl()
+        try:
+            ampl.read(MODEL_PATH)
+            load_ampl_data(ampl, ampl_data)
+
+            cached_problem = None
+            if cache_dir is not None and write_problem_to_cache(ampl, cache_dir, fingerprint):
+                cached_problem = lookup_cached_problem(cache_dir, fingerprint)
+        except BaseException:
+            get_ampl_lifecycle().close(ampl)
+            raise
+
+        if cached_problem is not None:
+            # Solve the problem just written instead of letting AMPL
+            # generate it a second time for solve
+            get_ampl_lifecycle().close(ampl)
+            return cached_problem, converted_payload, processed_activities
+        return ampl, converted_payload, processed_activities
 
-        for activity in processed_activities:
-            group = next(
-                (g for g in field_optimizer_input.groups
-                 if g.id == activity.group_id), None
-            )
-            if group and activity.start_index not in group.possible_start_times:
-                group.possible_start_times.append(activity.start_index)
-                group.possible_start_times.sort()
-
-        for group in field_optimizer_input.groups:
-            ampl.set["AT"][group.id] = group.possible_start_times
-        for group in field_optimizer_input.groups:
-            ampl.set["PT"][group.id] = group.preferred_start_times
-        for group in field_optimizer_input.groups:
-            ampl.set["PF"][group.id] = group.preferred_field_ids
-
-        for group in field_optimizer_input.groups:
-            ampl.param["d"][group.id] = group.duration
-            ampl.param["n_min"][group.id] = group.minimum_number_of_activities
-            ampl.param["n_max"][group.id] = group.maximum_number_of_activities
-            ampl.param["size_req"][group.id] = group.size_required
-            ampl.param["prio"][group.id] = group.priority
-            ampl.param["p_st1"][group.id] = group.preferred_start_time_activity_1
-            ampl.param["p_st2"][group.id] = group.preferred_start_time_activity_2
-            ampl.param["p_early_starts"][group.id] = group.p_early_starts
-
-        for field in field_optimizer_input.fields:
-            ampl.param["size"][field.id] = field.size
-
-        incomp_same_time = list(payload.incompatible_groups or [])
-        incomp_same_time.extend(auto_incompatible_same_time)
-        ampl.set["INCOMPATIBLE_GROUPS_SAME_TIME"] = incomp_same_time
-
-        incomp_same_day = list(payload.incompatible_groups_same_day or [])
-        incomp_same_day.extend(auto_incompatible_same_day)
-        ampl.set["INCOMPATIBLE_GROUPS_SAME_DAY"] = incomp_same_day
-
-        for field in field_optimizer_input.fields:
-            for group in field_optimizer_input.groups:
-                key = (field.id, group.id)
-                if key in aat_map:
-                    ampl.set["AAT"][field.id, group.id] = aat_map[key]
-                else:
-                    ampl.set["AAT"][field.id, group.id] = []
+    @staticmethod
+    def _setup_session(session_key: str, ampl_data: AmplData) -> "AMPL":
+        """Check out the live session of a key and send only changed data,
+        or build a new session when there is none or the structure changed."""
+        pool = get_ampl_session_pool()
+        session = pool.checkout(session_key)
 
-        for activity in processed_activities:
+        if session is not None and not requires_model_rebuild(session.data, ampl_data):
             try:
-                ampl.var["y"][activity.field_id,
-                              activity.group_id, activity.start_index].fix(1)
-            except Exception as e:
-                logger.error("Could not fix y variable for %s: %s", activity.group_id, e)
-                continue
-
-            for idx in activity.timeslot_indexes:
-                try:
-                    ampl.var["x"][activity.field_id,
-                                  activity.group_id, idx].fix(1)
-                except Exception as e:
-                    logger.error("Could not fix x variable for %s at index %s: %s", activity.group_id, idx, e)
-
-        for field in field_optimizer_input.fields:
-            ampl.set["UT"][field.id] = field.unavailable_start_times
-
-        logger.info("Model: %d fields, %d groups, %d fixed activities",
-                     len(field_optimizer_input.fields), len(field_optimizer_input.groups),
-                     len(processed_activities))
+                changes = update_ampl_data(session.ampl, session.data, ampl_data)
+            except Exception:
+                pool.release(session.ampl, reusable=False)
+                raise
+            session.data = ampl_data
+            logger.info("Session %s: reused after %d solves, %d data changes",
+                        session_key, session.solves, changes)
+            return session.ampl
+
+        if session is not None:
+            logger.info("Session %s: model structure changed, rebuilding", session_key)
+            pool.release(session.ampl, reusable=False)
+
+        ampl = FieldOptimizerService._create_ampl()
+        pool.register(AmplSession(
+            key=session_key,
+            ampl=ampl,
+            data=ampl_data,
+            estimated_bytes=estimate_session_bytes(ampl_data),
+        ))
+        try:
+            ampl.read(MODEL_PATH)
+            load_ampl_data(ampl, ampl_data)
+        except Exception:
+            pool.release(ampl, reusable=False)
+            raise
+        return ampl
 
-        return ampl, converted_payload, processed_activities
+    @staticmethod
+    def _release_ampl(ampl: "AMPL | CachedProblem", reusable: bool):
+        """Hand a session back to the pool after a request, or close an
+        instance the pool does not own. reusable is False when the request
+        failed or was cancelled and the model state is unknown. Called from
+        finally blocks, so every instance is torn down on success, error
+        and client disconnect (GeneratorExit in solve_stream)."""
+        lifecycle = get_ampl_lifecycle()
+        if not isinstance(ampl, CachedProblem):
+            if not get_ampl_session_pool().release(ampl, reusable):
+                lifecycle.close(ampl)
+        if lifecycle.request_recycle_if_due():
+            get_ampl_session_pool().clear()
+
+    @staticmethod
+    def _without_pooling(payload: FieldOptimizerPayload) -> FieldOptimizerPayload:
+        """Same request with the full per-field model, used when a pooled
+        solution cannot be split over concrete fields."""
+        logger.warning("Pooled solution could not be assigned to fields, solving the full model")
+        return payload.model_copy(update={"pool_identical_stadiums": False})
 
     @staticmethod
     def _build_result(
-        ampl: AMPL,
+        ampl: "AMPL | CachedProblem",
         payload: FieldOptimizerPayload,
         converted_payload,
         processed_activities,
@@ -483,12 +717,11 @@ class FieldOptimizerService:
         preference_score_value: float | None,
         start_time: datetime,
         iterations: list[IterationDetail] | None = None,
-    ) -> FieldOptimizerResult:
-        """Shared result-building logic used by both solve() and solve_stream()."""
+    ) -> FieldOptimizerResult | None:
+        """Shared result-building logic used by both solve() and solve_stream().
+        Returns None when identical fields were pooled and the solution does
+        not fit on the concrete fields; the caller then solves without pooling."""
         field_optimizer_input = converted_payload.field_optimizer_input
-        time_slots_in_range = converted_payload.time_slots_in_range
-        index_to_timeslot_map = converted_payload.index_to_timeslot_map
-        time_slot_duration_minutes = converted_payload.time_slot_duration_minutes
 
         if solve_result == "infeasible":
             end_time = datetime.now()
@@ -500,6 +733,7 @@ class FieldOptimizerService:
                 preference_score=None,
                 activities=[],
                 iterations=iterations,
+                capacity_analysis=converted_payload.capacity_analysis,
             )
 
         if preference_score_value is None:
@@ -512,64 +746,202 @@ class FieldOptimizerService:
                 preference_score=None,
                 activities=[],
                 iterations=iterations,
+                capacity_analysis=converted_payload.capacity_analysis,
             )
 
-        field_allocations = convert_ampl_x_values_to_allocations(
-            ampl, field_optimizer_input.groups)
+        fixed_starts = {
+            (activity.field_id, activity.group_id, activity.start_index)
+            for activity in processed_activities
+        }
+        if isinstance(ampl, CachedProblem):
+            solution = extract_variable_values_solution(
+                ampl.variable_values(), field_optimizer_input.groups, fixed_starts)
+        else:
+            solution = extract_ampl_solution(
+                ampl, field_optimizer_input.groups, fixed_starts)
+
+        schedule = FieldOptimizerService._convert_solution(
+            payload, converted_payload, solution)
+        if schedule is None:
+            return None
+        result_activities, activities_not_generated = schedule
+
+        alternatives = None
+        if payload.alternatives and not isinstance(ampl, CachedProblem):
+            alternatives = FieldOptimizerService._solve_alternatives(
+                ampl, payload, converted_payload, solution, fixed_starts, start_time)
 
-        existing_allocation_keys = set()
-        for activity in processed_activities:
-            for idx in activity.timeslot_indexes:
-                existing_allocation_keys.add(
-                    (activity.field_id, activity.group_id, idx))
-
-        field_allocations = [
-            alloc for alloc in field_allocations
-            if (alloc.field, alloc.group, alloc.timeslot_id)
-            not in existing_allocation_keys
-        ]
+        end_time = datetime.now()
+        duration_ms = round(
+            (end_time - start_time).total_seconds() * 1000, 2)
 
-        field_activities = convert_field_allocations_to_activities(
-            field_allocations,
-            field_optimizer_input.time_slots
+        return FieldOptimizerResult(
+            result="solved",
+            duration_ms=duration_ms,
+            preference_score=preference_score_value,
+            activities=result_activities,
+            activities_not_generated=activities_not_generated if activities_not_generated else None,
+            iterations=iterations,
+            alternatives=alternatives,
+            capacity_analysis=converted_payload.capacity_analysis,
         )
 
+    @staticmethod
+    def _convert_solution(
+        payload: FieldOptimizerPayload,
+        converted_payload,
+        solution: AmplSolution,
+    ) -> tuple[list[Activity], list[ActivitiesNotGenerated]] | None:
+        """Result activities and shortfalls of an extracted solution, or None
+        when pooled fields cannot be assigned to concrete fields."""
+        field_activities = assign_pooled_activities(
+            solution.field_activities, converted_payload.field_pools)
+        if field_activities is None:
+            return None
+
         result_activities = convert_field_activities_to_result(
             payload=payload,
             field_activities=field_activities,
-            time_slot_duration_minutes=time_slot_duration_minutes,
-            time_slots_in_range=time_slots_in_range,
-            index_to_timeslot_map=index_to_timeslot_map
+            time_slot_duration_minutes=converted_payload.time_slot_duration_minutes,
+            time_slots_in_range=converted_payload.time_slots_in_range,
+            index_to_timeslot_map=converted_payload.index_to_timeslot_map,
+            group_parent_ids=converted_payload.group_parent_ids
         )
-
         activities_not_generated = _extract_shortfall_info(
-            ampl, field_optimizer_input.groups
+            solution, converted_payload.field_optimizer_input.groups
         )
+        return result_activities, activities_not_generated
 
-        end_time = datetime.now()
-        duration_ms = round(
-            (end_time - start_time).total_seconds() * 1000, 2)
+    @staticmethod
+    def _solve_alternatives(
+        ampl: "AMPL",
+        payload: FieldOptimizerPayload,
+        converted_payload,
+        solution: AmplSolution,
+        fixed_starts: set[tuple[str, str, int]],
+        start_time: datetime,
+    ) -> list[AlternativeSchedule]:
+        """Re-solve with diversity cuts (ALTERNATIVE_CUTS) on the starts of
+        every schedule found so far. Stops early when no further schedule
+        exists. A schedule whose pooled fields cannot be assigned is no
+        alternative but stays cut, so it is not found again. The cuts are
+        removed again so a session model stays clean."""
+        groups = converted_payload.field_optimizer_input.groups
+        count = min(payload.alternatives, MAX_ALTERNATIVES)
+        schedules = []
+        alternatives = []
+        try:
+            for cut in range(1, count + 1):
+                if not solution.field_activities:
+                    break
+                schedules.append(solution.field_activities)
+                cuts = build_alternative_cuts(schedules, ALTERNATIVE_MIN_CHANGE_SHARE)
+                ampl.set["ALTERNATIVE_CUTS"] = cuts.cut_ids
+                cut_starts = ampl.set["CUT_STARTS"]
+                for index, starts in cuts.cut_starts.items():
+                    cut_starts[index] = starts
+                ampl.param["cut_min_changes"].set_values(cuts.min_changes)
+
+                detail = FieldOptimizerService._solve_iteration(
+                    ampl, cut - 1, ALTERNATIVE_ITERATION, start_time)
+                if detail.solve_result == "infeasible" or detail.preference_score is None:
+                    break
 
-        return FieldOptimizerResult(
-            result="solved",
-            duration_ms=duration_ms,
+                solution = extract_ampl_solution(ampl, groups, fixed_starts)
+                schedule = FieldOptimizerService._convert_solution(
+                    payload, converted_payload, solution)
+                if schedule is None:
+                    logger.warning("Alternative %d has pooled fields that cannot be "
+                                   "assigned; skipping it", cut)
+                    continue
+                activities, activities_not_generated = schedule
+                alternatives.append(AlternativeSchedule(
+                    rank=0,
+                    preference_score=detail.preference_score,
+                    activities=activities,
+                    activities_not_generated=activities_not_generated or None,
+                ))
+        finally:
+            ampl.set["ALTERNATIVE_CUTS"] = []
+
+        alternatives.sort(key=lambda a: a.preference_score, reverse=True)
+        for rank, alternative in enumerate(alternatives, start=1):
+            alternative.rank = rank
+        logger.info("Found %d of %d alternatives", len(alternatives), count)
+        return alternatives
+
+    @staticmethod
+    def _solve_iteration(
+        ampl: "AMPL | CachedProblem",
+        index: int,
+        iteration: dict,
+        start_time: datetime,
+    ) -> IterationDetail:
+        """Run one entry of the iteration schedule on the loaded model."""
+        scip_opts = f"lim:time={iteration['time']} lim:gap={iteration['gap']}"
+        if "absgap" in iteration:
+            scip_opts += f" lim:absgap={iteration['absgap']}"
+        if "pre_settings" in iteration:
+            scip_opts += f" pre:settings={iteration['pre_settings']}"
+        memory_limit_mb = get_solver_memory_limit_mb()
+        if memory_limit_mb is not None:
+            scip_opts += f" lim:memory={memory_limit_mb}"
+        get_ampl_lifecycle().record_solve()
+
+        if isinstance(ampl, CachedProblem):
+            sol = ampl.solve(scip_opts, iteration["time"])
+            solve_result = sol.solve_result
+            preference_score_value = sol.objective
+            solve_message = sol.message
+        else:
+            ampl.option["scip_options"] = scip_opts
+            ampl.solve()
+
+            solve_result = ampl.get_value("solve_result")
+
+            try:
+                preference_score = ampl.obj["preference_score"]
+                preference_score_value = preference_score.value()
+            except Exception:
+                preference_score_value = None
+
+            try:
+                solve_message = str(ampl.get_value("solve_message"))
+            except Exception:
+                solve_message = None
+
+        gap_pct, abs_gap = FieldOptimizerService._extract_solver_gap(solve_message, solve_result)
+        elapsed_ms = round(
+            (datetime.now() - start_time).total_seconds() * 1000, 2)
+
+        return IterationDetail(
+            iteration=index + 1,
+            time_limit=iteration["time"],
+            gap_limit=iteration["gap"],
+            elapsed_ms=elapsed_ms,
+            solve_result=solve_result,
             preference_score=preference_score_value,
-            activities=result_activities,
-            activities_not_generated=activities_not_generated if activities_not_generated else None,
-            iterations=iterations,
+            gap_percent=gap_pct,
+            abs_gap=abs_gap,
         )
 
     @staticmethod
-    def _sse_event(data: dict) -> str:
-        """Format a dict as an SSE event string."""
-        return f"data: {json.dumps(data)}\n\n"
+    def _sse_event(data: dict, event_id: int | None = None) -> str:
+        """Format a dict as an SSE event string, with an id line to resume
+        from (Last-Event-ID) when event_id is given."""
+        event = f"data: {orjson.dumps(data).decode()}\n\n"
+        return event if event_id is None else f"id: {event_id}\n{event}"
 
     @staticmethod
-    def _extract_solver_gap(ampl: AMPL, solve_result: str | None = None) -> tuple[float | None, float | None]:
-        """Extract relative gap (%) and absolute gap from SCIP after solve().
+    def _extract_solver_gap(
+        solve_message: str | None,
+        solve_result: str | None = None,
+    ) -> tuple[float | None, float | None]:
+        """Extract relative gap (%) and absolute gap from SCIP's solve_message.
         Returns (gap_percent, abs_gap) or (None, None) if unavailable."""
+        if solve_message is None:
+            return (None, None)
         try:
-            solve_message = str(ampl.get_value("solve_message"))
             logger.info("SCIP solve_message: %s", solve_message)
             abs_gap = None
             gap_pct = None
@@ -601,17 +973,75 @@ class FieldOptimizerService:
             return (None, None)
 
     @staticmethod
-    def solve_stream(payload: FieldOptimizerPayload) -> Generator[str, None, None]:
-        """Generator that yields SSE events during optimization.
-        Events: started, iteration_start, iteration_complete, result, error."""
+    async def solve_stream(
+        payload: FieldOptimizerPayload,
+        compact: bool = False,
+    ) -> AsyncGenerator[str, None]:
+        """Async generator that yields SSE events during optimization.
+        While the request's lane is full it yields queued events with the
+        queue position and estimated start, every QUEUE_UPDATE_SECONDS,
+        waiting on the event loop rather than in a thread pool worker.
+        Once admitted, the events of _solve_stream are produced in worker
+        threads. Closing the generator (client disconnect) gives up the
+        place or stops the solve."""
+        scheduler = get_solve_scheduler()
+        lane = FieldOptimizerService._lane(payload, streaming=True)
+        ticket = scheduler.enqueue(lane, FieldOptimizerService._expected_seconds(payload))
+        estimated_start_ms = round(scheduler.estimated_wait_seconds(ticket) * 1000)
+        try:
+            while not ticket.admitted:
+                yield FieldOptimizerService._sse_event({
+                    "type": "queued",
+                    "lane": lane,
+                    "queue_position": scheduler.position(ticket),
+                    "estimated_start_ms": round(scheduler.estimated_wait_seconds(ticket) * 1000),
+                })
+                await scheduler.wait_async(ticket, QUEUE_UPDATE_SECONDS)
+
+            queue = {
+                "lane": lane,
+                "queue_position": ticket.initial_position,
+                "estimated_start_ms": estimated_start_ms,
+                "queued_ms": round((ticket.started_at - ticket.enqueued_at) * 1000, 2),
+            }
+            events = FieldOptimizerService._solve_stream(payload, compact, queue)
+            try:
+                while (event := await anyio.to_thread.run_sync(next, events, None)) is not None:
+                    yield event
+            finally:
+                # Runs the cleanup of _solve_stream (GeneratorExit), also
+                # when the request was cancelled
+                with anyio.CancelScope(shield=True):
+                    await anyio.to_thread.run_sync(events.close)
+        finally:
+            scheduler.release(ticket)
+
+    @staticmethod
+    def _solve_stream(
+        payload: FieldOptimizerPayload,
+        compact: bool,
+        queue: dict,
+    ) -> Generator[str, None, None]:
+        """Events: started, iteration_start, iteration_complete, result, error.
+        started also carries the lane, the queue position and estimated start
+        on arrival and the time actually spent queued.
+        A pooled solution that does not fit on concrete fields emits fallback
+        and then the events of the full model, starting with started.
+        started carries the capacity pre-analysis; with on_certain_shortfall
+        "fail" a proven shortfall ends the stream with its result right after.
+        With compact, the result event carries a CompactFieldOptimizerResult."""
         start_time = datetime.now()
+        ampl = None
+        reusable = False
 
         try:
             ampl, converted_payload, processed_activities = \
                 FieldOptimizerService._setup_ampl(payload)
 
             field_optimizer_input = converted_payload.field_optimizer_input
-            iterations_config = SOLVE_ITERATIONS_EXTENDED if payload.extended_time else SOLVE_ITERATIONS
+            analysis = converted_payload.capacity_analysis
+            iterations_config = [] if ampl is None else \
+                FieldOptimizerService._iterations_config(payload, analysis)
 
             elapsed_ms = round(
                 (datetime.now() - start_time).total_seconds() * 1000, 2)
@@ -621,7 +1051,16 @@ class FieldOptimizerService:
                 "team_count": len(field_optimizer_input.groups),
                 "stadium_count": len(field_optimizer_input.fields),
                 "elapsed_ms": elapsed_ms,
+                "capacity_analysis": analysis.model_dump(),
+                **queue,
             })
+            if ampl is None:
+                result = FieldOptimizerService._insufficient_capacity_result(analysis, start_time)
+                yield FieldOptimizerService._sse_event({
+                    "type": "result",
+                    "data": (convert_result_to_compact(result) if compact else result).model_dump(),
+                })
+                return
 
             solve_result = None
             preference_score_value = None
@@ -636,38 +1075,12 @@ class FieldOptimizerService:
                     "gap_limit": iteration["gap"],
                 })
 
-                scip_opts = f"lim:time={iteration['time']} lim:gap={iteration['gap']}"
-                if "absgap" in iteration:
-                    scip_opts += f" lim:absgap={iteration['absgap']}"
-                if "pre_settings" in iteration:
-                    scip_opts += f" pre:settings={iteration['pre_settings']}"
-                ampl.option["scip_options"] = scip_opts
-
-                ampl.solve()
-
-                solve_result = ampl.get_value("solve_result")
-
-                try:
-                    preference_score = ampl.obj["preference_score"]
-                    preference_score_value = preference_score.value()
-                except Exception:
-                    preference_score_value = None
-
-                gap_pct, abs_gap = FieldOptimizerService._extract_solver_gap(ampl, solve_result)
-
-                elapsed_ms = round(
-                    (datetime.now() - start_time).total_seconds() * 1000, 2)
-
-                iteration_details.append(IterationDetail(
-                    iteration=i + 1,
-                    time_limit=iteration["time"],
-                    gap_limit=iteration["gap"],
-                    elapsed_ms=elapsed_ms,
-                    solve_result=solve_result,
-                    preference_score=preference_score_value,
-                    gap_percent=gap_pct,
-                    abs_gap=abs_gap,
-                ))
+                iteration_detail = FieldOptimizerService._solve_iteration(
+                    ampl, i, iteration, start_time)
+                iteration_details.append(iteration_detail)
+
+                solve_result = iteration_detail.solve_result
+                preference_score_value = iteration_detail.preference_score
 
                 yield FieldOptimizerService._sse_event({
                     "type": "iteration_complete",
@@ -675,9 +1088,9 @@ class FieldOptimizerService:
                     "total_iterations": len(iterations_config),
                     "solve_result": solve_result,
                     "preference_score": preference_score_value,
-                    "elapsed_ms": elapsed_ms,
-                    "gap_percent": gap_pct,
-                    "abs_gap": abs_gap,
+                    "elapsed_ms": iteration_detail.elapsed_ms,
+                    "gap_percent": iteration_detail.gap_percent,
+                    "abs_gap": iteration_detail.abs_gap,
                 })
 
                 if solve_result == "infeasible":
@@ -690,10 +1103,21 @@ class FieldOptimizerService:
                 solve_result, preference_score_value, start_time,
                 iterations=iteration_details,
             )
+            reusable = True
+            if result is None:
+                FieldOptimizerService._release_ampl(ampl, reusable)
+                ampl = None
+                yield FieldOptimizerService._sse_event({
+                    "type": "fallback",
+                    "reason": "pooled_assignment_failed",
+                })
+                yield from FieldOptimizerService._solve_stream(
+                    FieldOptimizerService._without_pooling(payload), compact, queue)
+                return
 
             yield FieldOptimizerService._sse_event({
                 "type": "result",
-                "data": result.model_dump(),
+                "data": (convert_result_to_compact(result) if compact else result).model_dump(),
             })
 
         except Exception as e:
@@ -705,3 +1129,6 @@ class FieldOptimizerService:
                 "message": str(e),
                 "elapsed_ms": elapsed_ms,
             })
+        finally:
+            if ampl is not None:
+                FieldOptimizerService._release_ampl(ampl, reusable)
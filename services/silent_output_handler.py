@@ -0,0 +1,6 @@
+from amplpy import OutputHandler
+
+
+class SilentOutputHandler(OutputHandler):
+    def output(self, kind, msg):
+        pass
@@ -0,0 +1,155 @@
+import logging
+import os
+import threading
+import time
+
+from models.field_optimizer.field_optimizer_payload import (
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from services.field_optimizer_service import FieldOptimizerService
+from utils.field_optimizer import get_ampl_session_pool, get_solve_scheduler
+from utils.time_slots import get_time_slot_table
+
+logger = logging.getLogger(__name__)
+
+# Set WARMUP_ON_STARTUP=0 to skip the warm-up solve (readiness then only
+# waits for license activation and cache priming)
+WARMUP_ON_STARTUP_ENV = "WARMUP_ON_STARTUP"
+
+WARMUP_INTERVALS = (15, 30, 60)
+
+# The warm-up solve is retried with doubling waits (e.g. while the license
+# server is unreachable); after the last attempt the service reports
+# "degraded" instead of "ready", which /ready still answers with 200 so a
+# deploy is not blocked by a solver that only fails at startup
+WARMUP_SOLVE_ATTEMPTS = 3
+WARMUP_RETRY_BACKOFF_SECONDS = 5
+
+# One stadium, one team, one hour on Monday: enough to spawn AMPL, load SCIP
+# and parse field_optimizer.mod, small enough to solve instantly
+WARMUP_PAYLOAD = FieldOptimizerPayload(
+    stadiums=[Stadium(id="warmup-stadium", name="Warmup", size=1, unavailable_start_times=[])],
+    teams=[Team(
+        id="warmup-team",
+        name="Warmup",
+        min_number_of_activities=1,
+        max_number_of_activities=1,
+        time_range=TimeRange(start_time="17:00", end_time="18:00", day_indexes=[0]),
+        duration=4,
+        size_required=1,
+        priority=1,
+        is_included=True,
+        preferred_stadium_ids=[],
+    )],
+    existing_team_activities=[],
+    start_time="17:00",
+    end_time="18:00",
+)
+
+_state_lock = threading.Lock()
+_state: dict = {"status": "pending", "steps": {}, "error": None}
+
+
+class WarmupService:
+
+    @staticmethod
+    def activate_ampl_license():
+        """Activate AMPL license using environment variable"""
+        license_uuid = os.getenv("AMPL_LICENSE_UUID")
+        if not license_uuid:
+            logger.warning("No AMPL_LICENSE_UUID found in environment variables")
+            return
+
+        try:
+            from amplpy import modules
+
+            modules.activate(license_uuid)
+            logger.info("AMPL license activated successfully: %s", license_uuid)
+        except Exception as e:
+            logger.error("Failed to activate AMPL license: %s", e)
+
+    @staticmethod
+    def prime_caches():
+        """Build the time slot tables every request granularity relies on,
+        and the session pool and solve scheduler (reading their settings)."""
+        for min_interval in WARMUP_INTERVALS:
+            get_time_slot_table(min_interval)
+        get_ampl_session_pool()
+        get_solve_scheduler()
+
+    @staticmethod
+    def warmup_solve():
+        """Solve a tiny problem so the first real request does not pay for
+        the AMPL process spawn, SCIP load and model parse."""
+        result = FieldOptimizerService.solve(WARMUP_PAYLOAD)
+        if result.result == "failure":
+            raise RuntimeError(result.error_message or "Warm-up solve failed")
+
+    @staticmethod
+    def run(solve: bool | None = None):
+        """
+        Run the startup routine: license activation, cache priming and,
+        unless disabled, a warm-up solve. Records status and step timings.
+
+        Args:
+            solve: Whether to run the warm-up solve. Defaults to the
+                WARMUP_ON_STARTUP environment variable (on unless "0").
+        """
+        if solve is None:
+            solve = os.getenv(WARMUP_ON_STARTUP_ENV, "1") != "0"
+
+        steps = [
+            ("activate_license", WarmupService.activate_ampl_license),
+            ("prime_caches", WarmupService.prime_caches),
+        ]
+        if solve:
+            steps.append(("warmup_solve", WarmupService.warmup_solve))
+
+        with _state_lock:
+            _state.update(status="running", steps={}, error=None)
+
+        for name, step in steps:
+            step_start = time.perf_counter()
+            attempts = WARMUP_SOLVE_ATTEMPTS if name == "warmup_solve" else 1
+            for attempt in range(1, attempts + 1):
+                try:
+                    step()
+                    break
+                except Exception as e:
+                    logger.error("Warm-up step %s failed (attempt %d of %d): %s",
+                                 name, attempt, attempts, e)
+                    if attempt == attempts:
+                        with _state_lock:
+                            _state.update(status="degraded", error=f"{name}: {e}")
+                        return
+                    time.sleep(WARMUP_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            duration_ms = round((time.perf_counter() - step_start) * 1000, 2)
+            logger.info("Warm-up step %s took %.2f ms", name, duration_ms)
+            with _state_lock:
+                _state["steps"][name] = duration_ms
+
+        with _state_lock:
+            _state["status"] = "ready"
+
+    @staticmethod
+    def start_in_background() -> threading.Thread:
+        """Run the startup routine in a daemon thread so the server starts
+        accepting (and health-checking) connections immediately."""
+        thread = threading.Thread(target=WarmupService.run, name="warmup", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def get_status() -> dict:
+        """Snapshot of the warm-up status: pending, running, ready or
+        degraded (a step failed for good; the service still takes requests)."""
+        with _state_lock:
+            return {**_state, "steps": dict(_state["steps"])}
+
+    @staticmethod
+    def is_ready() -> bool:
+        with _state_lock:
+            return _state["status"] == "ready"
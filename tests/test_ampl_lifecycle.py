@@ -0,0 +1,62 @@
+import gc
+from utils.field_optimizer.ampl_lifecycle import AmplLifecycle
+
+
+class ClosableAmpl:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_closed_and_leaked_instances_are_counted():
+    # Arrange
+    lifecycle = AmplLifecycle(recycle=False, recycle_after_solves=1, recycle_rss_mb=1)
+    closed = lifecycle.track(ClosableAmpl())
+    lifecycle.track(ClosableAmpl())
+
+    # Act
+    lifecycle.close(closed)
+    gc.collect()
+
+    # Assert
+    stats = lifecycle.stats()
+    assert closed.closed
+    assert (stats["created"], stats["closed"], stats["open"], stats["leaked"]) == (2, 1, 0, 1)
+
+
+def test_recycle_is_requested_once_after_solve_limit(monkeypatch):
+    # Arrange
+    signals = []
+    monkeypatch.setattr("os.kill", lambda pid, sig: signals.append(sig))
+    lifecycle = AmplLifecycle(recycle=True, recycle_after_solves=2, recycle_rss_mb=1e9)
+    lifecycle.record_solve()
+
+    # Act
+    before_limit = lifecycle.request_recycle_if_due()
+    lifecycle.record_solve()
+    at_limit = lifecycle.request_recycle_if_due()
+    again = lifecycle.request_recycle_if_due()
+
+    # Assert
+    assert (before_limit, at_limit, again) == (False, True, False)
+    assert len(signals) == 1
+
+
+def test_unsupervised_worker_is_not_recycled(monkeypatch):
+    # Arrange
+    signals = []
+    monkeypatch.setattr("os.kill", lambda pid, sig: signals.append(sig))
+    lifecycle = AmplLifecycle(recycle=True, recycle_after_solves=1, recycle_rss_mb=1e9,
+                              supervised=False)
+    lifecycle.record_solve()
+
+    # Act
+    recycled = lifecycle.request_recycle_if_due()
+
+    # Assert
+    assert not recycled
+    assert signals == []
+    stats = lifecycle.stats()
+    assert (stats["recycle_limit_reached"], stats["recycle_requested"]) == (True, False)
@@ -0,0 +1,58 @@
+import os
+from utils.field_optimizer.ampl_problem_cache import (
+    CachedProblem,
+    evict_cached_problems,
+    lookup_cached_problem,
+)
+from utils.field_optimizer.read_ampl_sol_file import SolFile
+
+
+def _write_entry(cache_dir, fingerprint, mtime, size=10):
+    for suffix in (".fix", ".col", ".nl"):
+        (cache_dir / f"{fingerprint}{suffix}").write_text("x" * size)
+    os.utime(cache_dir / f"{fingerprint}.nl", (mtime, mtime))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Arrange: "b" is the oldest write but was just looked up
+    _write_entry(tmp_path, "a", mtime=1000)
+    _write_entry(tmp_path, "b", mtime=900)
+    _write_entry(tmp_path, "c", mtime=1100)
+    assert lookup_cached_problem(tmp_path, "b") is not None
+
+    # Act
+    removed = evict_cached_problems(tmp_path, max_bytes=10**6, max_entries=2)
+
+    # Assert
+    assert removed == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "b.col", "b.fix", "b.nl", "c.col", "c.fix", "c.nl"]
+
+
+def test_entries_are_evicted_down_to_the_byte_bound(tmp_path):
+    # Arrange
+    for i, fingerprint in enumerate("abc"):
+        _write_entry(tmp_path, fingerprint, mtime=1000 + i, size=100)
+
+    # Act
+    evict_cached_problems(tmp_path, max_bytes=300, max_entries=10)
+
+    # Assert
+    assert lookup_cached_problem(tmp_path, "a") is None
+    assert lookup_cached_problem(tmp_path, "b") is None
+    assert lookup_cached_problem(tmp_path, "c") is not None
+
+
+def test_presolved_variables_are_mapped_back(tmp_path):
+    # Arrange
+    (tmp_path / "p.col").write_text("y['s1','a',3]\nmin_activity_shortfall['a']\n")
+    (tmp_path / "p.fix").write_text("1.0\ty['s1','b',5]\n0.0\tmin_activity_shortfall['b']\n")
+    problem = CachedProblem(tmp_path / "p")
+    problem.last_sol = SolFile(message="", solve_result_num=0, variable_values=[1.0, 0.0])
+
+    # Act
+    values = problem.variable_values()
+
+    # Assert
+    assert values["y"] == {("s1", "a", 3): 1.0, ("s1", "b", 5): 1.0}
+    assert values["min_activity_shortfall"] == {("a",): 0.0, ("b",): 0.0}
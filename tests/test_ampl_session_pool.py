@@ -0,0 +1,62 @@
+from utils.field_optimizer.ampl_session_pool import AmplSession, AmplSessionPool
+from utils.field_optimizer.build_ampl_data import AmplData
+
+
+class ClosableAmpl:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _session(key, estimated_bytes=100):
+    return AmplSession(key=key, ampl=ClosableAmpl(), data=AmplData(),
+                       estimated_bytes=estimated_bytes)
+
+
+def test_released_session_is_reused():
+    # Arrange
+    pool = AmplSessionPool(max_sessions=2, memory_budget_bytes=1000)
+    session = _session("club-1")
+    pool.register(session)
+
+    # Act
+    pool.release(session.ampl, reusable=True)
+    reused = pool.checkout("club-1")
+
+    # Assert
+    assert reused is session
+    assert reused.solves == 1
+    assert pool.checkout("club-1") is None
+
+
+def test_eviction_by_memory_budget():
+    # Arrange
+    pool = AmplSessionPool(max_sessions=3, memory_budget_bytes=250)
+    sessions = [_session("a"), _session("b"), _session("c", estimated_bytes=150)]
+
+    # Act
+    for session in sessions:
+        pool.register(session)
+        pool.release(session.ampl, reusable=True)
+
+    # Assert
+    assert [s.ampl.closed for s in sessions] == [True, False, False]
+    assert pool.stats() == {"idle": 2, "in_use": 0, "estimated_bytes": 250}
+
+
+def test_failed_session_is_closed():
+    # Arrange
+    pool = AmplSessionPool(max_sessions=2, memory_budget_bytes=1000)
+    session = _session("club-1")
+    pool.register(session)
+
+    # Act
+    released = pool.release(session.ampl, reusable=False)
+
+    # Assert
+    assert released
+    assert session.ampl.closed
+    assert pool.checkout("club-1") is None
+    assert not pool.release(ClosableAmpl(), reusable=True)
@@ -0,0 +1,77 @@
+from models.field_optimizer.field_optimizer_payload import (
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from utils.field_optimizer import (
+    analyze_capacity,
+    convert_payload_to_input,
+    preprocess_existing_activities,
+)
+
+
+def _team(team_id, min_activities, size_required=16):
+    return Team(
+        id=team_id, name=team_id,
+        min_number_of_activities=min_activities, max_number_of_activities=2,
+        time_range=TimeRange(start_time="17:00", end_time="19:00", day_indexes=[0, 1]),
+        duration=4, size_required=size_required, priority=1, is_included=True,
+        preferred_stadium_ids=[],
+    )
+
+
+def _analyze(teams, unavailable_start_times=None):
+    converted_payload = convert_payload_to_input(FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16,
+                          unavailable_start_times=unavailable_start_times or [])],
+        teams=teams,
+        existing_team_activities=[],
+        start_time="17:00",
+        end_time="19:00",
+    ))
+    preprocessed = preprocess_existing_activities(
+        existing_activities=converted_payload.existing_activities,
+        field_optimizer_input=converted_payload.field_optimizer_input,
+        timeslot_to_index_map=converted_payload.timeslot_to_index_map,
+    )
+    return analyze_capacity(converted_payload, preprocessed.processed_activities)
+
+
+def test_satisfiable_request_has_no_shortfall():
+    # Act
+    analysis = _analyze([_team("a", 2), _team("b", 2)])
+
+    # Assert
+    assert analysis.min_total_shortfall == 0
+    assert analysis.teams == []
+    assert analysis.max_activities == 4
+    assert [day.supply for day in analysis.days] == [16 * 120, 16 * 120]
+
+
+def test_oversized_team_and_excess_demand_are_certain_shortfall():
+    # Arrange: room for two one-hour activities per day, three teams need
+    # two each and a fourth team fits no stadium
+    teams = [_team("a", 2), _team("b", 2), _team("c", 2), _team("big", 1, size_required=24)]
+
+    # Act
+    analysis = _analyze(teams)
+
+    # Assert
+    assert [(t.team.id, t.valid_start_days, t.missing_activities) for t in analysis.teams] == [
+        ("big", 0, 1)]
+    assert analysis.required_demand == 6 * 16 * 60
+    assert analysis.achievable_supply == 4 * 16 * 60
+    assert analysis.min_total_shortfall == 3
+
+
+def test_closed_stadium_day_limits_valid_start_days():
+    # Arrange: Monday 17:45-18:15 closed, so no hour fits between 17:00 and 19:00
+    monday_1745 = 17 * 4 + 3 + 1
+
+    # Act
+    analysis = _analyze([_team("a", 2)], unavailable_start_times=[monday_1745, monday_1745 + 1])
+
+    # Assert
+    assert [(t.valid_start_days, t.max_activities, t.missing_activities) for t in analysis.teams] == [
+        (1, 1, 1)]
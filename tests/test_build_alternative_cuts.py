@@ -0,0 +1,33 @@
+from models.field_optimizer.field_activity import FieldActivity
+from utils.field_optimizer.build_alternative_cuts import build_alternative_cuts
+
+
+def _activities(count, field="f1"):
+    return [FieldActivity(field=field, group=f"g{i}", start_timeslot=i + 1,
+                          end_timeslot=i + 4, duration=4, size=8)
+            for i in range(count)]
+
+
+def test_one_cut_per_schedule_in_order():
+    # Arrange
+    schedules = [_activities(25), _activities(3, field="f2")]
+
+    # Act
+    cuts = build_alternative_cuts(schedules, 0.1)
+
+    # Assert
+    assert cuts.cut_ids == [1, 2]
+    assert cuts.cut_starts[2] == [("f2", "g0", 1), ("f2", "g1", 2), ("f2", "g2", 3)]
+    assert len(cuts.cut_starts[1]) == 25
+    # ceil(25 * 0.1) = 3; a small schedule still has to change one start
+    assert cuts.min_changes == {1: 3, 2: 1}
+
+
+def test_no_schedules_give_no_cuts():
+    # Act
+    cuts = build_alternative_cuts([], 0.1)
+
+    # Assert
+    assert cuts.cut_ids == []
+    assert cuts.cut_starts == {}
+    assert cuts.min_changes == {}
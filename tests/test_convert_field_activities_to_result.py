@@ -0,0 +1,70 @@
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from utils.field_optimizer import convert_payload_to_input
+from utils.field_optimizer.convert_field_activities_to_result import (
+    convert_field_activities_to_result,
+)
+
+
+PAYLOAD = FieldOptimizerPayload(
+    stadiums=[{"id": "s1", "name": "Stadium 1", "size": 16, "unavailable_start_times": []}],
+    teams=[{
+        "id": "t1", "name": "Team 1",
+        "min_number_of_activities": 1, "max_number_of_activities": 2,
+        "time_range": {"start_time": "17:00", "end_time": "19:00", "day_indexes": [0, 1]},
+        # 45 minutes keeps the payload on the 15-minute grid
+        "duration": 3, "size_required": 8, "priority": 1,
+        "is_included": True, "preferred_stadium_ids": [],
+    }],
+    existing_team_activities=[],
+    start_time="17:00",
+    end_time="19:00",
+)
+
+
+def _convert(field_activities, group_parent_ids=None):
+    converted = convert_payload_to_input(PAYLOAD)
+    return convert_field_activities_to_result(
+        payload=PAYLOAD,
+        field_activities=field_activities,
+        time_slot_duration_minutes=converted.time_slot_duration_minutes,
+        time_slots_in_range=converted.time_slots_in_range,
+        index_to_timeslot_map=converted.index_to_timeslot_map,
+        group_parent_ids=group_parent_ids,
+    )
+
+
+def test_times_and_shared_objects():
+    # Arrange: indexes 1-8 are Monday 17:00-18:45, 9-16 are Tuesday
+    field_activities = [
+        FieldActivity(field="s1", group="t1",
+                      start_timeslot=1, end_timeslot=4, duration=4, size=8),
+        FieldActivity(field="s1", group="t1",
+                      start_timeslot=13, end_timeslot=16, duration=4, size=8),
+    ]
+
+    # Act
+    activities = _convert(field_activities)
+
+    # Assert
+    assert [(a.index_week_day, a.start_time, a.end_time) for a in activities] == [
+        (0, "17:00", "18:00"),
+        (1, "18:00", "19:00"),
+    ]
+    assert activities[0].team is activities[1].team
+    assert activities[0].stadium is activities[1].stadium
+
+
+def test_subgroup_maps_to_parent_team():
+    # Arrange
+    field_activities = [
+        FieldActivity(field="s1", group="t1__existing_0",
+                      start_timeslot=1, end_timeslot=2, duration=2, size=16),
+    ]
+
+    # Act
+    activities = _convert(field_activities, {"t1__existing_0": "t1"})
+
+    # Assert
+    assert activities[0].team.id == "t1"
+    assert activities[0].team.name == "Team 1"
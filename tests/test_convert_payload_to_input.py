@@ -0,0 +1,169 @@
+import pytest
+from models.field_optimizer.field_optimizer_payload import (
+    ExistingTeamActivity,
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from utils.field_optimizer.convert_payload_to_input import (
+    compute_day_time_windows,
+    convert_payload_to_input,
+)
+from utils.field_optimizer.objective_coefficients import (
+    compute_start_coefficients,
+    get_timeslot_minutes,
+)
+
+
+def _team(team_id, start_time, end_time, day_indexes, duration=3):
+    return Team(
+        id=team_id, name=team_id,
+        min_number_of_activities=1, max_number_of_activities=2,
+        time_range=TimeRange(start_time=start_time, end_time=end_time, day_indexes=day_indexes),
+        duration=duration, size_required=8, priority=1, is_included=True,
+        preferred_stadium_ids=[],
+    )
+
+
+def test_time_slots_are_built_per_day():
+    # Arrange
+    saturday_10 = 5 * 96 + 40 + 1
+    payload = FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[])],
+        teams=[
+            _team("weekday", "17:00", "19:00", [0, 1, 2]),
+            _team("weekend", "12:00", "14:00", [6]),
+        ],
+        existing_team_activities=[ExistingTeamActivity(
+            team_id="weekday", team_name="weekday", stadium_id="s1", stadium_name="S1",
+            start_timeslot=saturday_10, end_timeslot=saturday_10 + 3,
+            duration_slots=4, size_required=8,
+        )],
+        start_time="17:00",
+        end_time="19:00",
+    )
+
+    # Act
+    converted = convert_payload_to_input(payload)
+
+    # Assert
+    field_optimizer_input = converted.field_optimizer_input
+    assert field_optimizer_input.week_day_indexes == [0, 1, 2, 5, 6]
+    slot_counts = [len(day_slots) for day_slots in field_optimizer_input.time_slots]
+    # Weekdays 17-19, Saturday 10-19, Sunday 12-19
+    assert slot_counts == [8, 8, 8, 36, 28]
+    first_saturday_slot = converted.index_to_timeslot_map[field_optimizer_input.time_slots[3][0]]
+    assert first_saturday_slot == saturday_10
+
+
+def test_aligned_payload_is_solved_on_hourly_grid():
+    # Arrange
+    saturday_10 = 5 * 96 + 40 + 1
+    payload = FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16,
+                          unavailable_start_times=[69, 70, 71, 72])],  # Monday 17:00-18:00
+        teams=[_team("weekday", "17:00", "20:00", [0, 1], duration=8)],
+        existing_team_activities=[ExistingTeamActivity(
+            team_id="weekday", team_name="weekday", stadium_id="s1", stadium_name="S1",
+            start_timeslot=saturday_10, end_timeslot=saturday_10 + 7,
+            duration_slots=8, size_required=8,
+        )],
+        start_time="17:00",
+        end_time="20:00",
+    )
+
+    # Act
+    converted = convert_payload_to_input(payload)
+
+    # Assert
+    field_optimizer_input = converted.field_optimizer_input
+    assert converted.time_slot_duration_minutes == 60
+    assert [len(day_slots) for day_slots in field_optimizer_input.time_slots] == [3, 3, 10]
+    group = field_optimizer_input.groups[0]
+    assert group.duration == 2
+    start_times = [converted.time_slots_in_range[i - 1].time for i in group.possible_start_times]
+    assert start_times == ["17:00", "18:00", "17:00", "18:00"]
+    assert field_optimizer_input.fields[0].unavailable_start_times == [1]
+    assert converted.existing_activities[0].duration_slots == 2
+
+
+def test_midnight_crossing_window_is_not_merged_across_the_gap():
+    # Arrange
+    payload = FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[])],
+        teams=[_team("night", "20:00", "02:00", [0, 1, 2, 3, 4, 5, 6])],
+        existing_team_activities=[],
+        start_time="20:00",
+        end_time="02:00",
+    )
+
+    # Act
+    day_windows = compute_day_time_windows("20:00", "02:00", [], None)
+    converted = convert_payload_to_input(payload)
+
+    # Assert
+    assert day_windows == {day_index: (1200, 120) for day_index in range(7)}
+    slot_counts = [len(day_slots) for day_slots in converted.field_optimizer_input.time_slots]
+    # 0:00-2:00 and 20:00-24:00 on every day
+    assert slot_counts == [24] * 7
+    monday_times = [converted.time_slots_in_range[i - 1].time
+                    for i in converted.field_optimizer_input.time_slots[0]]
+    assert monday_times[7:9] == ["01:45", "20:00"]
+
+
+def test_clock_time_scores_the_same_on_days_with_different_windows():
+    # Arrange
+    saturday_10 = 5 * 96 + 40 + 1
+    payload = FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[])],
+        teams=[_team("team", "17:00", "19:00", [0, 5])],
+        existing_team_activities=[ExistingTeamActivity(
+            team_id="team", team_name="team", stadium_id="s1", stadium_name="S1",
+            start_timeslot=saturday_10, end_timeslot=saturday_10 + 3,
+            duration_slots=4, size_required=8,
+        )],
+        start_time="17:00",
+        end_time="19:00",
+    )
+    converted = convert_payload_to_input(payload)
+    time_slots = converted.field_optimizer_input.time_slots
+    minutes = get_timeslot_minutes(converted)
+    monday_17 = time_slots[0][0]
+    saturday_17 = next(t for t in time_slots[1] if minutes[t] == 17 * 60)
+
+    # Act
+    coefficients = compute_start_coefficients(
+        converted.field_optimizer_input, timeslot_minutes=minutes)
+
+    # Assert: Monday's window starts at 17:00, Saturday's at 10:00
+    column = {t: i for i, t in enumerate(coefficients.timeslots)}
+    values = coefficients.start_values()[0, 0]
+    assert values[column[monday_17]] == values[column[saturday_17]]
+    # Positions count from 10:00, the earliest window start of the week
+    assert coefficients.late_start[0, column[monday_17]] == pytest.approx(-0.01 * 28)
+    assert coefficients.late_start[0, column[time_slots[1][0]]] == 0
+
+
+def test_midnight_crossing_window_counts_from_its_late_start():
+    # Arrange
+    payload = FieldOptimizerPayload(
+        stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[])],
+        teams=[_team("night", "20:00", "02:00", [0])],
+        existing_team_activities=[],
+        start_time="20:00",
+        end_time="02:00",
+    )
+    converted = convert_payload_to_input(payload)
+    minutes = get_timeslot_minutes(converted)
+    by_minutes = {minutes[t]: t for t in converted.field_optimizer_input.time_slots[0]}
+
+    # Act
+    coefficients = compute_start_coefficients(
+        converted.field_optimizer_input, timeslot_minutes=minutes)
+
+    # Assert: 20:00 is the first slot, 1:00 the 21st
+    column = {t: i for i, t in enumerate(coefficients.timeslots)}
+    late_start = coefficients.late_start[0]
+    assert late_start[column[by_minutes[20 * 60]]] == 0
+    assert late_start[column[by_minutes[60]]] == pytest.approx(-0.01 * 20)
@@ -133,3 +133,18 @@ def test_duration_equals_window():
     ids = convert_time_range_to_timeslot_ids(
         time_range, timeslot_map, duration_slots=4)
     assert len(ids) == 1
+
+
+def test_range_crossing_midnight_keeps_evening_starts():
+    """A 22:00-01:00 range allows evening starts that end by midnight."""
+    timeslot_map = _build_timeslot_map("22:00", "01:00")
+    time_range = TimeRange(
+        start_time="22:00",
+        end_time="01:00",
+        day_indexes=[0]
+    )
+
+    # 60 min activity (4 slots): 00:00 (ends 01:00) and 22:00..23:00
+    ids = convert_time_range_to_timeslot_ids(
+        time_range, timeslot_map, duration_slots=4)
+    assert len(ids) == 1 + 5
@@ -0,0 +1,47 @@
+import pytest
+from benchmarks.day_link_benchmark import (
+    build_payload,
+    solve_model,
+    write_legacy_model,
+)
+from services.field_optimizer_service import MODEL_PATH
+from utils.field_optimizer import (
+    build_ampl_data,
+    convert_payload_to_input,
+    preprocess_existing_activities,
+)
+
+
+def test_legacy_model_restores_the_replaced_rows(tmp_path):
+    # Act
+    legacy = open(write_legacy_model(str(tmp_path))).read()
+
+    # Assert
+    assert "has_activity_day_link" not in legacy
+    for name in ("one_activity_per_day", "has_activity_day_sum", "has_activity_day_trigger"):
+        assert f"subject to {name} " in legacy
+
+
+def test_day_link_keeps_the_legacy_optimum(tmp_path):
+    # Arrange: needs AMPL with SCIP, skipped where they are not installed
+    pytest.importorskip("amplpy")
+    payload = build_payload(8, 2, break_symmetries=True)
+    converted_payload = convert_payload_to_input(payload)
+    preprocessed = preprocess_existing_activities(
+        existing_activities=converted_payload.existing_activities,
+        field_optimizer_input=converted_payload.field_optimizer_input,
+        timeslot_to_index_map=converted_payload.timeslot_to_index_map
+    )
+    ampl_data = build_ampl_data(converted_payload, payload, preprocessed)
+
+    # Act
+    try:
+        legacy = solve_model(write_legacy_model(str(tmp_path)), ampl_data, 120)
+        link = solve_model(MODEL_PATH, ampl_data, 120)
+    except Exception as e:
+        pytest.skip(f"AMPL with SCIP is not available: {e}")
+
+    # Assert
+    assert (legacy["result"], link["result"]) == ("solved", "solved")
+    assert link["objective"] == pytest.approx(legacy["objective"])
+    assert link["rows"] < legacy["rows"]
@@ -0,0 +1,97 @@
+from amplpy import DataFrame
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_input import Group
+from utils.field_optimizer.extract_ampl_solution import (
+    Y_STARTS_STATEMENT,
+    SHORTFALL_STATEMENT,
+    extract_ampl_solution,
+    extract_variable_values_solution,
+)
+
+
+class SolvedModel:
+    """Answers get_data() for the filtered statements like a solved AMPL model."""
+
+    def __init__(self, y_starts, shortfalls):
+        self.data = {}
+        y = DataFrame(("G", "F", "T"), "y")
+        for row in y_starts:
+            y.add_row(*row, 1.0)
+        self.data[Y_STARTS_STATEMENT] = y
+        shortfall = DataFrame(("G",), "min_activity_shortfall")
+        for row in shortfalls:
+            shortfall.add_row(*row)
+        self.data[SHORTFALL_STATEMENT] = shortfall
+
+    def get_data(self, statement):
+        return self.data[statement]
+
+
+def _group(group_id, duration, size):
+    return Group(
+        id=group_id, name=group_id,
+        minimum_number_of_activities=2, maximum_number_of_activities=2,
+        possible_start_times=[], preferred_start_times=[],
+        preferred_start_time_activity_1=0, preferred_start_time_activity_2=0,
+        size_required=size, duration=duration, priority=1,
+        preferred_field_ids=[], p_early_starts=0,
+    )
+
+
+def test_activities_built_from_starts_and_duration():
+    # Arrange
+    ampl = SolvedModel(
+        y_starts=[("g1", "f1", 5), ("g1", "f2", 30), ("g2", "f1", 1)],
+        shortfalls=[("g2", 1.0)],
+    )
+    groups = [_group("g1", 4, 8), _group("g2", 2, 16)]
+
+    # Act
+    solution = extract_ampl_solution(ampl, groups, fixed_starts=set())
+
+    # Assert
+    assert solution.field_activities == [
+        FieldActivity(field="f1", group="g1",
+                      start_timeslot=5, end_timeslot=8, duration=4, size=8),
+        FieldActivity(field="f1", group="g2",
+                      start_timeslot=1, end_timeslot=2, duration=2, size=16),
+        FieldActivity(field="f2", group="g1",
+                      start_timeslot=30, end_timeslot=33, duration=4, size=8),
+    ]
+    assert solution.activity_counts == {"g1": 2, "g2": 1}
+    assert solution.shortfalls == {"g2": 1.0}
+
+
+def test_fixed_starts_are_counted_but_not_returned():
+    # Arrange
+    ampl = SolvedModel(
+        y_starts=[("g1", "f1", 5), ("g1", "f1", 30)],
+        shortfalls=[],
+    )
+
+    # Act
+    solution = extract_ampl_solution(
+        ampl, [_group("g1", 4, 8)], fixed_starts={("f1", "g1", 5)})
+
+    # Assert
+    assert [a.start_timeslot for a in solution.field_activities] == [30]
+    assert solution.activity_counts == {"g1": 2}
+
+
+def test_variable_values_solution_adds_fixed_starts():
+    # Arrange
+    variable_values = {
+        "y": {("f1", "g1", 5): 1.0, ("f1", "g1", 9): 0.0, ("f2", "g1", 30): 1.0},
+        "min_activity_shortfall": {("g1",): 0.0, ("g2",): 2.0},
+    }
+    groups = [_group("g1", 4, 8), _group("g2", 2, 16)]
+
+    # Act
+    solution = extract_variable_values_solution(
+        variable_values, groups, fixed_starts={("f1", "g2", 40)})
+
+    # Assert
+    assert [(a.field, a.group, a.start_timeslot) for a in solution.field_activities] == [
+        ("f1", "g1", 5), ("f2", "g1", 30)]
+    assert solution.activity_counts == {"g1": 2, "g2": 1}
+    assert solution.shortfalls == {"g2": 2.0}
@@ -0,0 +1,49 @@
+import itertools
+from models.field_optimizer.field_optimizer_input import Group
+from utils.field_optimizer.find_incompatible_cliques import find_incompatible_cliques
+
+
+def _group(group_id, priority=1):
+    return Group(
+        id=group_id, name=group_id,
+        minimum_number_of_activities=1, maximum_number_of_activities=1,
+        possible_start_times=[1], preferred_start_times=[],
+        preferred_start_time_activity_1=0, preferred_start_time_activity_2=0,
+        size_required=8, duration=2, priority=priority,
+        preferred_field_ids=[], p_early_starts=0,
+    )
+
+
+def test_coach_teams_form_one_clique():
+    # Arrange: a-d share a coach, e has another priority, d-x is a plain pair
+    groups = [_group(g) for g in "abcdx"] + [_group("e", priority=2)]
+    pairs = [list(p) for p in itertools.combinations("abcd", 2)]
+    pairs += [["a", "e"], ["b", "e"], ["d", "x"]]
+
+    # Act
+    cliques = find_incompatible_cliques(pairs, groups)
+
+    # Assert
+    assert [sorted(c) for c in cliques] == [["a", "b", "c", "d"]]
+
+
+def test_clique_penalty_equals_pair_penalty():
+    # Arrange
+    groups = [_group(g) for g in "abcdef"]
+    pairs = [list(p) for p in itertools.combinations("abcde", 2)] + [["e", "f"], ["a", "f"]]
+
+    # Act
+    cliques = find_incompatible_cliques(pairs, groups)
+
+    # Assert: for every occupancy, pairs outside cliques plus the clique
+    # excess terms count as many simultaneous incompatible pairs as before
+    for occupied in itertools.product((0, 1), repeat=len(groups)):
+        x = dict(zip("abcdef", occupied))
+        expected = sum(x[g1] * x[g2] for g1, g2 in pairs)
+        remaining = [(g1, g2) for g1, g2 in pairs
+                     if not any(g1 in c and g2 in c for c in cliques)]
+        actual = sum(x[g1] * x[g2] for g1, g2 in remaining)
+        for clique in cliques:
+            n = sum(x[g] for g in clique)
+            actual += sum(max(0, n - k) for k in range(1, len(clique)))
+        assert actual == expected
@@ -0,0 +1,77 @@
+from models.field_optimizer.field_optimizer_input import Field, FieldOptimizerInput, Group
+from utils.field_optimizer.find_symmetry_pairs import (
+    find_symmetric_field_pairs,
+    find_symmetric_group_pairs,
+)
+from utils.field_optimizer.pool_identical_fields import pool_identical_fields
+
+
+def _group(group_id, size=8, preferred_field_ids=()):
+    return Group(
+        id=group_id, name=group_id,
+        minimum_number_of_activities=2, maximum_number_of_activities=2,
+        possible_start_times=[1, 2, 3], preferred_start_times=[],
+        preferred_start_time_activity_1=0, preferred_start_time_activity_2=0,
+        size_required=size, duration=4, priority=1,
+        preferred_field_ids=list(preferred_field_ids), p_early_starts=0,
+    )
+
+
+def _input(groups, fields):
+    return FieldOptimizerInput(fields=fields, groups=groups,
+                               time_slots=[[1, 2, 3]], week_day_indexes=[0])
+
+
+def test_identical_groups_are_chained():
+    # Arrange
+    field_optimizer_input = _input(
+        groups=[_group("a"), _group("b"), _group("c", size=16), _group("d"),
+                _group("e"), _group("f")],
+        fields=[Field(id="s1", name="S1", size=16, unavailable_start_times=[])],
+    )
+
+    # Act
+    pairs = find_symmetric_group_pairs(
+        field_optimizer_input,
+        aat_map={("s1", "e"): [1]},
+        incompatible_pairs=[["f", "c"]],
+    )
+
+    # Assert: e has a predefined activity, f is incompatible with c
+    assert pairs == [["a", "b"], ["b", "d"]]
+
+
+def test_fields_differing_in_preference_are_not_paired():
+    # Arrange
+    fields = [Field(id=f"s{i}", name=f"S{i}", size=16, unavailable_start_times=[])
+              for i in range(4)]
+    fields[3].unavailable_start_times = [2]
+    field_optimizer_input = _input(
+        groups=[_group("a", preferred_field_ids=["s0"])],
+        fields=fields,
+    )
+
+    # Act
+    pairs = find_symmetric_field_pairs(field_optimizer_input, aat_map={})
+
+    # Assert
+    assert pairs == [["s1", "s2"]]
+
+
+def test_pool_is_not_paired_with_equal_sized_stadium():
+    # Arrange: two size-8 stadiums pool to size 16 next to a real size-16 one
+    fields = [Field(id="s0", name="S0", size=8, unavailable_start_times=[]),
+              Field(id="s1", name="S1", size=8, unavailable_start_times=[]),
+              Field(id="s2", name="S2", size=16, unavailable_start_times=[])]
+    field_optimizer_input = _input(groups=[_group("a", size=12)], fields=fields)
+    pools = pool_identical_fields(field_optimizer_input, aat_map={})
+
+    # Act
+    pairs = find_symmetric_field_pairs(
+        field_optimizer_input, aat_map={},
+        max_group_sizes={pool.id: pool.unit_size for pool in pools.values()})
+
+    # Assert: a size-12 team fits s2 but no unit of the pool
+    assert [(f.id, f.size) for f in field_optimizer_input.fields] == [
+        ("__pool_0", 16), ("s2", 16)]
+    assert pairs == []
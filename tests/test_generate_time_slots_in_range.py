@@ -0,0 +1,35 @@
+from utils.time_slots import (
+    generate_time_slots_in_range,
+    get_time_slot_table,
+)
+
+
+def test_range_within_day():
+    time_slots = generate_time_slots_in_range("17:00", "18:00", 15)
+
+    # 4 slots per day * 7 days = 28
+    assert len(time_slots) == 28
+    assert [ts.time for ts in time_slots[:4]] == [
+        "17:00", "17:15", "17:30", "17:45"]
+    assert time_slots[4].week_day_index == 1
+
+
+def test_range_crossing_midnight():
+    time_slots = generate_time_slots_in_range("23:00", "01:00", 30)
+
+    monday = [ts.time for ts in time_slots if ts.week_day_index == 0]
+    assert monday == ["00:00", "00:30", "23:00", "23:30"]
+
+
+def test_ids_match_table_positions():
+    table = get_time_slot_table(15)
+    time_slots = generate_time_slots_in_range("08:00", "09:00", 15)
+
+    for ts in time_slots:
+        assert table.time_slots[ts.id - 1] is ts
+        assert table.minutes[ts.id - 1] == int(ts.time[:2]) * 60 + int(ts.time[3:])
+
+
+def test_table_is_cached_per_interval():
+    assert get_time_slot_table(15) is get_time_slot_table(15)
+    assert get_time_slot_table(60).slots_per_day == 24
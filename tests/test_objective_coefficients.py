@@ -0,0 +1,48 @@
+import math
+import pytest
+from models.field_optimizer.field_optimizer_input import Field, FieldOptimizerInput, Group
+from utils.field_optimizer.objective_coefficients import compute_start_coefficients
+
+
+def _group(group_id, priority, preferred_start_times, preferred_field_ids, p_early_starts):
+    return Group(
+        id=group_id, name=group_id,
+        minimum_number_of_activities=1, maximum_number_of_activities=2,
+        possible_start_times=[1, 2, 3, 4, 5, 6, 7], preferred_start_times=preferred_start_times,
+        preferred_start_time_activity_1=0, preferred_start_time_activity_2=0,
+        size_required=8, duration=2, priority=priority,
+        preferred_field_ids=preferred_field_ids, p_early_starts=p_early_starts,
+    )
+
+
+def test_start_values_match_model_formula():
+    # Arrange: days of 4 and 3 timeslots on a 30-minute grid
+    time_slots = [[1, 2, 3, 4], [5, 6, 7]]
+    grid_factor = 2
+    field_optimizer_input = FieldOptimizerInput(
+        fields=[Field(id=f, name=f, size=16, unavailable_start_times=[]) for f in ("s1", "s2")],
+        groups=[_group("a", 2, [2, 6], ["s2"], 3), _group("b", 1, [], [], 0)],
+        time_slots=time_slots, week_day_indexes=[0, 2],
+    )
+
+    # Act
+    values = compute_start_coefficients(field_optimizer_input, grid_factor).start_values()
+
+    # Assert: the terms field_optimizer.mod summed before start_value
+    for f_idx, field in enumerate(field_optimizer_input.fields):
+        for g_idx, group in enumerate(field_optimizer_input.groups):
+            column = 0
+            for day_slots in time_slots:
+                mid_slot = math.ceil(len(day_slots) * grid_factor / 2)
+                for ord_idx, t in enumerate(day_slots):
+                    slot_ord = ord_idx * grid_factor + 1
+                    prio = group.priority
+                    expected = (
+                        prio
+                        + (2 * prio if t in group.preferred_start_times else 0)
+                        + (0.5 * prio if field.id in group.preferred_field_ids else 0)
+                        - 0.01 * (slot_ord - 1) * prio
+                        + group.p_early_starts * max(0, mid_slot - slot_ord) * prio
+                    )
+                    assert values[f_idx, g_idx, column] == pytest.approx(expected)
+                    column += 1
@@ -0,0 +1,82 @@
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_input import Field, FieldOptimizerInput, Group
+from utils.field_optimizer.pool_identical_fields import (
+    assign_pooled_activities,
+    pool_identical_fields,
+)
+
+
+def _group(group_id, preferred_field_ids=()):
+    return Group(
+        id=group_id, name=group_id,
+        minimum_number_of_activities=1, maximum_number_of_activities=1,
+        possible_start_times=[1, 2, 3], preferred_start_times=[],
+        preferred_start_time_activity_1=0, preferred_start_time_activity_2=0,
+        size_required=8, duration=2, priority=1,
+        preferred_field_ids=list(preferred_field_ids), p_early_starts=0,
+    )
+
+
+def _activity(field, group, start, end, size):
+    return FieldActivity(field=field, group=group, start_timeslot=start,
+                         end_timeslot=end, duration=end - start + 1, size=size)
+
+
+def test_identical_fields_are_pooled():
+    # Arrange
+    fields = [Field(id=f"s{i}", name=f"S{i}", size=16, unavailable_start_times=[])
+              for i in range(4)]
+    field_optimizer_input = FieldOptimizerInput(
+        fields=fields,
+        groups=[_group("a", preferred_field_ids=["s1", "s0", "s2"])],
+        time_slots=[[1, 2, 3]], week_day_indexes=[0],
+    )
+
+    # Act: s3 holds a predefined activity
+    pools = pool_identical_fields(field_optimizer_input, aat_map={("s3", "a"): [1]})
+
+    # Assert
+    assert list(pools) == ["__pool_0"]
+    assert pools["__pool_0"].field_ids == ["s0", "s1", "s2"]
+    assert [(f.id, f.size) for f in field_optimizer_input.fields] == [
+        ("__pool_0", 48), ("s3", 16)]
+    assert field_optimizer_input.groups[0].preferred_field_ids == ["__pool_0"]
+
+
+def test_pooled_activities_are_split_over_members():
+    # Arrange
+    pools = pool_identical_fields(FieldOptimizerInput(
+        fields=[Field(id=f"s{i}", name=f"S{i}", size=16, unavailable_start_times=[])
+                for i in range(2)],
+        groups=[], time_slots=[[1, 2, 3, 4]], week_day_indexes=[0],
+    ), aat_map={})
+    activities = [
+        _activity("__pool_0", "a", 1, 2, 12),
+        _activity("__pool_0", "b", 2, 3, 8),
+        _activity("__pool_0", "c", 3, 4, 8),
+        _activity("x", "d", 1, 2, 8),
+    ]
+
+    # Act
+    assigned = assign_pooled_activities(activities, pools)
+
+    # Assert: b overlaps a on s0, c takes s0 once a has ended
+    assert {(a.group, a.field) for a in assigned} == {
+        ("a", "s0"), ("b", "s1"), ("c", "s0"), ("d", "x")}
+
+
+def test_unsplittable_pooled_solution_returns_none():
+    # Arrange: 12 + 12 + 8 fits 2 x 16 in total but not per field
+    pools = pool_identical_fields(FieldOptimizerInput(
+        fields=[Field(id=f"s{i}", name=f"S{i}", size=16, unavailable_start_times=[])
+                for i in range(2)],
+        groups=[], time_slots=[[1, 2]], week_day_indexes=[0],
+    ), aat_map={})
+    activities = [_activity("__pool_0", g, 1, 2, size)
+                  for g, size in (("a", 12), ("b", 12), ("c", 8))]
+
+    # Act
+    assigned = assign_pooled_activities(activities, pools)
+
+    # Assert
+    assert assigned is None
@@ -0,0 +1,60 @@
+from utils.field_optimizer.read_ampl_sol_file import (
+    parse_ampl_variable_name,
+    read_ampl_sol_file,
+)
+
+SOL_FILE = """SCIP 8.0.3: optimal solution; objective 41.5
+12 simplex iterations, 1 branching nodes
+absmipgap=0, relmipgap=0
+
+Options
+3
+1
+1
+0
+2
+2
+3
+3
+0.5
+0
+1
+0
+2.25
+objno 0 0
+"""
+
+
+def test_sol_file_values_and_result(tmp_path):
+    # Arrange
+    sol_path = tmp_path / "problem.sol"
+    sol_path.write_text(SOL_FILE)
+
+    # Act
+    sol = read_ampl_sol_file(sol_path)
+
+    # Assert
+    assert sol.variable_values == [1.0, 0.0, 2.25]
+    assert sol.solve_result == "solved"
+    assert sol.objective == 41.5
+    assert "relmipgap=0" in sol.message
+
+
+def test_limit_result_from_objno(tmp_path):
+    # Arrange
+    sol_path = tmp_path / "problem.sol"
+    sol_path.write_text(SOL_FILE.replace("objno 0 0", "objno 0 403"))
+
+    # Act
+    sol = read_ampl_sol_file(sol_path)
+
+    # Assert
+    assert sol.solve_result == "limit"
+
+
+def test_parse_variable_names():
+    # Act & Assert
+    assert parse_ampl_variable_name("y['Field 1','G,12',17]") == ("y", ("Field 1", "G,12", 17))
+    assert parse_ampl_variable_name("min_activity_shortfall['O''Neil']") == (
+        "min_activity_shortfall", ("O'Neil",))
+    assert parse_ampl_variable_name("z") == ("z", ())
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from models.field_optimizer.field_optimizer_result import FieldOptimizerResult, IterationDetail
+from services.field_optimizer_service import SOLVE_ITERATIONS, FieldOptimizerService
+from utils.field_optimizer.result_store import ResultStore, get_result_store
+from utils.field_optimizer.solve_scheduler import SolveScheduler
+
+
+def _result(preference_score):
+    return FieldOptimizerResult(
+        result="solved", duration_ms=1, preference_score=preference_score, activities=[])
+
+
+def test_waiting_reader_sees_new_versions_and_done():
+    # Arrange
+    store = ResultStore(ttl_seconds=60, max_entries=4, max_running_seconds=60)
+    result_id = store.create()
+    store.publish(result_id, _result(1))
+
+    # Act
+    timed_out = store.wait_for_update(result_id, after_version=1, timeout=0.01)
+    store.publish(result_id, _result(2), done=True)
+    updated = store.wait_for_update(result_id, after_version=1, timeout=0.01)
+
+    # Assert
+    assert (len(timed_out.versions), timed_out.done) == (1, False)
+    assert (len(updated.versions), updated.done) == (2, True)
+
+
+def test_oldest_finished_result_is_evicted_first():
+    # Arrange
+    store = ResultStore(ttl_seconds=60, max_entries=2, max_running_seconds=60)
+    finished = store.create()
+    store.finish(finished)
+    running = store.create()
+
+    # Act
+    store.create()
+
+    # Assert
+    assert store.get(finished) is None
+    assert store.get(running) is not None
+
+
+def test_result_never_finished_is_evicted_after_max_running_seconds():
+    # Arrange
+    store = ResultStore(ttl_seconds=60, max_entries=4, max_running_seconds=0)
+    abandoned = store.create()
+
+    # Act
+    store.create()
+    version = store.publish(abandoned, _result(1))
+
+    # Assert
+    assert store.get(abandoned) is None
+    assert version == 0
+
+
+def test_event_stream_resumes_after_last_event_id():
+    # Arrange
+    store = get_result_store()
+    result_id = store.create()
+    for preference_score in (1, 2):
+        store.publish(result_id, _result(preference_score))
+    store.publish(result_id, _result(3), done=True)
+
+    # Act
+    events = list(FieldOptimizerService.progressive_events(result_id, last_event_id=1))
+
+    # Assert
+    assert [event.split("\n")[0] for event in events[:2]] == ["id: 2", "id: 3"]
+    assert '"type":"done","version":3' in events[2]
+    assert len(events) == 3
+
+
+def test_background_phase_keeps_the_plain_solve_budget():
+    # Act
+    remaining = FieldOptimizerService._remaining_iterations(SOLVE_ITERATIONS, 3)
+    consumed = FieldOptimizerService._remaining_iterations(SOLVE_ITERATIONS, 20)
+
+    # Assert
+    assert [iteration["time"] for iteration in remaining] == [12, 90]
+    assert remaining[0]["gap"] == SOLVE_ITERATIONS[0]["gap"]
+    assert consumed == [{**SOLVE_ITERATIONS[1], "time": 85}]
+
+
+def test_interactive_ticket_is_released_after_first_version(monkeypatch):
+    # Arrange
+    scheduler = SolveScheduler(concurrency=2, interactive_reserved=1, batch_concurrency=1)
+    handed_over = threading.Event()
+    quick = IterationDetail(iteration=0, time_limit=3, gap_limit=0.05, elapsed_ms=3000,
+                            solve_result="limit", preference_score=1, gap_percent=None,
+                            abs_gap=None)
+    monkeypatch.setattr("services.field_optimizer_service.get_solve_scheduler", lambda: scheduler)
+    monkeypatch.setattr(FieldOptimizerService, "_setup_ampl", staticmethod(
+        lambda payload: (object(), SimpleNamespace(capacity_analysis=None), [])))
+    monkeypatch.setattr(FieldOptimizerService, "_solve_iteration", staticmethod(
+        lambda ampl, index, iteration, start_time: quick))
+    monkeypatch.setattr(FieldOptimizerService, "_build_result", staticmethod(
+        lambda *args, **kwargs: _result(1)))
+    monkeypatch.setattr(FieldOptimizerService, "_improve_in_background", staticmethod(
+        lambda *args: handed_over.set()))
+    payload = FieldOptimizerPayload(stadiums=[], teams=[], existing_team_activities=[],
+                                    start_time="17:00", end_time="19:00")
+
+    # Act
+    progressive = asyncio.run(FieldOptimizerService.solve_progressive(payload))
+
+    # Assert
+    assert (progressive.version, progressive.done) == (1, False)
+    assert handed_over.wait(timeout=1)
+    assert scheduler.stats()["interactive"]["running"] == 0
+    assert FieldOptimizerService._background_lane(payload) == "standard"
@@ -0,0 +1,74 @@
+import pytest
+from models.field_optimizer.field_optimizer_payload import (
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from models.field_optimizer.field_optimizer_result import Activity
+from models.field_optimizer.schedule_payload import SchedulePayload
+from models.field_optimizer.field_optimizer_result import Stadium as ResultStadium
+from models.field_optimizer.field_optimizer_result import Team as ResultTeam
+from services.field_optimizer_service import FieldOptimizerService
+
+
+def _team(team_id, min_activities):
+    return Team(
+        id=team_id, name=team_id,
+        min_number_of_activities=min_activities, max_number_of_activities=2,
+        time_range=TimeRange(start_time="17:00", end_time="19:00", day_indexes=[0, 1]),
+        duration=4, size_required=8, priority=1, is_included=True,
+        preferred_stadium_ids=[],
+    )
+
+
+def _activity(team_id, day, start_time, end_time):
+    return Activity(
+        stadium=ResultStadium(id="s1", name="S1"), team=ResultTeam(id=team_id, name=team_id),
+        index_week_day=day, start_time=start_time, end_time=end_time, size=8)
+
+
+def _schedule_payload(activities):
+    return SchedulePayload(
+        payload=FieldOptimizerPayload(
+            stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[])],
+            teams=[_team("a", 2), _team("b", 2)],
+            existing_team_activities=[],
+            start_time="17:00",
+            end_time="19:00",
+            incompatible_groups=[["a", "b"]],
+        ),
+        activities=activities,
+    )
+
+
+def test_schedule_is_scored_by_term():
+    # Arrange: a on Monday and Tuesday, b overlaps a by 30 minutes on Monday
+    schedule_payload = _schedule_payload([
+        _activity("a", 0, "17:00", "18:00"),
+        _activity("a", 1, "17:00", "18:00"),
+        _activity("b", 0, "17:30", "18:30"),
+    ])
+
+    # Act
+    score = FieldOptimizerService.score(schedule_payload)
+
+    # Assert
+    breakdown = score.breakdown
+    assert breakdown.activity == 3
+    assert breakdown.late_start == pytest.approx(-0.02)
+    assert breakdown.adjacent_days == -0.5
+    assert breakdown.incompatible_same_time == -1.0  # two shared 15-minute slots
+    assert breakdown.incompatible_same_day == 0
+    assert breakdown.shortfall == -300  # b is one activity short
+    assert score.preference_score == pytest.approx(sum(breakdown.model_dump().values()))
+    assert [(n.team.id, n.missing_activities) for n in score.activities_not_generated] == [("b", 1.0)]
+
+
+def test_activity_outside_window_is_rejected():
+    # Arrange
+    schedule_payload = _schedule_payload([_activity("a", 0, "18:30", "19:30")])
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="outside the planning window"):
+        FieldOptimizerService.score(schedule_payload)
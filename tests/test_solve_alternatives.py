@@ -0,0 +1,129 @@
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from pydantic import ValidationError
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from models.field_optimizer.field_optimizer_result import IterationDetail
+from services.field_optimizer_service import MAX_ALTERNATIVES, FieldOptimizerService
+from utils.field_optimizer.extract_ampl_solution import AmplSolution
+
+
+class _FakeParam:
+    def __init__(self):
+        self.values = {}
+
+    def set_values(self, values):
+        self.values = dict(values)
+
+
+class _FakeAmpl:
+    """Records the cut data each alternative was solved with."""
+
+    def __init__(self):
+        self.set = {"ALTERNATIVE_CUTS": [], "CUT_STARTS": {}}
+        self.param = {"cut_min_changes": _FakeParam()}
+        self.solved_with = []
+
+    def snapshot(self):
+        cut_ids = list(self.set["ALTERNATIVE_CUTS"])
+        self.solved_with.append({
+            "cut_ids": cut_ids,
+            "cut_starts": {c: list(self.set["CUT_STARTS"][c]) for c in cut_ids},
+            "min_changes": dict(self.param["cut_min_changes"].values),
+        })
+
+
+def _solution(start):
+    return AmplSolution(
+        field_activities=[FieldActivity(field="f1", group="g1", start_timeslot=start,
+                                        end_timeslot=start + 3, duration=4, size=8)],
+        activity_counts={"g1": 1},
+        shortfalls={},
+    )
+
+
+def _run(monkeypatch, ampl, alternatives, convert=lambda solution: ([], [])):
+    solutions = iter(_solution(start) for start in range(2, 100))
+
+    def solve_iteration(ampl, index, iteration, start_time):
+        ampl.snapshot()
+        return IterationDetail(
+            iteration=index, time_limit=iteration["time"], gap_limit=iteration["gap"],
+            elapsed_ms=0, solve_result="solved", preference_score=float(index),
+            gap_percent=None, abs_gap=None)
+
+    monkeypatch.setattr(FieldOptimizerService, "_solve_iteration",
+                        staticmethod(solve_iteration))
+    monkeypatch.setattr(FieldOptimizerService, "_convert_solution",
+                        staticmethod(lambda payload, converted, solution: convert(solution)))
+    monkeypatch.setattr("services.field_optimizer_service.extract_ampl_solution",
+                        lambda ampl, groups, fixed_starts: next(solutions))
+    return FieldOptimizerService._solve_alternatives(
+        ampl,
+        SimpleNamespace(alternatives=alternatives),
+        SimpleNamespace(field_optimizer_input=SimpleNamespace(groups=[])),
+        _solution(1),
+        set(),
+        datetime.now(),
+    )
+
+
+def test_alternatives_are_capped_cut_and_cleaned_up(monkeypatch):
+    # Arrange
+    ampl = _FakeAmpl()
+
+    # Act
+    alternatives = _run(monkeypatch, ampl, alternatives=MAX_ALTERNATIVES + 3)
+
+    # Assert
+    assert len(alternatives) == MAX_ALTERNATIVES
+    assert [a.rank for a in alternatives] == list(range(1, MAX_ALTERNATIVES + 1))
+    assert alternatives[0].preference_score == MAX_ALTERNATIVES - 1
+    last = ampl.solved_with[-1]
+    assert last["cut_ids"] == list(range(1, MAX_ALTERNATIVES + 1))
+    # Every earlier schedule is cut, each needing one of its starts changed
+    assert [starts[0][2] for starts in last["cut_starts"].values()] == [1, 2, 3, 4, 5]
+    assert set(last["min_changes"].values()) == {1}
+    assert ampl.set["ALTERNATIVE_CUTS"] == []
+
+
+def test_unassignable_schedule_is_skipped_but_stays_cut(monkeypatch):
+    # Arrange
+    ampl = _FakeAmpl()
+    def convert(solution):
+        return None if solution.field_activities[0].start_timeslot == 2 else ([], [])
+
+    # Act
+    alternatives = _run(monkeypatch, ampl, alternatives=3, convert=convert)
+
+    # Assert
+    assert len(alternatives) == 2
+    assert [starts[0][2] for starts in ampl.solved_with[-1]["cut_starts"].values()] == [1, 2, 3]
+
+
+def test_cuts_are_removed_when_a_solve_fails(monkeypatch):
+    # Arrange
+    ampl = _FakeAmpl()
+    def fail(solution):
+        raise RuntimeError("solver crashed")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        _run(monkeypatch, ampl, alternatives=2, convert=fail)
+
+    # Assert
+    assert ampl.solved_with[0]["cut_ids"] == [1]
+    assert ampl.set["ALTERNATIVE_CUTS"] == []
+
+
+def test_alternatives_outside_range_are_rejected():
+    # Arrange
+    fields = dict(stadiums=[], teams=[], existing_team_activities=[],
+                  start_time="17:00", end_time="19:00")
+
+    # Act / Assert
+    for alternatives in (-1, MAX_ALTERNATIVES + 1):
+        with pytest.raises(ValidationError):
+            FieldOptimizerPayload(**fields, alternatives=alternatives)
+    assert FieldOptimizerPayload(**fields, alternatives=MAX_ALTERNATIVES).alternatives == 5
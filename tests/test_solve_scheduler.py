@@ -0,0 +1,102 @@
+import asyncio
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from services.field_optimizer_service import FieldOptimizerService
+from utils.field_optimizer.solve_scheduler import SolveScheduler
+
+
+def test_reserved_slot_is_kept_for_interactive_solves():
+    # Arrange
+    scheduler = SolveScheduler(concurrency=2, interactive_reserved=1, batch_concurrency=1)
+
+    # Act
+    standard = scheduler.enqueue("standard", 100)
+    second_standard = scheduler.enqueue("standard", 100)
+    interactive = scheduler.enqueue("interactive", 100)
+
+    # Assert
+    assert standard.admitted
+    assert not second_standard.admitted
+    assert interactive.admitted
+
+
+def test_waiting_batch_is_deferred_behind_later_interactive_solves():
+    # Arrange
+    scheduler = SolveScheduler(concurrency=1, interactive_reserved=0, batch_concurrency=1)
+    running = scheduler.enqueue("standard", 60)
+    batch = scheduler.enqueue("batch", 260)
+    interactive = scheduler.enqueue("interactive", 60)
+
+    # Act
+    positions = (scheduler.position(interactive), scheduler.position(batch))
+    batch_wait = scheduler.estimated_wait_seconds(batch)
+    scheduler.release(running)
+
+    # Assert
+    assert positions == (0, 1)
+    assert batch.initial_position == 0
+    assert 119 < batch_wait <= 120
+    assert interactive.admitted
+    assert not batch.admitted
+
+
+def test_released_waiting_ticket_leaves_the_queue():
+    # Arrange
+    scheduler = SolveScheduler(concurrency=1, interactive_reserved=0, batch_concurrency=1)
+    running = scheduler.enqueue("interactive", 60)
+    abandoned = scheduler.enqueue("interactive", 60)
+    waiting = scheduler.enqueue("interactive", 60)
+
+    # Act
+    scheduler.release(abandoned)
+    scheduler.release(running)
+
+    # Assert
+    assert waiting.admitted
+    assert scheduler.stats()["interactive"] == {"running": 1, "waiting": 0, "limit": 1}
+
+
+def test_async_waiters_are_admitted_from_another_thread():
+    # Arrange: 50 standard solves wait in one thread
+    scheduler = SolveScheduler(concurrency=2, interactive_reserved=1, batch_concurrency=1)
+
+    async def scenario():
+        running = scheduler.enqueue("standard", 60)
+        queued = [scheduler.enqueue("standard", 60) for _ in range(50)]
+        waits = [asyncio.create_task(scheduler.wait_async(t)) for t in queued]
+        interactive = scheduler.enqueue("interactive", 60)
+        interactive_admitted = await scheduler.wait_async(interactive, timeout=0.01)
+        timed_out = await scheduler.wait_async(queued[1], timeout=0.01)
+
+        await asyncio.to_thread(scheduler.release, interactive)
+        await asyncio.to_thread(scheduler.release, running)
+        admitted = await asyncio.wait_for(waits[0], timeout=1)
+        for wait in waits[1:]:
+            wait.cancel()
+        return interactive_admitted, timed_out, admitted
+
+    # Act
+    interactive_admitted, timed_out, admitted = asyncio.run(scenario())
+
+    # Assert
+    assert interactive_admitted
+    assert not timed_out
+    assert admitted
+    assert scheduler.stats()["standard"] == {"running": 1, "waiting": 49, "limit": 1}
+
+
+def test_payload_cannot_raise_its_lane_to_interactive():
+    # Arrange
+    payload = FieldOptimizerPayload(stadiums=[], teams=[], existing_team_activities=[],
+                                    start_time="17:00", end_time="19:00", lane="interactive")
+    extended = payload.model_copy(update={"extended_time": True})
+    lowered = payload.model_copy(update={"lane": "batch"})
+
+    # Act
+    lanes = (
+        FieldOptimizerService._lane(payload, streaming=False),
+        FieldOptimizerService._lane(extended, streaming=True),
+        FieldOptimizerService._lane(lowered, streaming=True),
+    )
+
+    # Assert
+    assert lanes == ("standard", "batch", "batch")
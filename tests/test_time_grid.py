@@ -0,0 +1,52 @@
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from utils.field_optimizer.time_grid import (
+    convert_grid_timeslot_id_to_base,
+    convert_timeslot_id_to_grid,
+    detect_time_grid_minutes,
+)
+
+
+def _payload(start_time="17:00", duration=4, unavailable=(), existing_start=None):
+    return FieldOptimizerPayload(
+        stadiums=[{"id": "s1", "name": "S1", "size": 16,
+                   "unavailable_start_times": list(unavailable)}],
+        teams=[{
+            "id": "t1", "name": "T1",
+            "min_number_of_activities": 1, "max_number_of_activities": 2,
+            "time_range": {"start_time": start_time, "end_time": "20:00", "day_indexes": [0]},
+            "duration": duration, "size_required": 8, "priority": 1,
+            "is_included": True, "preferred_stadium_ids": [],
+        }],
+        existing_team_activities=[] if existing_start is None else [{
+            "team_id": "t1", "team_name": "T1", "stadium_id": "s1", "stadium_name": "S1",
+            "start_timeslot": existing_start, "end_timeslot": existing_start + 3,
+            "duration_slots": 4, "size_required": 8,
+        }],
+        start_time="17:00",
+        end_time="20:00",
+    )
+
+
+def test_coarsest_exact_grid_is_detected():
+    # Act & Assert
+    assert detect_time_grid_minutes(_payload()) == 60
+    assert detect_time_grid_minutes(_payload(start_time="17:30")) == 30
+    assert detect_time_grid_minutes(_payload(duration=2)) == 30
+    assert detect_time_grid_minutes(_payload(duration=3)) == 15
+    assert detect_time_grid_minutes(_payload(existing_start=71)) == 30
+    # Closure of 17:00-17:30 only covers half an hour
+    assert detect_time_grid_minutes(_payload(unavailable=[69, 70])) == 30
+    assert detect_time_grid_minutes(_payload(unavailable=[70])) == 15
+
+
+def test_timeslot_ids_round_trip():
+    # Arrange: Tuesday 17:00 on the 15-minute grid
+    tuesday_17 = 96 + 68 + 1
+
+    # Act
+    hourly = convert_timeslot_id_to_grid(tuesday_17, 60)
+
+    # Assert
+    assert hourly == 24 + 17 + 1
+    assert convert_timeslot_id_to_grid(tuesday_17 + 3, 60) == hourly
+    assert convert_grid_timeslot_id_to_base(hourly, 60) == tuesday_17
@@ -0,0 +1,56 @@
+from utils.field_optimizer import TimeslotIdMemo, get_timeslot_id_memo
+from utils.field_optimizer.convert_time_range_to_timeslot_ids import (
+    convert_time_ranges_to_timeslot_ids,
+)
+from models.field_optimizer.field_optimizer_payload import TimeRange
+from tests.test_convert_time_range_to_timeslot_ids import _build_timeslot_map
+
+
+def test_identical_signatures_share_result():
+    timeslot_map = _build_timeslot_map("16:00", "22:00")
+    memo = TimeslotIdMemo(timeslot_map)
+
+    first = memo.convert_time_range(
+        TimeRange(start_time="17:00", end_time="19:00", day_indexes=[2, 0]), 4)
+    second = memo.convert_time_range(
+        TimeRange(start_time="17:00", end_time="19:00", day_indexes=[0, 2]), 4)
+
+    assert first is second
+    assert isinstance(first, tuple)
+
+
+def test_union_matches_unmemoized_conversion():
+    timeslot_map = _build_timeslot_map("16:00", "22:00")
+    ranges = [
+        TimeRange(start_time="16:00", end_time="18:00", day_indexes=[0, 1]),
+        TimeRange(start_time="17:00", end_time="22:00", day_indexes=[1]),
+    ]
+
+    memoized = TimeslotIdMemo(timeslot_map).convert_time_ranges(ranges, 4)
+
+    assert list(memoized) == convert_time_ranges_to_timeslot_ids(
+        ranges, timeslot_map, 4)
+
+
+def test_memo_is_shared_for_equal_maps():
+    memo = get_timeslot_id_memo(_build_timeslot_map("16:00", "22:00"))
+
+    assert get_timeslot_id_memo(_build_timeslot_map("16:00", "22:00")) is memo
+    assert get_timeslot_id_memo(_build_timeslot_map("15:00", "22:00")) is not memo
+
+
+def test_memo_entries_are_bounded(monkeypatch):
+    monkeypatch.setattr("utils.field_optimizer.timeslot_id_memo.MAX_MEMO_ENTRIES", 2)
+    memo = TimeslotIdMemo(_build_timeslot_map("16:00", "22:00"))
+    ranges = [
+        TimeRange(start_time=start_time, end_time="22:00", day_indexes=[0])
+        for start_time in ("16:00", "17:00", "18:00")
+    ]
+
+    first = memo.convert_time_range(ranges[0], 4)
+    memo.convert_time_range(ranges[1], 4)
+    memo.convert_time_range(ranges[0], 4)
+    memo.convert_time_range(ranges[2], 4)
+
+    assert len(memo._ranges) == 2
+    assert memo.convert_time_range(ranges[0], 4) is first
@@ -0,0 +1,102 @@
+from utils.field_optimizer.build_ampl_data import AmplData
+from utils.field_optimizer.update_ampl_data import requires_model_rebuild, update_ampl_data
+
+
+class RecordingEntity:
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    def __setitem__(self, index, value):
+        self.calls.append((self.name, index, value))
+
+    def set_values(self, values):
+        self.calls.append((self.name, "all", dict(values)))
+
+    def __getitem__(self, index):
+        calls, name = self.calls, self.name
+
+        class Instance:
+            def fix(self, value):
+                calls.append(("fix", name, index))
+
+            def unfix(self):
+                calls.append(("unfix", name, index))
+
+        return Instance()
+
+
+class RecordingAmpl:
+    """Records what update_ampl_data sends, like AMPL's set/param/var accessors."""
+
+    def __init__(self):
+        self.calls = []
+
+    def eval(self, statement):
+        self.calls.append(("eval", None, statement))
+
+    def __getattr__(self, kind):
+        calls = self.calls
+
+        class Accessor:
+            def __getitem__(self, name):
+                return RecordingEntity(calls, name)
+
+            def __setitem__(self, name, value):
+                calls.append((name, None, value))
+
+        return Accessor()
+
+
+def _data(n_min_g1=2, at_g2=(5, 6), fixed=(("y", ("f1", "g1", 5)),), t=(1, 2, 3)):
+    return AmplData(
+        sets={"F": ["f1"], "G": ["g1", "g2"], "T": list(t), "D": [1], "ST": [1],
+              "INCOMPATIBLE_GROUPS_SAME_TIME": []},
+        indexed_sets={"DT": {1: list(t)}, "AT": {"g1": [1, 2], "g2": list(at_g2)}},
+        params={"n_min": {"g1": n_min_g1, "g2": 1},
+                "start_value": {("f1", "g2", start): 1.0 for start in at_g2}},
+        fixed_variables=list(fixed),
+    )
+
+
+def test_only_changed_values_are_sent():
+    # Arrange
+    ampl = RecordingAmpl()
+    previous = _data()
+    data = _data(n_min_g1=3, at_g2=(6,), fixed=(("y", ("f1", "g2", 6)),))
+
+    # Act
+    changes = update_ampl_data(ampl, previous, data)
+
+    # Assert
+    assert sorted(ampl.calls, key=repr) == sorted([
+        ("AT", "g2", [6]),
+        ("n_min", "g1", 3),
+        ("eval", None, "reset data start_value;"),
+        ("start_value", "all", {("f1", "g2", 6): 1.0}),
+        ("unfix", "y", ("f1", "g1", 5)),
+        ("fix", "y", ("f1", "g2", 6)),
+    ], key=repr)
+    assert changes == 5
+
+
+def test_removed_param_entries_are_reset_to_default():
+    # Arrange
+    ampl = RecordingAmpl()
+    previous = _data()
+    previous.params["max_group_size"] = {"f1": 8}
+    data = _data(at_g2=(6,))
+
+    # Act
+    update_ampl_data(ampl, previous, data)
+
+    # Assert: start_value[f1,g2,5] must not keep its old value
+    assert ("eval", None, "reset data start_value;") in ampl.calls
+    assert ("start_value", "all", {("f1", "g2", 6): 1.0}) in ampl.calls
+    assert ("eval", None, "reset data max_group_size;") in ampl.calls
+
+
+def test_changed_timeslots_require_rebuild():
+    # Act & Assert
+    assert not requires_model_rebuild(_data(), _data(n_min_g1=5))
+    assert requires_model_rebuild(_data(), _data(t=(1, 2, 3, 4)))
@@ -0,0 +1,81 @@
+from models.field_optimizer.field_optimizer_payload import (
+    FieldOptimizerPayload,
+    Stadium,
+    Team,
+    TimeRange,
+)
+from models.field_optimizer.field_optimizer_result import Activity
+from models.field_optimizer.field_optimizer_result import Stadium as ResultStadium
+from models.field_optimizer.field_optimizer_result import Team as ResultTeam
+from models.field_optimizer.schedule_payload import SchedulePayload
+from services.field_optimizer_service import FieldOptimizerService
+
+
+def _team(team_id, size_required=8):
+    return Team(
+        id=team_id, name=team_id,
+        min_number_of_activities=1, max_number_of_activities=2,
+        time_range=TimeRange(start_time="17:00", end_time="19:00", day_indexes=[0, 1, 2]),
+        duration=4, size_required=size_required, priority=1, is_included=True,
+        preferred_stadium_ids=[],
+    )
+
+
+def _activity(team_id, day, start_time, end_time):
+    return Activity(
+        stadium=ResultStadium(id="s1", name="S1"), team=ResultTeam(id=team_id, name=team_id),
+        index_week_day=day, start_time=start_time, end_time=end_time, size=8)
+
+
+def _validate(activities):
+    monday_1830 = 18 * 4 + 2 + 1
+    return FieldOptimizerService.validate(SchedulePayload(
+        payload=FieldOptimizerPayload(
+            stadiums=[Stadium(id="s1", name="S1", size=16, unavailable_start_times=[monday_1830])],
+            teams=[_team("a"), _team("b"), _team("c", size_required=16)],
+            existing_team_activities=[],
+            start_time="17:00",
+            end_time="19:00",
+        ),
+        activities=activities,
+    ))
+
+
+def test_feasible_schedule_is_valid():
+    # Act
+    validation = _validate([_activity("a", 0, "17:00", "18:00"), _activity("b", 0, "17:00", "18:00")])
+
+    # Assert
+    assert validation.valid
+    assert validation.violations == []
+
+
+def test_every_violation_is_reported():
+    # Arrange
+    activities = [
+        _activity("a", 0, "17:00", "18:00"),
+        _activity("c", 0, "17:30", "18:30"),
+        _activity("a", 0, "18:00", "19:00"),
+        _activity("a", 1, "17:00", "18:00"),
+        _activity("b", 1, "18:30", "19:00"),
+        _activity("x", 1, "17:00", "18:00"),
+    ]
+
+    # Act
+    validation = _validate(activities)
+
+    # Assert
+    found = {(v.type, tuple(v.activity_indexes)) for v in validation.violations}
+    assert found == {
+        ("unavailable", (2,)),
+        ("start_not_allowed", (4,)),
+        ("duration", (4,)),
+        ("late_start", (4,)),
+        ("unknown_reference", (5,)),
+        ("capacity", (0, 1, 2)),
+        ("one_per_day", (0, 2)),
+        ("max_activities", (0, 2, 3)),
+    }
+    capacity = next(v for v in validation.violations if v.type == "capacity")
+    assert capacity.message == "Stadium 's1' needs 24 of 16 on day 0 17:30-18:30"
+    assert not validation.valid
@@ -0,0 +1,62 @@
+from fastapi.testclient import TestClient
+from services.warmup_service import WarmupService
+
+
+def test_ready_reports_warmup_status(monkeypatch):
+    # Arrange
+    monkeypatch.delenv("AMPL_LICENSE_UUID", raising=False)
+    import main
+    monkeypatch.setattr(WarmupService, "start_in_background", staticmethod(lambda: None))
+    client = TestClient(main.app)
+
+    # Act
+    WarmupService.run(solve=False)
+    response = client.get("/ready")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert set(response.json()["steps"]) == {"activate_license", "prime_caches"}
+
+
+def test_failed_warmup_solve_is_retried_then_degraded(monkeypatch):
+    # Arrange
+    attempts = []
+    def fail():
+        attempts.append(1)
+        raise RuntimeError("solver unavailable")
+    monkeypatch.setattr(WarmupService, "warmup_solve", staticmethod(fail))
+    monkeypatch.setattr("services.warmup_service.WARMUP_RETRY_BACKOFF_SECONDS", 0)
+    import main
+    monkeypatch.setattr(WarmupService, "start_in_background", staticmethod(lambda: None))
+    client = TestClient(main.app)
+
+    # Act
+    WarmupService.run(solve=True)
+    status = WarmupService.get_status()
+    response = client.get("/ready")
+
+    # Assert
+    assert len(attempts) == 3
+    assert not WarmupService.is_ready()
+    assert status["status"] == "degraded"
+    assert response.status_code == 200
+    assert "solver unavailable" in status["error"]
+
+
+def test_warmup_solve_succeeding_on_retry_is_ready(monkeypatch):
+    # Arrange
+    attempts = []
+    def fail_once():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("license server unreachable")
+    monkeypatch.setattr(WarmupService, "warmup_solve", staticmethod(fail_once))
+    monkeypatch.setattr("services.warmup_service.WARMUP_RETRY_BACKOFF_SECONDS", 0)
+
+    # Act
+    WarmupService.run(solve=True)
+
+    # Assert
+    assert len(attempts) == 2
+    assert WarmupService.is_ready()
@@ -0,0 +1,108 @@
+import gzip
+import msgpack
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from models.field_optimizer.field_optimizer_result import (
+    Activity,
+    AlternativeSchedule,
+    FieldOptimizerResult,
+    Stadium,
+    Team,
+)
+from utils.serialization import (
+    DecodeRequestMiddleware,
+    convert_result_to_compact,
+    decode_request_body,
+    encode_response,
+)
+
+
+def _result(activity_count: int) -> FieldOptimizerResult:
+    stadiums = [Stadium(id=f"s{i}", name=f"Stadium {i}") for i in range(3)]
+    teams = [Team(id=f"t{i}", name=f"Team {i}") for i in range(10)]
+    return FieldOptimizerResult(
+        result="solved",
+        duration_ms=1.0,
+        preference_score=10.0,
+        activities=[
+            Activity(
+                stadium=stadiums[i % 3], team=teams[i % 10],
+                index_week_day=i % 7, start_time="17:00", end_time="18:00", size=8)
+            for i in range(activity_count)
+        ],
+    )
+
+
+def test_compact_result_round_trip():
+    # Arrange
+    result = _result(40)
+
+    # Act
+    compact = convert_result_to_compact(result)
+
+    # Assert
+    assert len(compact.stadiums) == 3
+    assert len(compact.teams) == 10
+    rebuilt = [
+        (compact.stadiums[s].id, compact.teams[t].id, d)
+        for s, t, d in zip(compact.activities.stadium,
+                           compact.activities.team,
+                           compact.activities.index_week_day)
+    ]
+    assert rebuilt == [
+        (a.stadium.id, a.team.id, a.index_week_day) for a in result.activities]
+
+
+def test_compact_alternatives_share_tables():
+    # Arrange
+    result = _result(3)
+    moved = result.activities[0].model_copy(update={"team": Team(id="t99", name="Team 99")})
+    result.alternatives = [AlternativeSchedule(
+        rank=1, preference_score=9.0, activities=[moved] + result.activities[1:])]
+
+    # Act
+    compact = convert_result_to_compact(result)
+
+    # Assert: only the new team is added to the shared table
+    assert [t.id for t in compact.teams] == ["t0", "t1", "t2", "t99"]
+    assert compact.alternatives[0].activities.team == [3, 1, 2]
+
+
+def test_decode_gzip_msgpack_body():
+    body = gzip.compress(msgpack.packb({"a": [1, 2]}))
+
+    decoded = decode_request_body(body, "application/msgpack", "gzip")
+
+    assert orjson.loads(decoded) == {"a": [1, 2]}
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(DecodeRequestMiddleware)
+
+    @app.post("/echo")
+    async def echo(payload: dict, request: Request):
+        return encode_response(_result(payload["activities"]), request)
+
+    return TestClient(app)
+
+
+def test_msgpack_request_and_response():
+    response = _client().post(
+        "/echo",
+        content=msgpack.packb({"activities": 2}),
+        headers={"Content-Type": "application/msgpack", "Accept": "application/msgpack"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert len(msgpack.unpackb(response.content)["activities"]) == 2
+
+
+def test_large_response_is_gzipped():
+    response = _client().post(
+        "/echo", json={"activities": 500}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["activities"]) == 500
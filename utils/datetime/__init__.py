@@ -1,9 +1,14 @@
+from utils.datetime.time_string_to_minutes import time_string_to_minutes
+from utils.datetime.minutes_to_time_string import minutes_to_time_string
 from utils.datetime.add_minutes_to_time_string import add_minutes_to_time_string
 from utils.datetime.convert_time_to_datetime import convert_time_to_datetime
-from utils.datetime.is_time_between import is_time_between
+from utils.datetime.is_time_between import is_minute_between, is_time_between
 
 __all__ = [
     "add_minutes_to_time_string",
     "convert_time_to_datetime",
+    "is_minute_between",
     "is_time_between",
+    "minutes_to_time_string",
+    "time_string_to_minutes",
 ]
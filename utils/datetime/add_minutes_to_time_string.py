@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from utils.datetime.minutes_to_time_string import minutes_to_time_string
+from utils.datetime.time_string_to_minutes import time_string_to_minutes
 
 
 def add_minutes_to_time_string(time_str: str, minutes: int) -> str:
@@ -12,11 +13,4 @@ def add_minutes_to_time_string(time_str: str, minutes: int) -> str:
     Returns:
         Time string in HH:MM format
     """
-    # Parse the time string
-    time_obj = datetime.strptime(time_str, "%H:%M")
-    
-    # Add the minutes
-    new_time = time_obj + timedelta(minutes=minutes)
-    
-    # Return as time string
-    return new_time.strftime("%H:%M")
+    return minutes_to_time_string(time_string_to_minutes(time_str) + minutes)
@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime, time
+from utils.datetime.time_string_to_minutes import time_string_to_minutes
 
 
 def convert_time_to_datetime(time_str: str) -> datetime:
     """
     Convert a time string (HH:MM) to a datetime object with today's date.
     """
-    hours, minutes = map(int, time_str.split(":"))
-    date = datetime.now().replace(hour=hours, minute=minutes, second=0, microsecond=0)
-    return date
+    hours, minutes = divmod(time_string_to_minutes(time_str), 60)
+    return datetime.combine(date.today(), time(hours, minutes))
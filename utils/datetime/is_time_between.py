@@ -1,4 +1,15 @@
-from datetime import time
+from utils.datetime.time_string_to_minutes import time_string_to_minutes
+
+
+def is_minute_between(minutes: int, from_minutes: int, to_minutes: int) -> bool:
+    """
+    Minute-of-day variant of is_time_between.
+    Handles cases where the range crosses midnight.
+    """
+    if from_minutes <= to_minutes:
+        return from_minutes <= minutes < to_minutes
+    else:
+        return minutes >= from_minutes or minutes < to_minutes
 
 
 def is_time_between(time_str: str, from_time: str, to_time: str) -> bool:
@@ -14,11 +25,8 @@ def is_time_between(time_str: str, from_time: str, to_time: str) -> bool:
     Returns:
         True if the time is between the start and end times, False otherwise
     """
-    t = time.fromisoformat(time_str)
-    start = time.fromisoformat(from_time)
-    end = time.fromisoformat(to_time)
-
-    if start <= end:
-        return start <= t < end
-    else:
-        return t >= start or t < end
+    return is_minute_between(
+        time_string_to_minutes(time_str),
+        time_string_to_minutes(from_time),
+        time_string_to_minutes(to_time)
+    )
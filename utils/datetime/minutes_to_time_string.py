@@ -0,0 +1,16 @@
+MINUTES_PER_DAY = 24 * 60
+
+
+def minutes_to_time_string(minutes: int) -> str:
+    """
+    Convert minutes since midnight to a time string.
+    Values past midnight wrap around to the next day.
+
+    Args:
+        minutes: Minute of day
+
+    Returns:
+        Time string in HH:MM format
+    """
+    hours, minutes = divmod(minutes % MINUTES_PER_DAY, 60)
+    return f"{hours:02d}:{minutes:02d}"
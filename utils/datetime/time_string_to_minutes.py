@@ -0,0 +1,12 @@
+def time_string_to_minutes(time_str: str) -> int:
+    """
+    Convert a time string to minutes since midnight.
+
+    Args:
+        time_str: Time in HH:MM format ("24:00" is accepted as end of day)
+
+    Returns:
+        Minute of day
+    """
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
@@ -10,11 +10,110 @@ from utils.field_optimizer.convert_field_allocations_to_activities import (
 from utils.field_optimizer.convert_payload_to_input import (
     convert_payload_to_input
 )
+from utils.field_optimizer.extract_ampl_solution import (
+    AmplSolution,
+    extract_ampl_solution,
+    extract_variable_values_solution
+)
+from utils.field_optimizer.time_grid import (
+    convert_grid_timeslot_id_to_base,
+    convert_timeslot_id_to_grid,
+    detect_time_grid_minutes
+)
+from utils.field_optimizer.objective_coefficients import (
+    StartCoefficients,
+    compute_start_coefficients,
+    get_timeslot_minutes
+)
+from utils.field_optimizer.convert_result_activities_to_starts import (
+    convert_result_activities_to_starts
+)
+from utils.field_optimizer.analyze_capacity import (
+    analyze_capacity
+)
+from utils.field_optimizer.field_occupancy import (
+    FieldOccupancy
+)
+from utils.field_optimizer.validate_schedule import (
+    validate_schedule
+)
+from utils.field_optimizer.score_schedule import (
+    ScoredSchedule,
+    score_schedule
+)
+from utils.field_optimizer.build_alternative_cuts import (
+    AlternativeCuts,
+    build_alternative_cuts
+)
+from utils.field_optimizer.find_incompatible_cliques import (
+    find_incompatible_cliques
+)
+from utils.field_optimizer.find_symmetry_pairs import (
+    find_interchangeable_field_classes,
+    find_symmetric_field_pairs,
+    find_symmetric_group_pairs
+)
+from utils.field_optimizer.pool_identical_fields import (
+    FieldPool,
+    assign_pooled_activities,
+    pool_identical_fields
+)
+from utils.field_optimizer.build_ampl_data import (
+    AmplData,
+    build_ampl_data,
+    fingerprint_ampl_data
+)
+from utils.field_optimizer.load_ampl_data import (
+    load_ampl_data
+)
+from utils.field_optimizer.read_ampl_sol_file import (
+    SolFile,
+    parse_ampl_variable_name,
+    read_ampl_sol_file
+)
+from utils.field_optimizer.update_ampl_data import (
+    requires_model_rebuild,
+    update_ampl_data
+)
+from utils.field_optimizer.ampl_lifecycle import (
+    AmplLifecycle,
+    get_ampl_lifecycle,
+    get_solver_memory_limit_mb
+)
+from utils.field_optimizer.solve_scheduler import (
+    SolveScheduler,
+    SolveTicket,
+    get_solve_scheduler
+)
+from utils.field_optimizer.result_store import (
+    ResultStore,
+    StoredResult,
+    get_result_store
+)
+from utils.field_optimizer.ampl_session_pool import (
+    AmplSession,
+    AmplSessionPool,
+    estimate_session_bytes,
+    get_ampl_session_pool
+)
+from utils.field_optimizer.ampl_problem_cache import (
+    CachedProblem,
+    evict_cached_problems,
+    get_problem_cache_dir,
+    get_problem_cache_limits,
+    lookup_cached_problem,
+    write_problem_to_cache
+)
 from utils.field_optimizer.convert_time_range_to_timeslot_ids import (
     convert_time_range_to_timeslot_ids
 )
+from utils.field_optimizer.timeslot_id_memo import (
+    TimeslotIdMemo,
+    get_timeslot_id_memo
+)
 from utils.field_optimizer.handle_existing_activities import (
-    build_aat_map
+    build_aat_map,
+    preprocess_existing_activities
 )
 
 __all__ = [
@@ -23,5 +122,60 @@ __all__ = [
     "convert_field_allocations_to_activities",
     "convert_payload_to_input",
     "convert_time_range_to_timeslot_ids",
+    "AmplSolution",
+    "extract_ampl_solution",
+    "extract_variable_values_solution",
+    "convert_grid_timeslot_id_to_base",
+    "convert_timeslot_id_to_grid",
+    "detect_time_grid_minutes",
+    "convert_result_activities_to_starts",
+    "analyze_capacity",
+    "FieldOccupancy",
+    "validate_schedule",
+    "ScoredSchedule",
+    "score_schedule",
+    "StartCoefficients",
+    "compute_start_coefficients",
+    "get_timeslot_minutes",
+    "AlternativeCuts",
+    "build_alternative_cuts",
+    "find_incompatible_cliques",
+    "find_interchangeable_field_classes",
+    "find_symmetric_field_pairs",
+    "find_symmetric_group_pairs",
+    "FieldPool",
+    "assign_pooled_activities",
+    "pool_identical_fields",
+    "AmplData",
+    "build_ampl_data",
+    "fingerprint_ampl_data",
+    "load_ampl_data",
+    "SolFile",
+    "parse_ampl_variable_name",
+    "read_ampl_sol_file",
+    "requires_model_rebuild",
+    "update_ampl_data",
+    "AmplSession",
+    "AmplSessionPool",
+    "estimate_session_bytes",
+    "get_ampl_session_pool",
+    "AmplLifecycle",
+    "get_ampl_lifecycle",
+    "get_solver_memory_limit_mb",
+    "SolveScheduler",
+    "SolveTicket",
+    "get_solve_scheduler",
+    "ResultStore",
+    "StoredResult",
+    "get_result_store",
+    "CachedProblem",
+    "evict_cached_problems",
+    "get_problem_cache_dir",
+    "get_problem_cache_limits",
+    "lookup_cached_problem",
+    "write_problem_to_cache",
     "build_aat_map",
+    "preprocess_existing_activities",
+    "TimeslotIdMemo",
+    "get_timeslot_id_memo",
 ]
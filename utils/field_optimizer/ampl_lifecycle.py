@@ -0,0 +1,177 @@
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import weakref
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+# Memory limit of each SCIP run in MB (lim:memory); unset leaves SCIP unbounded
+AMPL_SOLVER_MEMORY_MB_ENV = "AMPL_SOLVER_MEMORY_MB"
+
+# Opt-in: stop the worker with SIGTERM after this many solves or once its
+# RSS exceeds this many MB, so the process manager replaces it with a fresh
+# one. Only done under a supervisor: uvicorn --workers is detected, other
+# managers that restart stopped workers (gunicorn) are declared with
+# AMPL_RECYCLE_SUPERVISED=1. A lone uvicorn process would stop the
+# container. In-flight progressive results are lost with the worker.
+AMPL_RECYCLE_WORKERS_ENV = "AMPL_RECYCLE_WORKERS"
+AMPL_RECYCLE_SUPERVISED_ENV = "AMPL_RECYCLE_SUPERVISED"
+AMPL_RECYCLE_AFTER_SOLVES_ENV = "AMPL_RECYCLE_AFTER_SOLVES"
+AMPL_RECYCLE_RSS_MB_ENV = "AMPL_RECYCLE_RSS_MB"
+DEFAULT_RECYCLE_AFTER_SOLVES = 500
+DEFAULT_RECYCLE_RSS_MB = 2048
+
+
+def get_solver_memory_limit_mb() -> int | None:
+    """SCIP lim:memory from the environment, or None."""
+    value = os.getenv(AMPL_SOLVER_MEMORY_MB_ENV)
+    return int(value) if value else None
+
+
+def _current_rss_mb() -> float:
+    """Resident memory of this process in MB (peak where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _is_supervised() -> bool:
+    """Whether a process manager replaces this worker when it stops: a
+    multiprocessing child (uvicorn --workers) or declared in the env."""
+    return (multiprocessing.parent_process() is not None
+            or os.getenv(AMPL_RECYCLE_SUPERVISED_ENV, "0") == "1")
+
+
+class AmplLifecycle:
+    """
+    Counts the AMPL instances of this process from creation to close.
+
+    An instance that is garbage collected without close() is counted as
+    leaked; its AMPL process may outlive it. With recycling enabled, the
+    worker asks to be replaced once it reached its solve or RSS limit.
+    """
+
+    def __init__(self, recycle: bool, recycle_after_solves: int, recycle_rss_mb: float,
+                 supervised: bool = True):
+        self.recycle = recycle
+        self.supervised = supervised
+        self.recycle_after_solves = recycle_after_solves
+        self.recycle_rss_mb = recycle_rss_mb
+        self._open: set[int] = set()
+        self._created = 0
+        self._closed = 0
+        self._leaked = 0
+        self._close_failures = 0
+        self._solves = 0
+        self._recycle_requested = False
+        self._lock = Lock()
+
+    def track(self, ampl: "AMPL") -> "AMPL":
+        """Count a newly created instance as open and return it."""
+        key = id(ampl)
+        with self._lock:
+            self._created += 1
+            self._open.add(key)
+        try:
+            weakref.finalize(ampl, self._collected, key)
+        except TypeError:
+            pass
+        return ampl
+
+    def close(self, ampl: "AMPL"):
+        """Close an instance and stop tracking it; failures are logged."""
+        with self._lock:
+            self._open.discard(id(ampl))
+            self._closed += 1
+        try:
+            ampl.close()
+        except Exception as e:
+            with self._lock:
+                self._close_failures += 1
+            logger.warning("Could not close AMPL instance: %s", e)
+
+    def record_solve(self):
+        with self._lock:
+            self._solves += 1
+
+    def request_recycle_if_due(self) -> bool:
+        """
+        With recycling enabled and a limit reached, send SIGTERM to this
+        worker once; uvicorn finishes the requests in flight before exiting,
+        but background progressive solves and their stored results are
+        lost. Without a supervisor to start a new worker the limit is only
+        logged.
+
+        Returns:
+            True if the worker was asked to stop by this call
+        """
+        if not self.recycle:
+            return False
+        rss_mb = _current_rss_mb()
+        with self._lock:
+            if self._recycle_requested:
+                return False
+            if self._solves < self.recycle_after_solves and rss_mb < self.recycle_rss_mb:
+                return False
+            self._recycle_requested = True
+            solves = self._solves
+        if not self.supervised:
+            logger.warning("Worker %d reached its recycle limit after %d solves at %.0f MB "
+                           "RSS, but no process manager would replace it; not recycling",
+                           os.getpid(), solves, rss_mb)
+            return False
+        logger.warning("Recycling worker %d after %d solves at %.0f MB RSS",
+                       os.getpid(), solves, rss_mb)
+        os.kill(os.getpid(), signal.SIGTERM)
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "created": self._created,
+                "closed": self._closed,
+                "open": len(self._open),
+                "leaked": self._leaked,
+                "close_failures": self._close_failures,
+                "solves": self._solves,
+                "rss_mb": round(_current_rss_mb(), 1),
+                "recycle_supervised": self.supervised,
+                "recycle_limit_reached": self._recycle_requested,
+                "recycle_requested": self._recycle_requested and self.supervised,
+            }
+
+    def _collected(self, key: int):
+        with self._lock:
+            if key in self._open:
+                self._open.discard(key)
+                self._leaked += 1
+                logger.warning("AMPL instance was garbage collected without close()")
+
+
+_shared_lifecycle: AmplLifecycle | None = None
+_shared_lifecycle_lock = Lock()
+
+
+def get_ampl_lifecycle() -> AmplLifecycle:
+    """The process-wide AMPL lifecycle, configured from the environment."""
+    global _shared_lifecycle
+    with _shared_lifecycle_lock:
+        if _shared_lifecycle is None:
+            _shared_lifecycle = AmplLifecycle(
+                recycle=os.getenv(AMPL_RECYCLE_WORKERS_ENV, "0") == "1",
+                recycle_after_solves=int(os.getenv(
+                    AMPL_RECYCLE_AFTER_SOLVES_ENV, DEFAULT_RECYCLE_AFTER_SOLVES)),
+                recycle_rss_mb=float(os.getenv(AMPL_RECYCLE_RSS_MB_ENV, DEFAULT_RECYCLE_RSS_MB)),
+                supervised=_is_supervised(),
+            )
+        return _shared_lifecycle
@@ -0,0 +1,274 @@
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from utils.field_optimizer.read_ampl_sol_file import (
+    SolFile,
+    parse_ampl_variable_name,
+    read_ampl_sol_file,
+)
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+# Directory for generated problems; the cache is off when unset
+AMPL_PROBLEM_CACHE_DIR_ENV = "AMPL_PROBLEM_CACHE_DIR"
+
+# Bounds of the cache directory; the least recently used entries are
+# removed first once an entry is written
+AMPL_PROBLEM_CACHE_MAX_MB_ENV = "AMPL_PROBLEM_CACHE_MAX_MB"
+DEFAULT_CACHE_MAX_MB = 2048
+AMPL_PROBLEM_CACHE_MAX_ENTRIES_ENV = "AMPL_PROBLEM_CACHE_MAX_ENTRIES"
+DEFAULT_CACHE_MAX_ENTRIES = 200
+
+# Files of an entry; .nl is moved into place last
+ENTRY_SUFFIXES = (".fix", ".col", ".nl")
+
+# Temporary files older than this are left over from a crashed write
+STALE_TMP_SECONDS = 3600
+
+# Extra time the solver process gets on top of lim:time before it is killed
+SOLVER_TIMEOUT_MARGIN_SECONDS = 30
+
+
+def get_problem_cache_dir() -> Path | None:
+    """Cache directory from AMPL_PROBLEM_CACHE_DIR, or None when disabled."""
+    cache_dir = os.getenv(AMPL_PROBLEM_CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _find_solver(name: str) -> str:
+    solver = shutil.which(name)
+    if solver:
+        return solver
+    from amplpy import modules
+
+    solver = modules.find(name)
+    if not solver:
+        raise RuntimeError(f"Solver {name} not found")
+    return solver
+
+
+class CachedProblem:
+    """
+    A generated problem from the cache, solved by running the solver binary
+    directly instead of through AMPL: the presolved .nl, the .col names of
+    its variables and the .fix values of variables presolve removed.
+    """
+
+    def __init__(self, stub: Path):
+        self.stub = stub
+        self.last_sol: SolFile | None = None
+        self._variables: list[tuple[str, tuple]] | None = None
+
+    @property
+    def nl_path(self) -> Path:
+        return self.stub.with_suffix(".nl")
+
+    @property
+    def col_path(self) -> Path:
+        return self.stub.with_suffix(".col")
+
+    @property
+    def fix_path(self) -> Path:
+        return self.stub.with_suffix(".fix")
+
+    def solve(self, scip_options: str, time_limit: float) -> SolFile:
+        """
+        Run SCIP on the cached problem in a private directory, so concurrent
+        requests for the same problem do not share a .sol file.
+
+        Args:
+            scip_options: Value for scip_options, as set on AMPL otherwise
+            time_limit: lim:time in seconds, used to bound the process
+
+        Returns:
+            The parsed solution, also kept as last_sol
+        """
+        solver = _find_solver("scip")
+        with tempfile.TemporaryDirectory(prefix="ampl-cached-") as work_dir:
+            problem = Path(work_dir) / "problem"
+            os.symlink(self.nl_path.resolve(), problem.with_suffix(".nl"))
+            completed = subprocess.run(
+                [solver, str(problem), "-AMPL"],
+                cwd=work_dir,
+                env={**os.environ, "scip_options": scip_options},
+                capture_output=True,
+                text=True,
+                timeout=time_limit + SOLVER_TIMEOUT_MARGIN_SECONDS,
+            )
+            sol_path = problem.with_suffix(".sol")
+            if not sol_path.exists():
+                raise RuntimeError(
+                    f"Solver wrote no solution (exit code {completed.returncode}): "
+                    f"{completed.stderr.strip() or completed.stdout.strip()}")
+            self.last_sol = read_ampl_sol_file(sol_path)
+        return self.last_sol
+
+    def variable_values(self) -> dict[str, dict[tuple, float]]:
+        """Values of the last solve per variable name and index."""
+        if self.last_sol is None:
+            return {}
+        if self._variables is None:
+            self._variables = [
+                parse_ampl_variable_name(line)
+                for line in self.col_path.read_text().splitlines()
+                if line
+            ]
+
+        values: dict[str, dict[tuple, float]] = {}
+        for (name, index), value in zip(self._variables, self.last_sol.variable_values):
+            values.setdefault(name, {})[index] = value
+        for (name, index), value in self._presolved_values():
+            values.setdefault(name, {})[index] = value
+        return values
+
+    def _presolved_values(self) -> list[tuple[tuple[str, tuple], float]]:
+        """Variables presolve fixed and removed from the .nl, with their value."""
+        if not self.fix_path.exists():
+            return []
+        presolved = []
+        for line in self.fix_path.read_text().splitlines():
+            if line:
+                value, name = line.split("\t", 1)
+                presolved.append((parse_ampl_variable_name(name), float(value)))
+        return presolved
+
+
+def lookup_cached_problem(cache_dir: Path, fingerprint: str) -> CachedProblem | None:
+    """The cached problem for a fingerprint, or None on a miss. A hit marks
+    the entry as recently used."""
+    problem = CachedProblem(cache_dir / fingerprint)
+    # .nl is moved into place last, so its presence implies a complete entry
+    if problem.nl_path.exists() and problem.col_path.exists():
+        try:
+            os.utime(problem.nl_path)
+        except OSError:
+            return None
+        return problem
+    return None
+
+
+def get_problem_cache_limits() -> tuple[int, int]:
+    """(max bytes, max entries) of the cache from the environment."""
+    max_mb = int(os.getenv(AMPL_PROBLEM_CACHE_MAX_MB_ENV, DEFAULT_CACHE_MAX_MB))
+    max_entries = int(os.getenv(AMPL_PROBLEM_CACHE_MAX_ENTRIES_ENV, DEFAULT_CACHE_MAX_ENTRIES))
+    return max_mb * 1024 * 1024, max_entries
+
+
+def evict_cached_problems(cache_dir: Path, max_bytes: int, max_entries: int) -> int:
+    """
+    Remove the least recently used entries (by .nl mtime, refreshed on
+    every hit) until the cache is within both bounds, and temporary files
+    of crashed writes.
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Total size the entries may take
+        max_entries: Entries kept at most
+
+    Returns:
+        Number of entries removed
+    """
+    now = time.time()
+    entries = []
+    for path in cache_dir.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if ".tmp" in path.suffixes:
+            if now - stat.st_mtime > STALE_TMP_SECONDS:
+                path.unlink(missing_ok=True)
+            continue
+        if path.suffix == ".nl":
+            stub = path.with_suffix("")
+            size = sum(
+                stub.with_suffix(suffix).stat().st_size
+                for suffix in ENTRY_SUFFIXES if stub.with_suffix(suffix).exists()
+            )
+            entries.append((stat.st_mtime, stub, size))
+
+    entries.sort()
+    total_bytes = sum(size for _, _, size in entries)
+    removed = 0
+    for _, stub, size in entries:
+        if len(entries) - removed <= max_entries and total_bytes <= max_bytes:
+            break
+        # .nl first, so lookups see an incomplete entry from now on
+        for suffix in reversed(ENTRY_SUFFIXES):
+            stub.with_suffix(suffix).unlink(missing_ok=True)
+        total_bytes -= size
+        removed += 1
+    if removed:
+        logger.info("Evicted %d cached problems, %d bytes remain", removed, total_bytes)
+    return removed
+
+
+def _presolved_variables(ampl: "AMPL") -> list[tuple[str, float]]:
+    """
+    Names and values of the variables AMPL presolve removed from the
+    problem it wrote last. Each must be fixed (equal presolved bounds),
+    otherwise its value is only known after AMPL's own postsolve and the
+    problem cannot be solved without AMPL.
+    """
+    substituted = ampl.get_value("card {j in 1.._nvars: _var[j].astatus = 'sub'}")
+    if substituted:
+        raise RuntimeError(f"{int(substituted)} variables were substituted out")
+    presolved = []
+    rows = ampl.get_data(
+        "{j in 1.._nvars: _var[j].astatus = 'pre'} (_varname[j], _var[j].lb2, _var[j].ub2)"
+    ).to_list()
+    for _, name, lower, upper in rows:
+        if abs(upper - lower) > 1e-9:
+            raise RuntimeError(f"Presolve removed {name} without fixing it")
+        presolved.append((name, lower))
+    return presolved
+
+
+def write_problem_to_cache(ampl: "AMPL", cache_dir: Path, fingerprint: str) -> bool:
+    """
+    Write the generated, presolved problem of a loaded model to the cache,
+    then evict least recently used entries beyond the cache bounds.
+
+    The .col names the variables of the presolved problem; the values of
+    variables presolve fixed and removed are kept in .fix so a cached
+    solution maps back onto every variable.
+
+    Args:
+        ampl: AMPL instance with model and data loaded
+        cache_dir: Cache directory
+        fingerprint: fingerprint_ampl_data of the loaded data
+
+    Returns:
+        True when the entry was written
+    """
+    stub = cache_dir / fingerprint
+    tmp_stub = cache_dir / f"{fingerprint}.{os.getpid()}-{threading.get_ident()}.tmp"
+    previous_auxfiles = ampl.option["auxfiles"]
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        ampl.option["auxfiles"] = "c"
+        escaped = str(tmp_stub).replace("'", "''")
+        ampl.eval(f"write ('g' & '{escaped}');")
+        Path(f"{tmp_stub}.fix").write_text("".join(
+            f"{value!r}\t{name}\n" for name, value in _presolved_variables(ampl)))
+        for suffix in ENTRY_SUFFIXES:
+            os.replace(f"{tmp_stub}{suffix}", stub.with_suffix(suffix))
+        logger.info("Cached generated problem %s", fingerprint[:12])
+        evict_cached_problems(cache_dir, *get_problem_cache_limits())
+        return True
+    except Exception as e:
+        logger.warning("Could not cache generated problem %s: %s", fingerprint[:12], e)
+        return False
+    finally:
+        ampl.option["auxfiles"] = previous_auxfiles
+        for suffix in ENTRY_SUFFIXES:
+            Path(f"{tmp_stub}{suffix}").unlink(missing_ok=True)
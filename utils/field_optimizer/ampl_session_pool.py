@@ -0,0 +1,154 @@
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+from utils.field_optimizer.ampl_lifecycle import get_ampl_lifecycle
+from utils.field_optimizer.build_ampl_data import AmplData
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+# Idle sessions kept at most; 0 disables sticky sessions
+AMPL_SESSION_POOL_SIZE_ENV = "AMPL_SESSION_POOL_SIZE"
+DEFAULT_POOL_SIZE = 4
+
+# Estimated memory all idle sessions together may hold
+AMPL_SESSION_MEMORY_MB_ENV = "AMPL_SESSION_MEMORY_MB"
+DEFAULT_MEMORY_MB = 1024
+
+# Rough AMPL footprint per x/y variable, including its share of the
+# generated constraints (measured on large clubs, order of magnitude only)
+ESTIMATED_BYTES_PER_VARIABLE = 2048
+
+
+def estimate_session_bytes(data: AmplData) -> int:
+    """Estimated memory of an AMPL session holding data."""
+    variables = 2 * len(data.sets["F"]) * len(data.sets["G"]) * len(data.sets["T"])
+    return variables * ESTIMATED_BYTES_PER_VARIABLE
+
+
+@dataclass(slots=True)
+class AmplSession:
+    """A live AMPL instance for one session key and the data it holds"""
+    key: str
+    ampl: "AMPL"
+    data: AmplData
+    estimated_bytes: int
+    solves: int = 0
+
+
+class AmplSessionPool:
+    """
+    Idle AMPL sessions per key, bounded by count and estimated memory (LRU).
+
+    A session is checked out for the duration of one request; a concurrent
+    request for the same key finds no idle session and builds its own.
+    """
+
+    def __init__(self, max_sessions: int, memory_budget_bytes: int):
+        self.max_sessions = max_sessions
+        self.memory_budget_bytes = memory_budget_bytes
+        self._idle: OrderedDict[str, AmplSession] = OrderedDict()
+        self._in_use: dict[int, AmplSession] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_sessions > 0
+
+    def checkout(self, key: str) -> AmplSession | None:
+        """Take the idle session for key, or None."""
+        with self._lock:
+            session = self._idle.pop(key, None)
+            if session is not None:
+                self._in_use[id(session.ampl)] = session
+            return session
+
+    def register(self, session: AmplSession):
+        """Track a newly built session as checked out."""
+        with self._lock:
+            self._in_use[id(session.ampl)] = session
+
+    def release(self, ampl: "AMPL", reusable: bool) -> bool:
+        """
+        Return a checked out session. Reusable sessions become idle (most
+        recently used); others, and sessions evicted to stay within the
+        bounds, are closed.
+
+        Args:
+            ampl: AMPL instance of the session
+            reusable: Whether the session holds a consistent, solved model
+
+        Returns:
+            False if ampl does not belong to the pool
+        """
+        to_close = []
+        with self._lock:
+            session = self._in_use.pop(id(ampl), None)
+            if session is None:
+                return False
+
+            if not reusable:
+                to_close.append(session)
+            else:
+                session.solves += 1
+                replaced = self._idle.pop(session.key, None)
+                if replaced is not None:
+                    to_close.append(replaced)
+                self._idle[session.key] = session
+                while self._idle and (
+                    len(self._idle) > self.max_sessions
+                    or self._idle_bytes() > self.memory_budget_bytes
+                ):
+                    _, evicted = self._idle.popitem(last=False)
+                    logger.info("Evicting AMPL session %s", evicted.key)
+                    to_close.append(evicted)
+
+        for closing in to_close:
+            _close_session(closing)
+        return True
+
+    def clear(self):
+        """Close every idle session."""
+        with self._lock:
+            sessions = list(self._idle.values())
+            self._idle.clear()
+        for session in sessions:
+            _close_session(session)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "estimated_bytes": self._idle_bytes(),
+            }
+
+    def _idle_bytes(self) -> int:
+        return sum(session.estimated_bytes for session in self._idle.values())
+
+
+def _close_session(session: AmplSession):
+    logger.debug("Closing AMPL session %s", session.key)
+    get_ampl_lifecycle().close(session.ampl)
+
+
+_shared_pool: AmplSessionPool | None = None
+_shared_pool_lock = Lock()
+
+
+def get_ampl_session_pool() -> AmplSessionPool:
+    """The process-wide session pool, configured from the environment."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = AmplSessionPool(
+                max_sessions=int(os.getenv(AMPL_SESSION_POOL_SIZE_ENV, DEFAULT_POOL_SIZE)),
+                memory_budget_bytes=int(os.getenv(
+                    AMPL_SESSION_MEMORY_MB_ENV, DEFAULT_MEMORY_MB)) * 1024 * 1024,
+            )
+        return _shared_pool
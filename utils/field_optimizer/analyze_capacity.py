@@ -0,0 +1,136 @@
+import numpy as np
+from models.field_optimizer.field_optimizer_result import (
+    CapacityAnalysis,
+    DayCapacity,
+    Team,
+    TeamCapacity,
+)
+from utils.field_optimizer.handle_existing_activities import ProcessedActivity
+
+
+def _open_windows(closed: np.ndarray, day_end: np.ndarray, duration: int) -> np.ndarray:
+    """(F, T) True where an activity of duration slots starting at the column
+    stays within its day and meets no closed slot of the field."""
+    columns = closed.shape[1]
+    closed_before = np.zeros((closed.shape[0], columns + 1), dtype=np.int64)
+    np.cumsum(closed, axis=1, out=closed_before[:, 1:])
+    start = np.arange(columns)
+    end = start + duration
+    within_day = end <= day_end
+    end = np.minimum(end, columns)
+    return within_day & (closed_before[:, end] - closed_before[:, start] == 0)
+
+
+def _min_removed(areas: list[float], excess: float) -> int:
+    """Fewest activities whose areas together cover excess."""
+    removed = 0
+    for area in sorted(areas, reverse=True):
+        if excess <= 0:
+            break
+        excess -= area
+        removed += 1
+    return removed
+
+
+def analyze_capacity(
+    converted_payload,
+    fixed_activities: list[ProcessedActivity]
+) -> CapacityAnalysis:
+    """
+    Bound what any schedule can achieve before the solve. A group starts at
+    most once per day, at a start of AT[g] whose activity fits an open field
+    of sufficient size within the day, so its activities are bounded by
+    n_max and its days with such a start. Per day, field time used is
+    bounded by the open field time and by one activity of every group that
+    can start that day; minimum demand beyond that sum is certain shortfall.
+
+    Args:
+        converted_payload: ConvertedPayload after preprocess_existing_activities
+            and before fields are pooled
+        fixed_activities: Predefined activities from preprocessing, valid
+            starts whatever the field state
+
+    Returns:
+        CapacityAnalysis in size x minutes, listing the teams that cannot
+        reach their minimum
+    """
+    field_optimizer_input = converted_payload.field_optimizer_input
+    fields = field_optimizer_input.fields
+    groups = field_optimizer_input.groups
+    time_slots = field_optimizer_input.time_slots
+    slot_minutes = converted_payload.time_slot_duration_minutes
+
+    timeslots = [t for day_slots in time_slots for t in day_slots]
+    column = {t: i for i, t in enumerate(timeslots)}
+    day_of_column = np.array(
+        [day_idx for day_idx, day_slots in enumerate(time_slots) for _ in day_slots], dtype=int)
+    day_end = np.cumsum([len(day_slots) for day_slots in time_slots])[day_of_column]
+
+    closed = np.zeros((len(fields), len(timeslots)), dtype=bool)
+    for i, f in enumerate(fields):
+        closed[i, [column[t] for t in f.unavailable_start_times if t in column]] = True
+    sizes = np.array([f.size for f in fields], dtype=float)
+
+    # Open field time per day and field
+    open_slots = np.zeros((len(fields), len(time_slots)))
+    np.add.at(open_slots, (slice(None), day_of_column), ~closed)
+    field_supply = open_slots * sizes[:, np.newaxis] * slot_minutes
+
+    fixed_days: dict[str, set[int]] = {}
+    for activity in fixed_activities:
+        fixed_days.setdefault(activity.group_id, set()).add(
+            int(day_of_column[column[activity.start_index]]))
+
+    windows_by_duration: dict[int, np.ndarray] = {}
+    start_days = np.zeros((len(groups), len(time_slots)), dtype=bool)
+    for i, group in enumerate(groups):
+        if group.duration not in windows_by_duration:
+            windows_by_duration[group.duration] = _open_windows(closed, day_end, group.duration)
+        fitting = sizes >= group.size_required
+        starts = np.array([column[t] for t in group.possible_start_times if t in column], dtype=int)
+        valid = windows_by_duration[group.duration][np.ix_(fitting, starts)].any(axis=0)
+        start_days[i, day_of_column[starts[valid]]] = True
+        start_days[i, list(fixed_days.get(group.id, ()))] = True
+
+    areas = np.array([g.size_required * g.duration * slot_minutes for g in groups], dtype=float)
+    n_min = np.array([g.minimum_number_of_activities for g in groups])
+    n_max = np.array([g.maximum_number_of_activities for g in groups])
+    valid_start_days = start_days.sum(axis=1)
+    max_activities = np.minimum(n_max, valid_start_days)
+    reachable_min = np.minimum(n_min, max_activities)
+
+    supply = field_supply.sum(axis=0)
+    max_demand = (start_days * areas[:, np.newaxis]).sum(axis=0)
+    required_demand = float((reachable_min * areas).sum())
+    achievable_supply = float(np.minimum(supply, max_demand).sum())
+
+    team_shortfall = n_min - reachable_min
+    required_areas = [float(area) for area, n in zip(areas, reachable_min) for _ in range(n)]
+    min_total_shortfall = int(team_shortfall.sum()) + _min_removed(
+        required_areas, required_demand - achievable_supply)
+
+    return CapacityAnalysis(
+        required_demand=required_demand,
+        achievable_supply=achievable_supply,
+        max_activities=int(max_activities.sum()),
+        min_total_shortfall=min_total_shortfall,
+        days=[
+            DayCapacity(
+                index_week_day=week_day_index,
+                supply=float(supply[day_idx]),
+                max_demand=float(max_demand[day_idx]),
+                stadiums={f.id: float(field_supply[i, day_idx]) for i, f in enumerate(fields)},
+            )
+            for day_idx, week_day_index in enumerate(field_optimizer_input.week_day_indexes)
+        ],
+        teams=[
+            TeamCapacity(
+                team=Team(id=group.id, name=group.name),
+                valid_start_days=int(valid_start_days[i]),
+                max_activities=int(max_activities[i]),
+                missing_activities=int(team_shortfall[i]),
+            )
+            for i, group in enumerate(groups)
+            if team_shortfall[i] > 0 and not group.id.startswith("__busyblock_")
+        ],
+    )
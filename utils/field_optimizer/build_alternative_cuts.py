@@ -0,0 +1,42 @@
+import math
+from dataclasses import dataclass
+from models.field_optimizer.field_activity import FieldActivity
+
+
+@dataclass(slots=True)
+class AlternativeCuts:
+    """Data of the diversity cuts of field_optimizer.mod, by cut number from 1"""
+    cut_ids: list[int]  # ALTERNATIVE_CUTS
+    cut_starts: dict[int, list[tuple[str, str, int]]]  # CUT_STARTS[c], (f, g, t)
+    min_changes: dict[int, int]  # cut_min_changes[c]
+
+
+def build_alternative_cuts(
+    schedules: list[list[FieldActivity]],
+    min_change_share: float
+) -> AlternativeCuts:
+    """
+    Build one diversity cut per schedule found so far: the next solve must
+    drop at least min_change_share of the starts of each of them, and at
+    least one.
+
+    Args:
+        schedules: Field activities of every earlier schedule, in the order
+            found; predefined starts are not part of them and so never cut
+        min_change_share: Share of a schedule's starts that must change
+
+    Returns:
+        AlternativeCuts for ALTERNATIVE_CUTS, CUT_STARTS and cut_min_changes
+    """
+    cut_starts = {
+        cut: [(a.field, a.group, a.start_timeslot) for a in field_activities]
+        for cut, field_activities in enumerate(schedules, start=1)
+    }
+    return AlternativeCuts(
+        cut_ids=list(cut_starts),
+        cut_starts=cut_starts,
+        min_changes={
+            cut: max(1, math.ceil(len(starts) * min_change_share))
+            for cut, starts in cut_starts.items()
+        },
+    )
@@ -0,0 +1,175 @@
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from utils.field_optimizer.handle_existing_activities import PreprocessedExistingActivities
+from utils.field_optimizer.time_grid import BASE_TIME_SLOT_MINUTES
+from utils.field_optimizer.objective_coefficients import (
+    compute_start_coefficients,
+    get_timeslot_minutes,
+)
+from utils.field_optimizer.find_incompatible_cliques import find_incompatible_cliques
+from utils.field_optimizer.find_symmetry_pairs import (
+    find_symmetric_field_pairs,
+    find_symmetric_group_pairs,
+)
+
+
+@dataclass(slots=True)
+class AmplData:
+    """
+    Everything sent to field_optimizer.mod for one request, in load order.
+
+    Together with the model file this fully determines the generated
+    problem instance, so it doubles as the key of the problem cache.
+    """
+    sets: dict[str, list] = field(default_factory=dict)
+    indexed_sets: dict[str, dict[object, list]] = field(default_factory=dict)
+    params: dict[str, dict[str, float]] = field(default_factory=dict)
+    scalar_params: dict[str, float] = field(default_factory=dict)
+    # (variable, index) pairs fixed to 1: starts and occupancy of existing activities
+    fixed_variables: list[tuple[str, tuple[str, str, int]]] = field(default_factory=list)
+
+
+def _grid_factor(converted_payload) -> int:
+    return converted_payload.time_slot_duration_minutes // BASE_TIME_SLOT_MINUTES
+
+
+def _max_group_sizes(converted_payload) -> dict[str, int]:
+    """Largest group a pooled field admits: the size of one member."""
+    return {pool.id: pool.unit_size for pool in converted_payload.field_pools.values()}
+
+
+def _start_values(
+    converted_payload,
+    aat_map: dict[tuple[str, str], list[int]]
+) -> dict[tuple[str, str, int], float]:
+    """start_value entries for the starts a group can make: t in AT[g], on
+    fields it fits (or holds a predefined activity on)."""
+    field_optimizer_input = converted_payload.field_optimizer_input
+    coefficients = compute_start_coefficients(
+        field_optimizer_input, _grid_factor(converted_payload),
+        get_timeslot_minutes(converted_payload))
+    values = coefficients.start_values()
+    column = {t: i for i, t in enumerate(coefficients.timeslots)}
+    max_group_size = _max_group_sizes(converted_payload)
+
+    start_values = {}
+    for g_idx, group in enumerate(field_optimizer_input.groups):
+        starts = [t for t in group.possible_start_times if t in column]
+        columns = [column[t] for t in starts]
+        for f_idx, f in enumerate(field_optimizer_input.fields):
+            fits = group.size_required <= min(f.size, max_group_size.get(f.id, f.size))
+            if not fits and (f.id, group.id) not in aat_map:
+                continue
+            for t, value in zip(starts, values[f_idx, g_idx, columns].tolist()):
+                start_values[(f.id, group.id, t)] = value
+    return start_values
+
+
+def build_ampl_data(
+    converted_payload,
+    payload: FieldOptimizerPayload,
+    preprocessed: PreprocessedExistingActivities
+) -> AmplData:
+    """
+    Collect the sets, params and fixed variables of the model.
+
+    Args:
+        converted_payload: ConvertedPayload of the request
+        payload: The original payload (explicit incompatible groups)
+        preprocessed: Existing activities indexed by preprocess_existing_activities
+
+    Returns:
+        AmplData ready for load_ampl_data
+    """
+    field_optimizer_input = converted_payload.field_optimizer_input
+    fields = field_optimizer_input.fields
+    groups = field_optimizer_input.groups
+    time_slots = field_optimizer_input.time_slots
+
+    data = AmplData()
+
+    data.sets["F"] = [f.id for f in fields]
+    data.sets["G"] = [g.id for g in groups]
+    data.sets["T"] = [t for day_slots in time_slots for t in day_slots]
+    # Days are numbered by week day (1 = Monday) rather than position, so
+    # ADJ_D only pairs days that really are adjacent when days are left out
+    days = [week_day_index + 1 for week_day_index in field_optimizer_input.week_day_indexes]
+    data.sets["D"] = days
+    data.sets["ST"] = [day_slots[0] for day_slots in time_slots]
+
+    incomp_same_time = list(payload.incompatible_groups or [])
+    incomp_same_time.extend(converted_payload.auto_incompatible_same_time)
+    data.sets["INCOMPATIBLE_GROUPS_SAME_TIME"] = incomp_same_time
+
+    cliques = find_incompatible_cliques(incomp_same_time, groups)
+    data.sets["SAME_TIME_CLIQUES"] = list(range(1, len(cliques) + 1))
+
+    incomp_same_day = list(payload.incompatible_groups_same_day or [])
+    incomp_same_day.extend(converted_payload.auto_incompatible_same_day)
+    data.sets["INCOMPATIBLE_GROUPS_SAME_DAY"] = incomp_same_day
+
+    if payload.break_symmetries:
+        data.sets["GROUP_SYMMETRY_PAIRS"] = find_symmetric_group_pairs(
+            field_optimizer_input, preprocessed.aat_map, incomp_same_time + incomp_same_day)
+        data.sets["FIELD_SYMMETRY_PAIRS"] = find_symmetric_field_pairs(
+            field_optimizer_input, preprocessed.aat_map, _max_group_sizes(converted_payload))
+
+    data.indexed_sets["DT"] = {
+        day: day_slots for day, day_slots in zip(days, time_slots)
+    }
+    data.indexed_sets["SAME_TIME_CLIQUE"] = {
+        c: members for c, members in enumerate(cliques, start=1)
+    }
+    data.indexed_sets["AT"] = {g.id: g.possible_start_times for g in groups}
+    aat_map = preprocessed.aat_map
+    data.indexed_sets["AAT"] = {
+        (f.id, g.id): aat_map.get((f.id, g.id), [])
+        for f in fields for g in groups
+    }
+    data.indexed_sets["UT"] = {f.id: f.unavailable_start_times for f in fields}
+
+    data.params["d"] = {g.id: g.duration for g in groups}
+    data.params["n_min"] = {g.id: g.minimum_number_of_activities for g in groups}
+    data.params["n_max"] = {g.id: g.maximum_number_of_activities for g in groups}
+    data.params["size_req"] = {g.id: g.size_required for g in groups}
+    data.params["prio"] = {g.id: g.priority for g in groups}
+    data.params["p_st1"] = {g.id: g.preferred_start_time_activity_1 for g in groups}
+    data.params["p_st2"] = {g.id: g.preferred_start_time_activity_2 for g in groups}
+    data.params["size"] = {f.id: f.size for f in fields}
+    data.params["start_value"] = _start_values(converted_payload, aat_map)
+    if converted_payload.field_pools:
+        data.params["max_group_size"] = _max_group_sizes(converted_payload)
+
+    data.scalar_params["grid_factor"] = _grid_factor(converted_payload)
+
+    for activity in preprocessed.processed_activities:
+        data.fixed_variables.append(
+            ("y", (activity.field_id, activity.group_id, activity.start_index)))
+        for idx in activity.timeslot_indexes:
+            data.fixed_variables.append(
+                ("x", (activity.field_id, activity.group_id, idx)))
+
+    return data
+
+
+def fingerprint_ampl_data(data: AmplData, model_path: str | Path) -> str:
+    """
+    Hash of the model file and its data. Equal fingerprints produce the
+    same generated problem (same variable and constraint order).
+
+    Args:
+        data: Data loaded into the model
+        model_path: Path of the .mod file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(Path(model_path).read_bytes())
+    # repr of lists/dicts of str/int/float is deterministic and keeps order,
+    # which matters: ordered sets change the generated instance
+    for part in (data.sets, data.indexed_sets, data.params, data.scalar_params,
+                 data.fixed_variables):
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
@@ -1,9 +1,12 @@
-from amplpy import AMPL
+from typing import TYPE_CHECKING
 from models.field_optimizer.field_allocation import FieldAllocation
 from models.field_optimizer.field_optimizer_input import Group
 
+if TYPE_CHECKING:
+    from amplpy import AMPL
 
-def convert_ampl_x_values_to_allocations(ampl: AMPL, groups: list[Group]) -> list[FieldAllocation]:
+
+def convert_ampl_x_values_to_allocations(ampl: "AMPL", groups: list[Group]) -> list[FieldAllocation]:
     x_var = ampl.get_variable("x")
     x_values = x_var.get_values()
     field_allocations = []
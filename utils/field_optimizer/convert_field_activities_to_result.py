@@ -2,7 +2,7 @@ from models.field_optimizer.field_activity import FieldActivity
 from models.field_optimizer.field_optimizer_result import Activity, Stadium, Team
 from models.field_optimizer.time_slot import TimeSlot
 from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
-from utils.datetime import add_minutes_to_time_string
+from utils.datetime import minutes_to_time_string
 
 
 def convert_field_activities_to_result(
@@ -10,7 +10,8 @@ def convert_field_activities_to_result(
     field_activities: list[FieldActivity],
     time_slot_duration_minutes: int,
     time_slots_in_range: list[TimeSlot],
-    index_to_timeslot_map: dict[int, int]
+    index_to_timeslot_map: dict[int, int],
+    group_parent_ids: dict[str, str] | None = None
 ) -> list[Activity]:
     """
     Convert field activities to result activities by mapping team and stadium data
@@ -22,28 +23,42 @@ def convert_field_activities_to_result(
         time_slot_duration_minutes: Duration of each time slot in minutes
         time_slots_in_range: List of all available time slots   
         index_to_timeslot_map: Mapping from index to timeslot ID
+        group_parent_ids: Mapping from auto-subgroup ID to its parent team ID
 
     Returns:
         List of Activity objects for the result
     """
+    group_parent_ids = group_parent_ids or {}
+
+    # Lookups built once per request; result Team/Stadium objects are shared
+    # between all activities of the same team/stadium (first match wins, as
+    # with a linear search)
+    teams: dict[str, Team] = {}
+    for team in payload.teams:
+        if team.id not in teams:
+            teams[team.id] = Team(id=team.id, name=team.name)
+
+    stadiums: dict[str, Stadium] = {}
+    for stadium in payload.stadiums:
+        if stadium.id not in stadiums:
+            stadiums[stadium.id] = Stadium(id=stadium.id, name=stadium.name)
+
+    time_slots_by_id = {ts.id: ts for ts in time_slots_in_range}
+
     activities = []
 
     for activity in field_activities:
-        # Find the team (auto-subgroups like "id__existing_0" map back to parent)
-        group_id = activity.group
-        if "__existing_" in group_id:
-            group_id = group_id.split("__existing_")[0]
+        # Find the team (auto-subgroups map back to their parent team)
+        group_id = group_parent_ids.get(activity.group, activity.group)
         if group_id.startswith("__busyblock_"):
-            continue  
+            continue
 
-        team = next(
-            (team for team in payload.teams if team.id == group_id), None)
+        team = teams.get(group_id)
         if not team:
             raise ValueError(f"Team with ID '{activity.group}' not found")
 
         # Find the stadium
-        stadium = next(
-            (stadium for stadium in payload.stadiums if stadium.id == activity.field), None)
+        stadium = stadiums.get(activity.field)
         if not stadium:
             raise ValueError(f"Stadium with ID '{activity.field}' not found")
 
@@ -53,8 +68,7 @@ def convert_field_activities_to_result(
         if mapped_start_time_slot is None:
             raise ValueError("Start time slot mapping not found")
 
-        start_time_slot = next(
-            (ts for ts in time_slots_in_range if ts.id == mapped_start_time_slot), None)
+        start_time_slot = time_slots_by_id.get(mapped_start_time_slot)
         if not start_time_slot:
             raise ValueError("Start time not found")
 
@@ -63,27 +77,19 @@ def convert_field_activities_to_result(
         if mapped_end_time_slot is None:
             raise ValueError("End time slot mapping not found")
 
-        end_time_slot = next(
-            (ts for ts in time_slots_in_range if ts.id == mapped_end_time_slot), None)
+        end_time_slot = time_slots_by_id.get(mapped_end_time_slot)
         if not end_time_slot:
             raise ValueError("End time not found")
 
         # Calculate adjusted end time by adding time slot duration
-        adjusted_end_time = add_minutes_to_time_string(
-            end_time_slot.time,
-            time_slot_duration_minutes
-        )
+        # (an activity ending at midnight wraps to "00:00")
+        adjusted_end_time = minutes_to_time_string(
+            end_time_slot.minutes + time_slot_duration_minutes)
 
         # Create the activity result
         result_activity = Activity(
-            stadium=Stadium(
-                id=stadium.id,
-                name=stadium.name
-            ),
-            team=Team(
-                id=team.id,
-                name=team.name
-            ),
+            stadium=stadium,
+            team=team,
             index_week_day=start_time_slot.week_day_index,
             start_time=start_time_slot.time,
             end_time=adjusted_end_time,
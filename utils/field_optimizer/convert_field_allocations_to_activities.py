@@ -1,6 +1,5 @@
 from models.field_optimizer.field_allocation import FieldAllocation
 from models.field_optimizer.field_activity import FieldActivity
-from utils.time_slots import get_day_for_timeslot
 
 
 def convert_field_allocations_to_activities(
@@ -22,6 +21,13 @@ def convert_field_allocations_to_activities(
     if not field_allocations:
         return []
 
+    # Day of each timeslot, built once instead of scanning day lists per slot
+    day_by_timeslot = {
+        timeslot_id: day_idx
+        for day_idx, day_timeslots in enumerate(timeslot_ids)
+        for timeslot_id in day_timeslots
+    }
+
     # Sort by field, group, then timeslot to ensure proper grouping
     sorted_data = sorted(field_allocations, key=lambda x: (
         x.field, x.group, x.timeslot_id))
@@ -48,9 +54,8 @@ def convert_field_allocations_to_activities(
               current_activity['group'] == group and
               timeslot_id == current_activity['end_timeslot'] + 1):
             # Check if this consecutive timeslot is on the same day
-            current_day = get_day_for_timeslot(
-                current_activity['end_timeslot'], timeslot_ids)
-            new_day = get_day_for_timeslot(timeslot_id, timeslot_ids)
+            current_day = day_by_timeslot[current_activity['end_timeslot']]
+            new_day = day_by_timeslot[timeslot_id]
 
             if current_day == new_day:
                 # Extend current block (consecutive timeslot on same day)
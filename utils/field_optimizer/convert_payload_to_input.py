@@ -1,72 +1,121 @@
 import itertools
 import logging
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload, ExistingTeamActivity
 from models.field_optimizer.field_optimizer_input import FieldOptimizerInput, Field, Group
+from models.field_optimizer.field_optimizer_result import CapacityAnalysis
 from models.field_optimizer.time_slot import TimeSlot
 
+from utils.datetime import minutes_to_time_string, time_string_to_minutes
 from utils.time_slots import (
-    generate_time_slots_in_range, get_timeslot_ids_by_week_day
+    generate_time_slots_in_day_windows, get_timeslot_ids_by_week_day
 )
 from utils.common import create_number_to_index_mapping
-from .convert_time_range_to_timeslot_ids import convert_time_range_to_timeslot_ids, convert_time_ranges_to_timeslot_ids
+from utils.time_slots.get_time_slot_table import DAYS_PER_WEEK
+from .timeslot_id_memo import get_timeslot_id_memo
+from .time_grid import (
+    BASE_TIME_SLOT_MINUTES,
+    convert_timeslot_id_to_grid,
+    detect_time_grid_minutes,
+)
 
 TIME_SLOT_DURATION_MINUTES = 15
+MINUTES_PER_DAY = 24 * 60
 SLOTS_PER_DAY = (24 * 60) // TIME_SLOT_DURATION_MINUTES  # 96
 logger = logging.getLogger(__name__)
 
 
-def compute_effective_time_window(
+def _day_pieces(start_minutes: int, end_minutes: int) -> list[tuple[int, int]]:
+    """In-day [start, end) pieces of a window; one crossing midnight has two."""
+    if start_minutes <= end_minutes:
+        return [(start_minutes, end_minutes)]
+    return [(0, end_minutes), (start_minutes, MINUTES_PER_DAY)]
+
+
+def _join_day_pieces(pieces: list[tuple[int, int]]) -> tuple[int, int]:
+    """
+    Window of a day's pieces. Pieces starting at midnight form the early run,
+    the others the late run; when a gap separates the two runs the window
+    wraps (start > end) rather than spanning the gap.
+    """
+    early_end = max((end for start, end in pieces if start == 0), default=None)
+    late = [(start, end) for start, end in pieces if start > 0]
+    if not late:
+        return 0, early_end or 0
+    late_start = min(start for start, _ in late)
+    late_end = max(end for _, end in late)
+    if early_end is None:
+        return late_start, late_end
+    if early_end < late_start:
+        return late_start, early_end
+    return 0, max(early_end, late_end)
+
+
+def compute_day_time_windows(
     start_time: str,
     end_time: str,
     existing_activities: list[ExistingTeamActivity],
     payload: FieldOptimizerPayload | None = None
-) -> tuple[str, str]:
+) -> dict[int, tuple[int, int]]:
     """
-    Expands the optimization time window to include times of predefined activities.
+    Computes the optimization window of each week day separately.
 
-    Predefined activities may fall outside the user's normal time window
-    (e.g., a Saturday 10:00 activity when the window is 16:00-22:00).
-    The solver needs these timeslots in T to fix x/y variables.
-    """
-    def time_str_to_minutes(t: str) -> int:
-        h, m = t.split(":")
-        return int(h) * 60 + int(m)
+    A day's window is the smallest contiguous span covering the team
+    time_ranges and predefined activities on that day, widened to the
+    user's start/end window. Predefined activities may fall outside the
+    user's normal window (e.g., a Saturday 10:00 activity when the window
+    is 16:00-22:00); the solver needs those timeslots in T to fix x/y, but
+    only on that day. Days where no team can start and nothing is
+    predefined get no window and are left out of the model (unless no
+    day has anything, then every day gets the user's window).
 
-    def minutes_to_time_str(minutes: int) -> str:
-        h = minutes // 60
-        m = minutes % 60
-        return f"{h:02d}:{m:02d}"
+    Pieces are not merged across a gap after midnight: with a 20:00-02:00
+    window a day gets [0:00, 2:00) and [20:00, 24:00), returned as the
+    wrapped window (20:00, 2:00). The late run then extends to midnight.
 
-    effective_start = time_str_to_minutes(start_time)
-    effective_end = time_str_to_minutes(end_time)
+    Returns:
+        (start_minutes, end_minutes) per week day index, end exclusive;
+        start > end covers [0, end) and [start, 24:00) of that day
+    """
+    pieces_by_day: dict[int, list[tuple[int, int]]] = {}
 
     for activity in existing_activities:
-        # Derive time-of-day from global timeslot ID
-        start_slot_in_day = (activity.start_timeslot - 1) % SLOTS_PER_DAY
+        # Derive day and time-of-day from global timeslot IDs
+        start_day, start_slot_in_day = divmod(activity.start_timeslot - 1, SLOTS_PER_DAY)
+        end_day, end_slot_in_day = divmod(activity.end_timeslot - 1, SLOTS_PER_DAY)
         start_minutes = start_slot_in_day * TIME_SLOT_DURATION_MINUTES
+        end_minutes = (end_slot_in_day + 1) * TIME_SLOT_DURATION_MINUTES
 
-        end_slot_in_day = (activity.end_timeslot - 1) % SLOTS_PER_DAY
-        end_minutes = end_slot_in_day * TIME_SLOT_DURATION_MINUTES
-
-        if start_minutes < effective_start:
-            effective_start = start_minutes
-        if end_minutes > effective_end:
-            effective_end = end_minutes
+        if start_day == end_day:
+            pieces_by_day.setdefault(start_day, []).append((start_minutes, end_minutes))
+        else:
+            pieces_by_day.setdefault(start_day, []).append((start_minutes, MINUTES_PER_DAY))
+            pieces_by_day.setdefault(end_day, []).append((0, end_minutes))
 
-    # Expand window to include team time_ranges (e.g., weekend times)
     if payload:
         for team in payload.teams:
             ranges = team.time_ranges or [team.time_range]
             for tr in ranges:
-                tr_start = time_str_to_minutes(tr.start_time)
-                tr_end = time_str_to_minutes(tr.end_time)
-                if tr_start < effective_start:
-                    effective_start = tr_start
-                if tr_end > effective_end:
-                    effective_end = tr_end
+                pieces = _day_pieces(
+                    time_string_to_minutes(tr.start_time),
+                    time_string_to_minutes(tr.end_time))
+                for day_index in tr.day_indexes:
+                    pieces_by_day.setdefault(day_index, []).extend(pieces)
 
-    return minutes_to_time_str(effective_start), minutes_to_time_str(effective_end)
+    window_pieces = _day_pieces(
+        time_string_to_minutes(start_time), time_string_to_minutes(end_time))
+
+    if not pieces_by_day:
+        # Nothing to plan: keep the user's window on every day
+        pieces_by_day = {day_index: [] for day_index in range(DAYS_PER_WEEK)}
+
+    day_windows = {}
+    for day_index, pieces in pieces_by_day.items():
+        pieces.extend(window_pieces)
+        day_windows[day_index] = _join_day_pieces(
+            [(piece_start, piece_end) for piece_start, piece_end in pieces
+             if piece_start < piece_end])
+    return day_windows
 
 
 def split_groups_for_existing_activities(
@@ -125,8 +174,9 @@ def split_groups_for_existing_activities(
             size_required=activity.size_required,
             duration=activity.duration_slots,
             priority=parent.priority,
-            preferred_field_ids=parent.preferred_field_ids,
-            p_early_starts=parent.p_early_starts
+            preferred_field_ids=list(parent.preferred_field_ids),
+            p_early_starts=parent.p_early_starts,
+            parent_id=parent.parent_id or parent.id
         )
         new_groups.append(new_group)
         group_map[subgroup_id] = new_group
@@ -136,16 +186,7 @@ def split_groups_for_existing_activities(
         parent.maximum_number_of_activities = max(0, parent.maximum_number_of_activities - 1)
 
         # Reassign activity to subgroup
-        updated_activities[i] = ExistingTeamActivity(
-            team_id=subgroup_id,
-            team_name=activity.team_name,
-            stadium_id=activity.stadium_id,
-            stadium_name=activity.stadium_name,
-            start_timeslot=activity.start_timeslot,
-            end_timeslot=activity.end_timeslot,
-            duration_slots=activity.duration_slots,
-            size_required=activity.size_required
-        )
+        updated_activities[i] = activity.model_copy(update={"team_id": subgroup_id})
 
         # Incompatibility: parent and subgroup shouldn't overlap
         new_incompatible_same_day.append([parent.id, subgroup_id])
@@ -164,33 +205,70 @@ def split_groups_for_existing_activities(
     return all_groups, updated_activities, new_incompatible_same_day, new_incompatible_same_time
 
 
-class ConvertedPayload(BaseModel):
+@dataclass(slots=True)
+class ConvertedPayload:
     field_optimizer_input: FieldOptimizerInput
     time_slots_in_range: list[TimeSlot]
     index_to_timeslot_map: dict[int, int]
     timeslot_to_index_map: dict[int, int]
-    time_slot_duration_minutes: int
-    existing_activities: list[ExistingTeamActivity]
+    time_slot_duration_minutes: int  # grid the model is solved on
+    existing_activities: list[ExistingTeamActivity]  # in timeslot ids of that grid
     auto_incompatible_same_day: list[list[str]]
     auto_incompatible_same_time: list[list[str]]
+    group_parent_ids: dict[str, str]
+    # Pooled field id -> FieldPool, set when identical fields are pooled
+    field_pools: dict = field(default_factory=dict)
+    # CapacityAnalysis of the request, set before the solve
+    capacity_analysis: CapacityAnalysis | None = None
+
+
+def _convert_existing_activities_to_grid(
+    existing_activities: list[ExistingTeamActivity],
+    grid_minutes: int
+) -> list[ExistingTeamActivity]:
+    """Express predefined activities in timeslot ids and slots of the grid."""
+    if grid_minutes == BASE_TIME_SLOT_MINUTES:
+        return existing_activities
+
+    factor = grid_minutes // BASE_TIME_SLOT_MINUTES
+    return [
+        activity.model_copy(update={
+            "start_timeslot": convert_timeslot_id_to_grid(activity.start_timeslot, grid_minutes),
+            "end_timeslot": convert_timeslot_id_to_grid(activity.end_timeslot, grid_minutes),
+            "duration_slots": activity.duration_slots // factor,
+        })
+        for activity in existing_activities
+    ]
 
 
 def convert_payload_to_input(
         payload: FieldOptimizerPayload
 ) -> ConvertedPayload:
-    # Expand time window to include predefined activities that may fall outside
-    # the user's normal window (e.g., weekend 10:00 when window is 16:00-22:00)
-    effective_start_time, effective_end_time = compute_effective_time_window(
+    # Solve on the coarsest grid every time in the payload lies on; team
+    # durations, predefined activities and closures are given in 15-minute
+    # slots and are converted below
+    grid_minutes = (
+        detect_time_grid_minutes(payload) if payload.auto_time_grid
+        else BASE_TIME_SLOT_MINUTES
+    )
+    grid_factor = grid_minutes // BASE_TIME_SLOT_MINUTES
+    if grid_minutes != BASE_TIME_SLOT_MINUTES:
+        logger.info("Solving on a %d-minute grid", grid_minutes)
+
+    # One window per day: a weekend-only team or a Saturday 10:00 activity
+    # only adds slots to the days it occurs on
+    day_windows = compute_day_time_windows(
         payload.start_time, payload.end_time, payload.existing_team_activities, payload
     )
 
-    if effective_start_time != payload.start_time or effective_end_time != payload.end_time:
-        logger.info("Time window expanded: %s-%s -> %s-%s",
-                     payload.start_time, payload.end_time, effective_start_time, effective_end_time)
+    logger.info("Day windows: %s", ", ".join(
+        f"{day_index}={minutes_to_time_string(start)}-{minutes_to_time_string(end)}"
+        for day_index, (start, end) in sorted(day_windows.items())))
 
-    time_slots_in_range = generate_time_slots_in_range(
-        effective_start_time, effective_end_time, TIME_SLOT_DURATION_MINUTES)
+    time_slots_in_range = generate_time_slots_in_day_windows(
+        day_windows, grid_minutes)
 
+    week_day_indexes = sorted({ts.week_day_index for ts in time_slots_in_range})
     timeslot_ids_by_week_day = get_timeslot_ids_by_week_day(
         time_slots_in_range)
     timeslot_ids = list(itertools.chain(*timeslot_ids_by_week_day))
@@ -201,9 +279,14 @@ def convert_payload_to_input(
 
     fields = []
     for stadium in payload.stadiums:
+        unavailable_ids = stadium.unavailable_start_times
+        if grid_minutes != BASE_TIME_SLOT_MINUTES:
+            unavailable_ids = dict.fromkeys(
+                convert_timeslot_id_to_grid(timeslot_id, grid_minutes)
+                for timeslot_id in unavailable_ids)
         unavailable_indexes = [
             timeslot_to_index_map[timeslot_id]
-            for timeslot_id in stadium.unavailable_start_times
+            for timeslot_id in unavailable_ids
             if timeslot_id in timeslot_to_index_map
         ]
 
@@ -214,16 +297,18 @@ def convert_payload_to_input(
             unavailable_start_times=unavailable_indexes
         ))
 
+    # Teams mostly share a few time windows: convert each signature once
+    timeslot_id_memo = get_timeslot_id_memo(timeslot_to_index_map, grid_minutes)
+
     groups = []
     for team in payload.teams:
+        duration = team.duration // grid_factor
         if team.time_ranges:
-            possible_start_times = convert_time_ranges_to_timeslot_ids(
-                team.time_ranges, timeslot_to_index_map,
-                duration_slots=team.duration)
+            possible_start_times = timeslot_id_memo.convert_time_ranges(
+                team.time_ranges, duration_slots=duration)
         else:
-            possible_start_times = convert_time_range_to_timeslot_ids(
-                team.time_range, timeslot_to_index_map,
-                duration_slots=team.duration)
+            possible_start_times = timeslot_id_memo.convert_time_range(
+                team.time_range, duration_slots=duration)
 
         # TODO: when ready, use "team.preferred_start_times"
         preferred_start_times = []
@@ -235,12 +320,12 @@ def convert_payload_to_input(
             name=team.name,
             minimum_number_of_activities=team.min_number_of_activities,
             maximum_number_of_activities=team.max_number_of_activities,
-            possible_start_times=possible_start_times,
+            possible_start_times=list(possible_start_times),
             preferred_start_times=preferred_start_times,
             preferred_start_time_activity_1=0,
             preferred_start_time_activity_2=0,
             size_required=team.size_required,
-            duration=team.duration,
+            duration=duration,
             priority=team.priority,
             preferred_field_ids=preferred_field_ids,
             p_early_starts=team.p_early_starts or 0
@@ -249,7 +334,9 @@ def convert_payload_to_input(
     # Auto-split groups when predefined activities have different size/duration
     groups, updated_existing, auto_incomp_day, auto_incomp_time = (
         split_groups_for_existing_activities(
-            groups, payload.existing_team_activities, timeslot_to_index_map
+            groups,
+            _convert_existing_activities_to_grid(payload.existing_team_activities, grid_minutes),
+            timeslot_to_index_map
         )
     )
 
@@ -262,13 +349,17 @@ def convert_payload_to_input(
         field_optimizer_input=FieldOptimizerInput(
             fields=fields,
             groups=groups,
-            time_slots=timeslot_ids_indexes
+            time_slots=timeslot_ids_indexes,
+            week_day_indexes=week_day_indexes
         ),
         time_slots_in_range=time_slots_in_range,
         index_to_timeslot_map=index_to_timeslot_map,
         timeslot_to_index_map=timeslot_to_index_map,
-        time_slot_duration_minutes=TIME_SLOT_DURATION_MINUTES,
+        time_slot_duration_minutes=grid_minutes,
         existing_activities=updated_existing,
         auto_incompatible_same_day=auto_incomp_day,
-        auto_incompatible_same_time=auto_incomp_time
+        auto_incompatible_same_time=auto_incomp_time,
+        group_parent_ids={
+            group.id: group.parent_id for group in groups if group.parent_id
+        }
     )
@@ -0,0 +1,50 @@
+from models.field_optimizer.field_optimizer_result import Activity
+from utils.datetime import time_string_to_minutes
+from utils.field_optimizer.handle_existing_activities import ProcessedActivity
+from utils.field_optimizer.time_grid import BASE_SLOTS_PER_DAY, BASE_TIME_SLOT_MINUTES
+
+
+def convert_result_activities_to_starts(
+    activities: list[Activity],
+    timeslot_to_index_map: dict[int, int]
+) -> list[ProcessedActivity]:
+    """
+    Map result activities (stadium, team, week day and times) back onto the
+    model's fields, groups and timeslot indexes of a 15-minute conversion.
+
+    Args:
+        activities: Activities as returned in FieldOptimizerResult.activities
+        timeslot_to_index_map: Timeslot id to model index, 15-minute grid
+
+    Returns:
+        One ProcessedActivity per activity, in input order
+
+    Raises:
+        ValueError: If an activity lies outside the planning window
+    """
+    starts = []
+    for activity in activities:
+        start_minutes = time_string_to_minutes(activity.start_time)
+        end_minutes = time_string_to_minutes(activity.end_time)
+        if end_minutes <= start_minutes:
+            # An activity ending at midnight is returned with end time "00:00"
+            end_minutes += 24 * 60
+
+        day_offset = activity.index_week_day * BASE_SLOTS_PER_DAY
+        timeslot_ids = range(
+            day_offset + start_minutes // BASE_TIME_SLOT_MINUTES + 1,
+            day_offset + -(-end_minutes // BASE_TIME_SLOT_MINUTES) + 1,
+        )
+        indexes = [timeslot_to_index_map.get(timeslot_id) for timeslot_id in timeslot_ids]
+        if not indexes or None in indexes:
+            raise ValueError(
+                f"Activity of team '{activity.team.id}' on day {activity.index_week_day} "
+                f"{activity.start_time}-{activity.end_time} is outside the planning window")
+
+        starts.append(ProcessedActivity(
+            field_id=activity.stadium.id,
+            group_id=activity.team.id,
+            start_index=indexes[0],
+            timeslot_indexes=indexes,
+        ))
+    return starts
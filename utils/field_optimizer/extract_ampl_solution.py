@@ -0,0 +1,130 @@
+import logging
+from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_input import Group
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+# Filtered on the AMPL side: only activity starts (y) that are set, and only
+# where a group may start at all, instead of the dense F x G x T arrays.
+Y_STARTS_STATEMENT = "{g in G, f in F, t in AT[g]: y[f,g,t] > 0.5} y[f,g,t]"
+SHORTFALL_STATEMENT = "{g in G: min_activity_shortfall[g] > 1e-6} min_activity_shortfall[g]"
+
+
+@dataclass(slots=True)
+class AmplSolution:
+    """Activities, per-group start counts and shortfalls read from a solved model"""
+    field_activities: list[FieldActivity]
+    activity_counts: dict[str, int]
+    shortfalls: dict[str, float]
+
+
+def _get_rows(ampl: "AMPL", statement: str) -> list[tuple]:
+    try:
+        return ampl.get_data(statement).to_list()
+    except Exception:
+        # AMPL refuses to display an empty indexed expression
+        logger.debug("No rows for: %s", statement)
+        return []
+
+
+def extract_ampl_solution(
+    ampl: "AMPL",
+    groups: list[Group],
+    fixed_starts: set[tuple[str, str, int]]
+) -> AmplSolution:
+    """
+    Build activities straight from the activity starts of a solved model.
+
+    Every start y[f,g,t] spans d[g] consecutive timeslots (the model forbids
+    starts that would cross the end of the day), so activities follow from
+    the start and the group's duration without reading x.
+
+    Args:
+        ampl: The solved AMPL instance
+        groups: Groups of the optimizer input
+        fixed_starts: (field, group, start_index) of predefined activities,
+            which are counted but not returned as new activities
+
+    Returns:
+        AmplSolution with new activities, start counts (including fixed
+        activities) and nonzero shortfalls per group
+    """
+    starts = [(g, f, int(t)) for g, f, t, _ in _get_rows(ampl, Y_STARTS_STATEMENT)]
+    shortfalls = {
+        g: float(value)
+        for g, value in _get_rows(ampl, SHORTFALL_STATEMENT)
+    }
+    return _build_solution(starts, shortfalls, groups, fixed_starts)
+
+
+def extract_variable_values_solution(
+    variable_values: dict[str, dict[tuple, float]],
+    groups: list[Group],
+    fixed_starts: set[tuple[str, str, int]]
+) -> AmplSolution:
+    """
+    Same as extract_ampl_solution, for values read outside AMPL (a .sol
+    file of a cached problem). Fixed variables are not part of a generated
+    problem, so fixed starts are added back from fixed_starts.
+
+    Args:
+        variable_values: Values per variable name and index, e.g.
+            {"y": {("f1", "g1", 17): 1.0}}
+        groups: Groups of the optimizer input
+        fixed_starts: (field, group, start_index) of predefined activities
+
+    Returns:
+        AmplSolution as returned by extract_ampl_solution
+    """
+    starts = [(g, f, int(t)) for (f, g, t), value in variable_values.get("y", {}).items()
+              if value > 0.5]
+    starts.extend((g, f, t) for f, g, t in fixed_starts)
+    shortfalls = {
+        g: float(value)
+        for (g,), value in variable_values.get("min_activity_shortfall", {}).items()
+        if value > 1e-6
+    }
+    return _build_solution(starts, shortfalls, groups, fixed_starts)
+
+
+def _build_solution(
+    starts: list[tuple[str, str, int]],
+    shortfalls: dict[str, float],
+    groups: list[Group],
+    fixed_starts: set[tuple[str, str, int]]
+) -> AmplSolution:
+    group_lookup = {group.id: group for group in groups}
+
+    field_activities: list[FieldActivity] = []
+    activity_counts: dict[str, int] = {}
+
+    for g, f, start in starts:
+        activity_counts[g] = activity_counts.get(g, 0) + 1
+
+        if (f, g, start) in fixed_starts:
+            continue
+
+        group = group_lookup.get(g)
+        duration = group.duration if group else 1
+        field_activities.append(FieldActivity(
+            field=f,
+            group=g,
+            start_timeslot=start,
+            end_timeslot=start + duration - 1,
+            duration=duration,
+            size=group.size_required if group else 0
+        ))
+
+    # Same ordering as blocks rebuilt from x: field, group, start
+    field_activities.sort(key=lambda a: (a.field, a.group, a.start_timeslot))
+
+    return AmplSolution(
+        field_activities=field_activities,
+        activity_counts=activity_counts,
+        shortfalls=shortfalls
+    )
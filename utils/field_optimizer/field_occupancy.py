@@ -0,0 +1,51 @@
+import numpy as np
+from models.field_optimizer.field_optimizer_input import Field
+
+
+class FieldOccupancy:
+    """
+    Used capacity per field and timeslot index as one NumPy array. Adding or
+    removing an activity touches only its own timeslots, so manual edits can
+    be re-checked incrementally.
+    """
+
+    def __init__(self, fields: list[Field], timeslot_indexes: list[int]):
+        self.field_ids = [f.id for f in fields]
+        self.timeslot_indexes = list(timeslot_indexes)
+        self._row = {field_id: i for i, field_id in enumerate(self.field_ids)}
+        self._column = {t: i for i, t in enumerate(self.timeslot_indexes)}
+        self.capacity = np.array([f.size for f in fields], dtype=np.int64)
+        self.used = np.zeros((len(fields), len(self.timeslot_indexes)), dtype=np.int64)
+
+    def _cells(self, field_id: str, timeslot_indexes: list[int]) -> tuple[int, list[int]]:
+        return self._row[field_id], [self._column[t] for t in timeslot_indexes]
+
+    def add(self, field_id: str, timeslot_indexes: list[int], size: int):
+        """Occupy size on a field for the given timeslots."""
+        row, columns = self._cells(field_id, timeslot_indexes)
+        self.used[row, columns] += size
+
+    def remove(self, field_id: str, timeslot_indexes: list[int], size: int):
+        """Undo add with the same arguments."""
+        row, columns = self._cells(field_id, timeslot_indexes)
+        self.used[row, columns] -= size
+
+    def fits(self, field_id: str, timeslot_indexes: list[int], size: int) -> bool:
+        """True when size more still fits the field at every given timeslot."""
+        row, columns = self._cells(field_id, timeslot_indexes)
+        return bool((self.used[row, columns] + size <= self.capacity[row]).all())
+
+    def overloaded(self) -> list[tuple[str, int, int, int]]:
+        """
+        Cells where demand exceeds the field size.
+
+        Returns:
+            (field_id, timeslot_index, demand, capacity) per cell, by field
+            then timeslot
+        """
+        rows, columns = np.nonzero(self.used > self.capacity[:, np.newaxis])
+        return [
+            (self.field_ids[r], self.timeslot_indexes[c],
+             int(self.used[r, c]), int(self.capacity[r]))
+            for r, c in zip(rows.tolist(), columns.tolist())
+        ]
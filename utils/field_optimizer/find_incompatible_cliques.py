@@ -0,0 +1,66 @@
+from collections import Counter
+from models.field_optimizer.field_optimizer_input import Group
+
+# Smaller cliques gain nothing over their pairs (2 pairs vs 1 excess row)
+MIN_CLIQUE_SIZE = 3
+
+
+def find_incompatible_cliques(
+    incompatible_pairs: list[list[str]],
+    groups: list[Group]
+) -> list[list[str]]:
+    """
+    Cover mutually incompatible groups (e.g. all teams of one coach) by
+    cliques, so the model penalizes k simultaneous members with k-1 excess
+    rows per timeslot instead of one overlap row per pair (SAME_TIME_CLIQUES).
+
+    sum_{j=1..m-1} max(0, n - j) = n(n-1)/2, so the penalty of n members
+    at the same time is exactly that of their pairs. Only groups of equal
+    priority are joined, as the pair penalty uses the pair's mean priority.
+    Pairs listed more than once are penalized once per listing and stay
+    pairs. Cliques are edge-disjoint, found greedily from the group with
+    the most incompatibilities.
+
+    Args:
+        incompatible_pairs: Same-time incompatible pairs sent to the model
+        groups: Groups of the request (priorities)
+
+    Returns:
+        Cliques of at least MIN_CLIQUE_SIZE group ids
+    """
+    priority = {g.id: g.priority for g in groups}
+    counts = Counter(frozenset(pair) for pair in incompatible_pairs)
+
+    neighbours: dict[str, set[str]] = {}
+    for edge, count in counts.items():
+        if count != 1 or len(edge) != 2:
+            continue
+        g1, g2 = edge
+        if priority.get(g1) is None or priority.get(g1) != priority.get(g2):
+            continue
+        neighbours.setdefault(g1, set()).add(g2)
+        neighbours.setdefault(g2, set()).add(g1)
+
+    cliques = []
+    while True:
+        candidates = [g for g, ns in neighbours.items() if len(ns) >= MIN_CLIQUE_SIZE - 1]
+        if not candidates:
+            break
+        # Highest degree first, ties by id so the result is deterministic
+        start = min(candidates, key=lambda g: (-len(neighbours[g]), g))
+        clique = [start]
+        for g in sorted(neighbours[start], key=lambda g: (-len(neighbours[g]), g)):
+            if all(g in neighbours[member] for member in clique):
+                clique.append(g)
+
+        if len(clique) < MIN_CLIQUE_SIZE:
+            # start is in no large clique: keep its pairs and stop considering it
+            for g in neighbours.pop(start):
+                neighbours[g].discard(start)
+            continue
+
+        cliques.append(clique)
+        for member in clique:
+            neighbours[member].difference_update(clique)
+
+    return cliques
@@ -0,0 +1,114 @@
+from models.field_optimizer.field_optimizer_input import FieldOptimizerInput
+
+
+def _chain_pairs(classes: dict[tuple, list[str]]) -> list[list[str]]:
+    """Consecutive pairs within each class of two or more members."""
+    pairs = []
+    for members in classes.values():
+        pairs.extend([a, b] for a, b in zip(members, members[1:]))
+    return pairs
+
+
+def find_symmetric_group_pairs(
+    field_optimizer_input: FieldOptimizerInput,
+    aat_map: dict[tuple[str, str], list[int]],
+    incompatible_pairs: list[list[str]]
+) -> list[list[str]]:
+    """
+    Find interchangeable groups: same duration, size, priority, activity
+    bounds, start times and preferred fields. Swapping two of them gives an
+    equivalent solution, so the model may order them (GROUP_SYMMETRY_PAIRS).
+
+    Groups with predefined activities or in an incompatibility pair are
+    distinguishable and never paired.
+
+    Args:
+        field_optimizer_input: Fields and groups of the request
+        aat_map: Already assigned timeslots per (field, group)
+        incompatible_pairs: All same-time and same-day incompatible pairs
+
+    Returns:
+        [g1, g2] pairs, consecutive members of each class
+    """
+    excluded = {group_id for _, group_id in aat_map}
+    for pair in incompatible_pairs:
+        excluded.update(pair)
+
+    classes: dict[tuple, list[str]] = {}
+    for group in field_optimizer_input.groups:
+        if group.id in excluded or group.parent_id:
+            continue
+        key = (
+            group.duration, group.size_required, group.priority,
+            group.minimum_number_of_activities, group.maximum_number_of_activities,
+            tuple(group.possible_start_times), tuple(group.preferred_start_times),
+            tuple(group.preferred_field_ids), group.p_early_starts,
+            group.preferred_start_time_activity_1, group.preferred_start_time_activity_2,
+        )
+        classes.setdefault(key, []).append(group.id)
+
+    return _chain_pairs(classes)
+
+
+def find_interchangeable_field_classes(
+    field_optimizer_input: FieldOptimizerInput,
+    aat_map: dict[tuple[str, str], list[int]],
+    max_group_sizes: dict[str, int] | None = None
+) -> list[list[str]]:
+    """
+    Group fields with the same size, the same unavailable times and the
+    same preference status for every group. Fields holding predefined
+    activities are never interchangeable, nor are fields whose largest
+    admitted group differs (a pooled field only admits groups that fit one
+    of its members).
+
+    Args:
+        field_optimizer_input: Fields and groups of the request
+        aat_map: Already assigned timeslots per (field, group)
+        max_group_sizes: Largest admitted group per pooled field id
+
+    Returns:
+        Classes of two or more field ids, in input order
+    """
+    excluded = {field_id for field_id, _ in aat_map}
+    max_group_sizes = max_group_sizes or {}
+    preferred_by = {}
+    for group in field_optimizer_input.groups:
+        for field_id in group.preferred_field_ids:
+            preferred_by.setdefault(field_id, []).append(group.id)
+
+    classes: dict[tuple, list[str]] = {}
+    for field in field_optimizer_input.fields:
+        if field.id in excluded:
+            continue
+        key = (
+            field.size,
+            tuple(sorted(field.unavailable_start_times)),
+            frozenset(preferred_by.get(field.id, ())),
+            max_group_sizes.get(field.id, field.size),
+        )
+        classes.setdefault(key, []).append(field.id)
+
+    return [members for members in classes.values() if len(members) > 1]
+
+
+def find_symmetric_field_pairs(
+    field_optimizer_input: FieldOptimizerInput,
+    aat_map: dict[tuple[str, str], list[int]],
+    max_group_sizes: dict[str, int] | None = None
+) -> list[list[str]]:
+    """
+    Find interchangeable fields (FIELD_SYMMETRY_PAIRS), see
+    find_interchangeable_field_classes.
+
+    Args:
+        field_optimizer_input: Fields and groups of the request
+        aat_map: Already assigned timeslots per (field, group)
+        max_group_sizes: Largest admitted group per pooled field id
+
+    Returns:
+        [f1, f2] pairs, consecutive members of each class
+    """
+    classes = find_interchangeable_field_classes(
+        field_optimizer_input, aat_map, max_group_sizes)
+    return _chain_pairs(dict(enumerate(classes)))
@@ -1,14 +1,16 @@
 import logging
-from typing import Dict, List, Tuple, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Tuple, Optional, Set
+from dataclasses import dataclass
 
 from models.field_optimizer.field_optimizer_payload import ExistingTeamActivity
 from models.field_optimizer.field_optimizer_input import FieldOptimizerInput
+from utils.field_optimizer.field_occupancy import FieldOccupancy
 
 logger = logging.getLogger(__name__)
 
 
-class ProcessedActivity(BaseModel):
+@dataclass(slots=True)
+class ProcessedActivity:
     """Represents a validated and mapped existing activity ready for AMPL variable fixing"""
     field_id: str
     group_id: str
@@ -16,9 +18,30 @@ class ProcessedActivity(BaseModel):
     timeslot_indexes: List[int] 
 
 
+@dataclass(slots=True)
+class CapacityCollision:
+    """A timeslot where fixed existing activities exceed a field's capacity"""
+    field_id: str
+    field_name: str
+    index: int
+    demand: int
+    capacity: int
+    team_names: List[str]
+
+
+@dataclass(slots=True)
+class PreprocessedExistingActivities:
+    """AAT map, variables to fix and collision diagnostics from one pass"""
+    aat_map: Dict[Tuple[str, str], List[int]]
+    processed_activities: List[ProcessedActivity]
+    collisions: List[CapacityCollision]
+
+
 def validate_existing_activity(
     activity: ExistingTeamActivity,
-    field_optimizer_input: FieldOptimizerInput
+    field_optimizer_input: FieldOptimizerInput,
+    group_ids: Optional[Set[str]] = None,
+    field_ids: Optional[Set[str]] = None
 ) -> Tuple[bool, Optional[str]]:
     """
     Validates that the activity has valid references to field and group.
@@ -26,19 +49,24 @@ def validate_existing_activity(
     Args:
         activity: The existing team activity to validate
         field_optimizer_input: The optimizer input containing fields and groups
+        group_ids: Precomputed group IDs (built from the input if omitted)
+        field_ids: Precomputed field IDs (built from the input if omitted)
 
     Returns:
         (is_valid, error_message): Tuple where is_valid is True if activity is valid,
                                    and error_message contains the error if not valid
     """
+    if group_ids is None:
+        group_ids = {g.id for g in field_optimizer_input.groups}
+    if field_ids is None:
+        field_ids = {f.id for f in field_optimizer_input.fields}
+
     # Check if group exists
-    group = next((g for g in field_optimizer_input.groups if g.id == activity.team_id), None)
-    if not group:
+    if activity.team_id not in group_ids:
         return False, f"Group with ID '{activity.team_id}' not found"
 
     # Check if field exists
-    field = next((f for f in field_optimizer_input.fields if f.id == activity.stadium_id), None)
-    if not field:
+    if activity.stadium_id not in field_ids:
         return False, f"Field with ID '{activity.stadium_id}' not found"
 
     return True, None
@@ -78,50 +106,75 @@ def convert_global_to_relative_timeslots(
     return start_index, timeslot_indexes, skipped_timeslots
 
 
-def build_aat_map(
+def preprocess_existing_activities(
     existing_activities: List[ExistingTeamActivity],
     field_optimizer_input: FieldOptimizerInput,
-    timeslot_to_index_map: Dict[int, int]
-) -> Tuple[Dict[Tuple[str, str], List[int]], List[ProcessedActivity]]:
+    timeslot_to_index_map: Dict[int, int],
+    merge_start_times: bool = True
+) -> PreprocessedExistingActivities:
     """
-    Builds AAT (Already Assigned Timeslots) map and list of processed activities.
+    Validates and indexes existing activities in a single pass.
 
-    This function validates existing activities, converts their global timeslot IDs
-    to relative indexes, and prepares data structures for AMPL integration.
+    Produces the AAT (Already Assigned Timeslots) map, the activities whose
+    variables get fixed, and capacity collisions among fixed activities.
+    With merge_start_times, each fixed start is added to its group's
+    possible_start_times (in place): the activity_can_not_start constraint
+    would otherwise force y=0 at a start whose y is fixed to 1. This does
+    NOT allow the solver to place new activities there.
 
     Args:
         existing_activities: List of existing team activities to process
         field_optimizer_input: The optimizer input containing fields and groups
         timeslot_to_index_map: Mapping from global timeslot ID to relative index
+        merge_start_times: Add fixed starts to the groups' possible_start_times
 
     Returns:
-        (aat_map, processed_activities):
-            - aat_map: Dict[(field_id, group_id)] -> [relative_timeslot_indexes]
-            - processed_activities: List of validated activities ready for AMPL fixing
+        PreprocessedExistingActivities with aat_map, processed_activities
+        and collisions
     """
-    aat_map: Dict[Tuple[str, str], List[int]] = {}
-    processed_activities: List[ProcessedActivity] = []
-
     if len(existing_activities) == 0:
-        return aat_map, processed_activities
+        return PreprocessedExistingActivities(
+            aat_map={}, processed_activities=[], collisions=[])
 
     logger.info("Processing %d existing activities", len(existing_activities))
 
+    groups_by_id = {g.id: g for g in field_optimizer_input.groups}
+    fields_by_id = {f.id: f for f in field_optimizer_input.fields}
+    group_ids = set(groups_by_id)
+    field_ids = set(fields_by_id)
+
+    aat_sets: Dict[Tuple[str, str], Set[int]] = {}
+    processed_activities: List[ProcessedActivity] = []
+    fixed_starts: Dict[str, Set[int]] = {}
+
+    # Demand per field and timeslot for the collision diagnostics
+    occupancy = FieldOccupancy(
+        field_optimizer_input.fields,
+        [t for day_slots in field_optimizer_input.time_slots for t in day_slots])
+    occupying: List[Tuple[str, List[int], str]] = []
+
     for activity in existing_activities:
         field_id = activity.stadium_id
         group_id = activity.team_id
 
-        # Validate activity references
-        is_valid, error_msg = validate_existing_activity(activity, field_optimizer_input)
-        if not is_valid:
-            logger.warning("%s - skipping activity", error_msg)
-            continue
-
         # Convert global timeslots to relative indexes
         start_idx, timeslot_indexes, skipped = convert_global_to_relative_timeslots(
             activity, timeslot_to_index_map
         )
 
+        if field_id in fields_by_id:
+            group = groups_by_id.get(group_id)
+            size_req = group.size_required if group else activity.size_required
+            occupancy.add(field_id, timeslot_indexes, size_req)
+            occupying.append((field_id, timeslot_indexes, activity.team_name))
+
+        # Validate activity references
+        is_valid, error_msg = validate_existing_activity(
+            activity, field_optimizer_input, group_ids, field_ids)
+        if not is_valid:
+            logger.warning("%s - skipping activity", error_msg)
+            continue
+
         # Log skipped timeslots (outside optimization window)
         if len(skipped) > 0:
             logger.warning("%d timeslot(s) outside optimization window for '%s': %s", len(skipped), activity.team_name, skipped)
@@ -137,10 +190,8 @@ def build_aat_map(
             continue
 
         # Add to AAT map (for constraint exclusion)
-        key = (field_id, group_id)
-        if key not in aat_map:
-            aat_map[key] = []
-        aat_map[key].extend(timeslot_indexes)
+        aat_sets.setdefault((field_id, group_id), set()).update(timeslot_indexes)
+        fixed_starts.setdefault(group_id, set()).add(start_idx)
 
         # Add to processed list (for variable fixing)
         processed_activities.append(ProcessedActivity(
@@ -157,57 +208,58 @@ def build_aat_map(
                      timeslot_indexes[0], timeslot_indexes[-1],
                      activity.size_required)
 
-    # Sort and deduplicate all AAT sets
-    for key in aat_map:
-        aat_map[key] = sorted(set(aat_map[key]))
-
     logger.info("Successfully processed %d activities for fixing", len(processed_activities))
 
+    if merge_start_times:
+        for group_id, starts in fixed_starts.items():
+            group = groups_by_id[group_id]
+            if not starts.issubset(group.possible_start_times):
+                group.possible_start_times = sorted(
+                    starts.union(group.possible_start_times))
+
     # Check for capacity collisions among fixed activities (diagnostic only)
-    try:
-        _check_fixed_activity_collisions(existing_activities, field_optimizer_input, timeslot_to_index_map)
-    except Exception:
-        logger.exception("Failed to check fixed activity collisions")
+    collisions: List[CapacityCollision] = []
+    for field_id, idx, demand, capacity in occupancy.overloaded():
+        field = fields_by_id[field_id]
+        team_names = [name for f, indexes, name in occupying if f == field_id and idx in indexes]
+        collisions.append(CapacityCollision(
+            field_id=field_id,
+            field_name=field.name,
+            index=idx,
+            demand=demand,
+            capacity=capacity,
+            team_names=team_names
+        ))
+        logger.warning(
+            "Capacity collision: field '%s' at index %d — demand %d > capacity %d (teams: %s)",
+            field.name, idx, demand, capacity, ', '.join(team_names)
+        )
 
-    return aat_map, processed_activities
+    return PreprocessedExistingActivities(
+        aat_map={key: sorted(indexes) for key, indexes in aat_sets.items()},
+        processed_activities=processed_activities,
+        collisions=collisions
+    )
 
 
-def _check_fixed_activity_collisions(
+def build_aat_map(
     existing_activities: List[ExistingTeamActivity],
     field_optimizer_input: FieldOptimizerInput,
     timeslot_to_index_map: Dict[int, int]
-) -> None:
-    """Log warnings when fixed existing activities exceed field capacity at any timeslot."""
-    field_capacity = {f.id: f.size for f in field_optimizer_input.fields}
-    group_size = {g.id: g.size_required for g in field_optimizer_input.groups}
+) -> Tuple[Dict[Tuple[str, str], List[int]], List[ProcessedActivity]]:
+    """
+    Builds AAT (Already Assigned Timeslots) map and list of processed activities.
 
-    # Build demand per (field, timeslot_index)
-    slot_demand: Dict[Tuple[str, int], int] = {}
-    slot_activities: Dict[Tuple[str, int], List[str]] = {}
+    See preprocess_existing_activities; this variant leaves the groups'
+    possible_start_times untouched.
 
-    for activity in existing_activities:
-        field_id = activity.stadium_id
-        if field_id not in field_capacity:
-            continue
-        size_req = group_size.get(activity.team_id, activity.size_required)
-
-        for i in range(activity.duration_slots):
-            global_slot = activity.start_timeslot + i
-            idx = timeslot_to_index_map.get(global_slot)
-            if idx is None:
-                continue
-            key = (field_id, idx)
-            slot_demand[key] = slot_demand.get(key, 0) + size_req
-            if key not in slot_activities:
-                slot_activities[key] = []
-            slot_activities[key].append(activity.team_name)
-
-    for (field_id, idx), demand in slot_demand.items():
-        capacity = field_capacity[field_id]
-        if demand > capacity:
-            teams = slot_activities[(field_id, idx)]
-            field_name = next((f.name for f in field_optimizer_input.fields if f.id == field_id), field_id)
-            logger.warning(
-                "Capacity collision: field '%s' at index %d — demand %d > capacity %d (teams: %s)",
-                field_name, idx, demand, capacity, ', '.join(teams)
-            )
+    Returns:
+        (aat_map, processed_activities):
+            - aat_map: Dict[(field_id, group_id)] -> [relative_timeslot_indexes]
+            - processed_activities: List of validated activities ready for AMPL fixing
+    """
+    preprocessed = preprocess_existing_activities(
+        existing_activities, field_optimizer_input, timeslot_to_index_map,
+        merge_start_times=False
+    )
+    return preprocessed.aat_map, preprocessed.processed_activities
@@ -0,0 +1,38 @@
+import logging
+from typing import TYPE_CHECKING
+from utils.field_optimizer.build_ampl_data import AmplData
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+
+def load_ampl_data(ampl: "AMPL", data: AmplData):
+    """
+    Send sets, params and fixed variables to a model that has been read.
+
+    Args:
+        ampl: AMPL instance with field_optimizer.mod loaded
+        data: Data built by build_ampl_data
+    """
+    for name, members in data.sets.items():
+        ampl.set[name] = members
+
+    for name, members_by_index in data.indexed_sets.items():
+        indexed_set = ampl.set[name]
+        for index, members in members_by_index.items():
+            indexed_set[index] = members
+
+    # One bulk call per param: start_value has an entry per field, group and start
+    for name, values_by_index in data.params.items():
+        ampl.param[name].set_values(values_by_index)
+
+    for name, value in data.scalar_params.items():
+        ampl.param[name] = value
+
+    for var_name, index in data.fixed_variables:
+        try:
+            ampl.var[var_name][index].fix(1)
+        except Exception as e:
+            logger.error("Could not fix %s%s: %s", var_name, list(index), e)
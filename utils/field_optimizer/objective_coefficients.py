@@ -0,0 +1,145 @@
+import math
+from dataclasses import dataclass
+import numpy as np
+from models.field_optimizer.field_optimizer_input import FieldOptimizerInput
+from utils.field_optimizer.time_grid import BASE_TIME_SLOT_MINUTES
+
+# Weights of the start terms of preference_score. The model receives the
+# resulting start_value and keeps its own params for the other terms.
+PREFERENCE_VALUE = 2
+FIELD_PREFERENCE_VALUE = 0.5
+PENALTY_LATE_STARTS = 0.01
+REWARD_START_TIME_PREFERENCE = 1
+
+MINUTES_PER_DAY = 24 * 60
+
+# Defaults of the remaining penalty params of field_optimizer.mod, used by
+# solver-free scoring; keep in sync with the model
+PENALTY_ADJ_DAYS = 0.5
+PENALTY_INCOMPATIBLE_GROUP_SAME_TIME = 0.5
+PENALTY_INCOMPATIBLE_GROUP_SAME_DAY = 10
+PENALTY_SHORTFALL_TIERS = (300, 1500, 6000)
+
+
+@dataclass(slots=True)
+class StartCoefficients:
+    """
+    Objective contribution of one activity start, split by component.
+    Rows follow group_ids, columns timeslots (model indexes, day by day)
+    and field columns field_ids.
+    """
+    field_ids: list[str]
+    group_ids: list[str]
+    timeslots: list[int]
+    activity: np.ndarray  # (G, T) prio for every activity
+    preferred_start: np.ndarray  # (G, T) start in PT[g]
+    start_time: np.ndarray  # (G, T) early-start reward
+    late_start: np.ndarray  # (G, T) late-start penalty, <= 0
+    field_preference: np.ndarray  # (G, F) start on a preferred field
+
+    def start_values(self) -> np.ndarray:
+        """Total coefficient of y[f,g,t], shaped (F, G, T)."""
+        per_time = self.activity + self.preferred_start + self.start_time + self.late_start
+        return per_time[np.newaxis, :, :] + self.field_preference.T[:, :, np.newaxis]
+
+
+def _slot_weights(day_length: int, grid_factor: int) -> tuple[np.ndarray, np.ndarray]:
+    """15-minute position within the day and early-start weight of each timeslot."""
+    slot_ord = np.arange(day_length) * grid_factor + 1
+    mid_slot = math.ceil(day_length * grid_factor / 2)
+    early_weight = np.maximum(0, mid_slot - slot_ord)
+    return slot_ord, early_weight
+
+
+def _common_slot_weights(minutes: np.ndarray, grid_factor: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    15-minute position and early-start weight of each timeslot, measured
+    from one origin for every day: the first minute after the longest
+    stretch of the day no window covers (the earliest window start, or the
+    late start of windows crossing midnight). A clock time thus weighs the
+    same on every day, whatever that day's own window.
+    """
+    used = np.unique(minutes)
+    # Gap before each used minute, the one before the first wrapping midnight
+    gaps = np.diff(used, prepend=used[-1] - MINUTES_PER_DAY)
+    origin = used[int(np.argmax(gaps))]
+    slot_ord = (minutes - origin) % MINUTES_PER_DAY // BASE_TIME_SLOT_MINUTES + 1
+    mid_slot = math.ceil((slot_ord.max() + grid_factor - 1) / 2)
+    early_weight = np.maximum(0, mid_slot - slot_ord)
+    return slot_ord, early_weight
+
+
+def get_timeslot_minutes(converted_payload) -> dict[int, int]:
+    """Minute of day of each model timeslot index of a ConvertedPayload."""
+    minutes_by_id = {ts.id: ts.minutes for ts in converted_payload.time_slots_in_range}
+    return {
+        index: minutes_by_id[timeslot_id]
+        for index, timeslot_id in converted_payload.index_to_timeslot_map.items()
+    }
+
+
+def compute_start_coefficients(
+    field_optimizer_input: FieldOptimizerInput,
+    grid_factor: int = 1,
+    timeslot_minutes: dict[int, int] | None = None
+) -> StartCoefficients:
+    """
+    Compute the objective value of a start of each group at each timeslot
+    on each field, as field_optimizer.mod scored it with early_weight,
+    slot_ord and field_pref_weight. Shared by the model data (start_value)
+    and by solver-free scoring.
+
+    With timeslot_minutes, slot_ord and early_weight follow the clock time
+    from one origin shared by all days (see _common_slot_weights), as with
+    a single window for the whole week; without, they are positions within
+    each day's timeslots.
+
+    Args:
+        field_optimizer_input: Fields, groups and timeslots of the request
+        grid_factor: 15-minute slots per timeslot
+        timeslot_minutes: Minute of day per timeslot index
+            (get_timeslot_minutes)
+
+    Returns:
+        StartCoefficients by component
+    """
+    fields = field_optimizer_input.fields
+    groups = field_optimizer_input.groups
+    time_slots = field_optimizer_input.time_slots
+
+    timeslots = [t for day_slots in time_slots for t in day_slots]
+    column = {t: i for i, t in enumerate(timeslots)}
+    field_column = {f.id: i for i, f in enumerate(fields)}
+
+    if timeslot_minutes is not None and timeslots:
+        slot_ord, early_weight = _common_slot_weights(
+            np.array([timeslot_minutes[t] for t in timeslots]), grid_factor)
+    else:
+        slot_ord = np.empty(len(timeslots))
+        early_weight = np.empty(len(timeslots))
+        offset = 0
+        for day_slots in time_slots:
+            day_ord, day_early = _slot_weights(len(day_slots), grid_factor)
+            slot_ord[offset:offset + len(day_slots)] = day_ord
+            early_weight[offset:offset + len(day_slots)] = day_early
+            offset += len(day_slots)
+
+    prio = np.array([g.priority for g in groups], dtype=float)[:, np.newaxis]
+    p_early_starts = np.array([g.p_early_starts for g in groups], dtype=float)[:, np.newaxis]
+
+    preferred = np.zeros((len(groups), len(timeslots)))
+    field_preferred = np.zeros((len(groups), len(fields)))
+    for i, group in enumerate(groups):
+        preferred[i, [column[t] for t in group.preferred_start_times if t in column]] = 1
+        field_preferred[i, [field_column[f] for f in group.preferred_field_ids if f in field_column]] = 1
+
+    return StartCoefficients(
+        field_ids=[f.id for f in fields],
+        group_ids=[g.id for g in groups],
+        timeslots=timeslots,
+        activity=np.broadcast_to(prio, (len(groups), len(timeslots))).copy(),
+        preferred_start=PREFERENCE_VALUE * preferred * prio,
+        start_time=REWARD_START_TIME_PREFERENCE * p_early_starts * early_weight * prio,
+        late_start=-PENALTY_LATE_STARTS * (slot_ord - 1) * prio,
+        field_preference=FIELD_PREFERENCE_VALUE * field_preferred * prio,
+    )
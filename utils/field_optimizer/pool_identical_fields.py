@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from models.field_optimizer.field_activity import FieldActivity
+from models.field_optimizer.field_optimizer_input import Field, FieldOptimizerInput
+from utils.field_optimizer.find_symmetry_pairs import find_interchangeable_field_classes
+
+POOL_FIELD_PREFIX = "__pool_"
+
+
+@dataclass(slots=True)
+class FieldPool:
+    id: str
+    field_ids: list[str]  # member fields, in input order
+    unit_size: int  # size of each member field
+
+
+def pool_identical_fields(
+    field_optimizer_input: FieldOptimizerInput,
+    aat_map: dict[tuple[str, str], list[int]]
+) -> dict[str, FieldPool]:
+    """
+    Replace each class of interchangeable fields (same size, unavailable
+    times and preference status, see find_interchangeable_field_classes)
+    by one pooled field whose size is the sum of the members.
+
+    Groups larger than a single member may not use the pool (max_group_size
+    in the model). Concrete fields are chosen after the solve by
+    assign_pooled_activities. The input is modified in place.
+
+    Args:
+        field_optimizer_input: Fields and groups of the request
+        aat_map: Already assigned timeslots per (field, group)
+
+    Returns:
+        Pools by pooled field id, empty when no fields are interchangeable
+    """
+    classes = find_interchangeable_field_classes(field_optimizer_input, aat_map)
+    if not classes:
+        return {}
+
+    fields_by_id = {f.id: f for f in field_optimizer_input.fields}
+    pools = {}
+    pool_id_by_field = {}
+    for i, members in enumerate(classes):
+        pool_id = f"{POOL_FIELD_PREFIX}{i}"
+        pools[pool_id] = FieldPool(
+            id=pool_id, field_ids=members, unit_size=fields_by_id[members[0]].size)
+        for field_id in members:
+            pool_id_by_field[field_id] = pool_id
+
+    # The pool takes the place of its first member so field order is kept
+    fields = []
+    for f in field_optimizer_input.fields:
+        pool_id = pool_id_by_field.get(f.id)
+        if pool_id is None:
+            fields.append(f)
+        elif pools[pool_id].field_ids[0] == f.id:
+            pool = pools[pool_id]
+            fields.append(Field(
+                id=pool_id,
+                name=pool_id,
+                size=pool.unit_size * len(pool.field_ids),
+                unavailable_start_times=f.unavailable_start_times,
+            ))
+    field_optimizer_input.fields = fields
+
+    for group in field_optimizer_input.groups:
+        preferred = []
+        for field_id in group.preferred_field_ids:
+            field_id = pool_id_by_field.get(field_id, field_id)
+            if field_id not in preferred:
+                preferred.append(field_id)
+        group.preferred_field_ids = preferred
+
+    return pools
+
+
+def assign_pooled_activities(
+    field_activities: list[FieldActivity],
+    pools: dict[str, FieldPool]
+) -> list[FieldActivity] | None:
+    """
+    Put each activity on a pooled field onto one concrete member for its
+    whole duration (first fit by start, largest groups first on ties),
+    never exceeding the size of a member at any timeslot.
+
+    Args:
+        field_activities: Activities of the pooled solution
+        pools: Pools returned by pool_identical_fields
+
+    Returns:
+        Activities on real fields, or None when the pooled solution cannot
+        be split over the members (solve the full model instead)
+    """
+    if not pools:
+        return field_activities
+
+    used: dict[tuple[str, int], int] = {}
+    assigned = []
+    pooled = sorted(
+        (a for a in field_activities if a.field in pools),
+        key=lambda a: (a.start_timeslot, -a.size),
+    )
+    for activity in pooled:
+        pool = pools[activity.field]
+        timeslots = range(activity.start_timeslot, activity.end_timeslot + 1)
+        for field_id in pool.field_ids:
+            if all(used.get((field_id, t), 0) + activity.size <= pool.unit_size
+                   for t in timeslots):
+                break
+        else:
+            return None
+        for t in timeslots:
+            used[(field_id, t)] = used.get((field_id, t), 0) + activity.size
+        assigned.append(FieldActivity(
+            field=field_id,
+            group=activity.group,
+            start_timeslot=activity.start_timeslot,
+            end_timeslot=activity.end_timeslot,
+            duration=activity.duration,
+            size=activity.size,
+        ))
+
+    return [a for a in field_activities if a.field not in pools] + assigned
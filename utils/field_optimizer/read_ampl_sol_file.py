@@ -0,0 +1,157 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+# AMPL's default solve_result_table: solve_result_num ranges -> solve_result
+SOLVE_RESULT_RANGES = (
+    (100, "solved"),
+    (200, "solved?"),
+    (300, "infeasible"),
+    (400, "unbounded"),
+    (500, "limit"),
+    (600, "failure"),
+)
+
+_OBJECTIVE_PATTERN = re.compile(r"objective\s+([-+\d.eE]+|[-+]?inf)")
+
+
+@dataclass(slots=True)
+class SolFile:
+    """Contents of an ASCII .sol file written by an AMPL solver"""
+    message: str
+    solve_result_num: int
+    variable_values: list[float]
+
+    @property
+    def solve_result(self) -> str:
+        return solve_result_from_num(self.solve_result_num)
+
+    @property
+    def objective(self) -> float | None:
+        """Objective value reported in the solve message, if any."""
+        match = _OBJECTIVE_PATTERN.search(self.message)
+        return float(match.group(1)) if match else None
+
+
+def solve_result_from_num(solve_result_num: int) -> str:
+    """Map a solve_result_num to AMPL's solve_result string."""
+    if solve_result_num < 0:
+        return "unknown"
+    for upper, name in SOLVE_RESULT_RANGES:
+        if solve_result_num < upper:
+            return name
+    return "unknown"
+
+
+def read_ampl_sol_file(sol_path: str | Path) -> SolFile:
+    """
+    Parse an ASCII .sol file (the format written for `write g` problems).
+
+    Layout: solver message, blank line, "Options" with its option values,
+    the constraint/variable counts, dual values, primal values and
+    finally "objno <n> <solve_result_num>".
+
+    Args:
+        sol_path: Path of the .sol file
+
+    Returns:
+        SolFile with the message, result code and primal values in the
+        order of the problem's .col file
+    """
+    lines = Path(sol_path).read_text().splitlines()
+    position = 0
+
+    message_lines = []
+    while position < len(lines) and lines[position].strip() != "Options":
+        message_lines.append(lines[position])
+        position += 1
+    position += 1
+
+    option_count = int(lines[position])
+    position += 1
+    # Solvers that write vbtol report two extra options
+    has_vbtol = option_count > 4
+    if has_vbtol:
+        option_count -= 2
+    position += option_count
+
+    _, dual_count, _, primal_count = (int(line) for line in lines[position:position + 4])
+    position += 4
+    if has_vbtol:
+        position += 1
+
+    position += dual_count
+    variable_values = [float(line) for line in lines[position:position + primal_count]]
+    position += primal_count
+
+    solve_result_num = -1
+    for line in lines[position:]:
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == "objno":
+            solve_result_num = int(parts[2])
+            break
+
+    return SolFile(
+        message="\n".join(message_lines).strip(),
+        solve_result_num=solve_result_num,
+        variable_values=variable_values,
+    )
+
+
+def parse_ampl_variable_name(name: str) -> tuple[str, tuple]:
+    """
+    Split a .col entry such as y['Field 1','G12',17] into
+    ("y", ("Field 1", "G12", 17)).
+
+    Args:
+        name: Variable name as written by `option auxfiles rc`
+
+    Returns:
+        Variable name and index tuple (empty for scalar variables)
+    """
+    bracket = name.find("[")
+    if bracket < 0:
+        return name, ()
+
+    subscripts = []
+    current = []
+    quote = None
+    i = bracket + 1
+    body = name[:-1] if name.endswith("]") else name
+    while i < len(body):
+        char = body[i]
+        if quote:
+            if char == quote:
+                # A doubled quote is an escaped quote
+                if i + 1 < len(body) and body[i + 1] == quote:
+                    current.append(char)
+                    i += 1
+                else:
+                    quote = None
+            else:
+                current.append(char)
+        elif char in ("'", '"'):
+            quote = char
+            current.append("\0")  # marks a quoted (string) member
+        elif char == ",":
+            subscripts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    subscripts.append("".join(current))
+
+    index = []
+    for subscript in subscripts:
+        if subscript.startswith("\0"):
+            index.append(subscript[1:])
+            continue
+        subscript = subscript.strip()
+        try:
+            index.append(int(subscript))
+        except ValueError:
+            try:
+                index.append(float(subscript))
+            except ValueError:
+                index.append(subscript)
+    return name[:bracket], tuple(index)
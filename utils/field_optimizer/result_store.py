@@ -0,0 +1,146 @@
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from threading import Condition, Lock
+from models.field_optimizer.field_optimizer_result import FieldOptimizerResult
+
+logger = logging.getLogger(__name__)
+
+# Finished results are kept this long after their last version
+RESULT_STORE_TTL_SECONDS_ENV = "RESULT_STORE_TTL_SECONDS"
+DEFAULT_TTL_SECONDS = 3600
+
+# Unfinished results are dropped this long after they were created, e.g.
+# when their background solve died without finishing them
+RESULT_STORE_MAX_RUNNING_SECONDS_ENV = "RESULT_STORE_MAX_RUNNING_SECONDS"
+DEFAULT_MAX_RUNNING_SECONDS = 1800
+
+# Results kept at most; the oldest finished ones are dropped first
+RESULT_STORE_MAX_ENTRIES_ENV = "RESULT_STORE_MAX_ENTRIES"
+DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass(slots=True)
+class StoredResult:
+    """Every published version of one progressive solve"""
+    result_id: str
+    versions: list[FieldOptimizerResult] = field(default_factory=list)
+    done: bool = False
+    updated_at: float = field(default_factory=time.monotonic)
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class ResultStore:
+    """
+    In-memory versions of progressive solves by result id. Versions are
+    numbered from 1; readers can block until a version newer than the one
+    they have is published or the solve is done.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, max_running_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.max_running_seconds = max_running_seconds
+        self.max_entries = max_entries
+        self._results: dict[str, StoredResult] = {}
+        self._condition = Condition(Lock())
+
+    def create(self) -> str:
+        """Start a new result and return its id."""
+        with self._condition:
+            self._evict()
+            result_id = uuid.uuid4().hex
+            self._results[result_id] = StoredResult(result_id=result_id)
+            return result_id
+
+    def publish(self, result_id: str, result: FieldOptimizerResult, done: bool = False) -> int:
+        """Add a version, optionally the last one. Returns its number, or 0
+        when the result was evicted."""
+        with self._condition:
+            stored = self._results.get(result_id)
+            if stored is None:
+                logger.warning("Result %s was evicted, dropping its new version", result_id)
+                return 0
+            stored.versions.append(result)
+            stored.done = stored.done or done
+            stored.updated_at = time.monotonic()
+            self._condition.notify_all()
+            return len(stored.versions)
+
+    def finish(self, result_id: str):
+        """Mark a result done without a new version."""
+        with self._condition:
+            stored = self._results.get(result_id)
+            if stored is not None:
+                stored.done = True
+                stored.updated_at = time.monotonic()
+                self._condition.notify_all()
+
+    def get(self, result_id: str) -> StoredResult | None:
+        """Snapshot of a result, or None when unknown or evicted."""
+        with self._condition:
+            stored = self._results.get(result_id)
+            if stored is None:
+                return None
+            return StoredResult(result_id=result_id, versions=list(stored.versions),
+                                done=stored.done, updated_at=stored.updated_at,
+                                created_at=stored.created_at)
+
+    def wait_for_update(self, result_id: str, after_version: int, timeout: float) -> StoredResult | None:
+        """
+        Block until the result has a version after after_version or is done,
+        or timeout seconds passed.
+
+        Returns:
+            Snapshot of the result, or None when unknown or evicted
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: result_id not in self._results
+                or self._results[result_id].done
+                or len(self._results[result_id].versions) > after_version,
+                timeout,
+            )
+        return self.get(result_id)
+
+    def _evict(self):
+        now = time.monotonic()
+        for result_id in [
+            result_id for result_id, stored in self._results.items()
+            if stored.done and now - stored.updated_at > self.ttl_seconds
+        ]:
+            del self._results[result_id]
+
+        for result_id in [
+            result_id for result_id, stored in self._results.items()
+            if not stored.done and now - stored.created_at > self.max_running_seconds
+        ]:
+            logger.warning("Evicting result %s still running after %.0f seconds",
+                           result_id, self.max_running_seconds)
+            del self._results[result_id]
+            self._condition.notify_all()
+
+        finished = sorted((s for s in self._results.values() if s.done), key=lambda s: s.updated_at)
+        while len(self._results) >= self.max_entries and finished:
+            evicted = finished.pop(0)
+            logger.info("Evicting result %s", evicted.result_id)
+            del self._results[evicted.result_id]
+
+
+_shared_store: ResultStore | None = None
+_shared_store_lock = Lock()
+
+
+def get_result_store() -> ResultStore:
+    """The process-wide result store, configured from the environment."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = ResultStore(
+                ttl_seconds=float(os.getenv(RESULT_STORE_TTL_SECONDS_ENV, DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv(RESULT_STORE_MAX_ENTRIES_ENV, DEFAULT_MAX_ENTRIES)),
+                max_running_seconds=float(os.getenv(
+                    RESULT_STORE_MAX_RUNNING_SECONDS_ENV, DEFAULT_MAX_RUNNING_SECONDS)),
+            )
+        return _shared_store
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+import numpy as np
+from utils.field_optimizer.handle_existing_activities import ProcessedActivity
+from utils.field_optimizer.objective_coefficients import (
+    PENALTY_ADJ_DAYS,
+    PENALTY_INCOMPATIBLE_GROUP_SAME_DAY,
+    PENALTY_INCOMPATIBLE_GROUP_SAME_TIME,
+    PENALTY_SHORTFALL_TIERS,
+    compute_start_coefficients,
+    get_timeslot_minutes,
+)
+from utils.field_optimizer.time_grid import BASE_TIME_SLOT_MINUTES
+
+
+@dataclass(slots=True)
+class ScoredSchedule:
+    """preference_score of a schedule by objective term (penalties negative)"""
+    breakdown: dict[str, float]
+    activity_counts: dict[str, int]
+    shortfalls: dict[str, float]
+
+    @property
+    def preference_score(self) -> float:
+        return sum(self.breakdown.values())
+
+
+def _pair_indexes(pairs: list[list[str]], row: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    known = [(row[g1], row[g2]) for g1, g2 in pairs if g1 in row and g2 in row]
+    if not known:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    first, second = zip(*known)
+    return np.array(first), np.array(second)
+
+
+def score_schedule(
+    converted_payload,
+    incompatible_same_time: list[list[str]],
+    incompatible_same_day: list[list[str]],
+    starts: list[ProcessedActivity]
+) -> ScoredSchedule:
+    """
+    Evaluate preference_score of field_optimizer.mod for a fixed schedule,
+    term by term and without a solver: the start terms of
+    compute_start_coefficients, adjacent-day, same-time and same-day
+    penalties on occupancy matrices, and shortfall tiers from start counts.
+
+    Args:
+        converted_payload: ConvertedPayload of the request
+        incompatible_same_time: Pairs as sent to INCOMPATIBLE_GROUPS_SAME_TIME
+        incompatible_same_day: Pairs as sent to INCOMPATIBLE_GROUPS_SAME_DAY
+        starts: Every activity, predefined ones included, on model indexes
+
+    Returns:
+        ScoredSchedule whose breakdown sums to the objective value
+
+    Raises:
+        ValueError: If an activity refers to an unknown stadium or team
+    """
+    field_optimizer_input = converted_payload.field_optimizer_input
+    groups = field_optimizer_input.groups
+    grid_factor = converted_payload.time_slot_duration_minutes // BASE_TIME_SLOT_MINUTES
+    coefficients = compute_start_coefficients(
+        field_optimizer_input, grid_factor, get_timeslot_minutes(converted_payload))
+
+    row = {group_id: i for i, group_id in enumerate(coefficients.group_ids)}
+    column = {t: i for i, t in enumerate(coefficients.timeslots)}
+    field_column = {field_id: i for i, field_id in enumerate(coefficients.field_ids)}
+    days = [week_day_index + 1 for week_day_index in field_optimizer_input.week_day_indexes]
+    day_column = [
+        day_idx
+        for day_idx, day_slots in enumerate(field_optimizer_input.time_slots)
+        for _ in day_slots
+    ]
+
+    for start in starts:
+        if start.group_id not in row:
+            raise ValueError(f"Team with ID '{start.group_id}' not found")
+        if start.field_id not in field_column:
+            raise ValueError(f"Stadium with ID '{start.field_id}' not found")
+
+    g_idx = np.array([row[s.group_id] for s in starts], dtype=int)
+    t_idx = np.array([column[s.start_index] for s in starts], dtype=int)
+    f_idx = np.array([field_column[s.field_id] for s in starts], dtype=int)
+
+    occupancy = np.zeros((len(groups), len(column)))
+    occupied_rows = [row[s.group_id] for s in starts for _ in s.timeslot_indexes]
+    occupied_columns = [column[t] for s in starts for t in s.timeslot_indexes]
+    np.add.at(occupancy, (occupied_rows, occupied_columns), 1)
+
+    active_days = np.zeros((len(groups), len(days)))
+    np.add.at(active_days, (g_idx, np.array(day_column, dtype=int)[t_idx]), 1)
+
+    prio = np.array([g.priority for g in groups], dtype=float)
+
+    breakdown = {
+        "activity": coefficients.activity[g_idx, t_idx].sum(),
+        "preferred_start": coefficients.preferred_start[g_idx, t_idx].sum(),
+        "start_time": coefficients.start_time[g_idx, t_idx].sum(),
+        "field_preference": coefficients.field_preference[g_idx, f_idx].sum(),
+        "late_start": coefficients.late_start[g_idx, t_idx].sum(),
+    }
+
+    adjacent = [(i, i + 1) for i in range(len(days) - 1) if days[i + 1] == days[i] + 1]
+    if adjacent:
+        first, second = (np.array(c) for c in zip(*adjacent))
+        both = active_days[:, first] * active_days[:, second]
+        breakdown["adjacent_days"] = -PENALTY_ADJ_DAYS * (both.sum(axis=1) * prio).sum()
+    else:
+        breakdown["adjacent_days"] = 0.0
+
+    first, second = _pair_indexes(incompatible_same_time, row)
+    overlap = (occupancy[first] * occupancy[second]).sum(axis=1)
+    breakdown["incompatible_same_time"] = -(
+        PENALTY_INCOMPATIBLE_GROUP_SAME_TIME * grid_factor
+        * ((prio[first] + prio[second]) / 2 * overlap).sum())
+
+    first, second = _pair_indexes(incompatible_same_day, row)
+    overlap = (active_days[first] * active_days[second]).sum(axis=1)
+    breakdown["incompatible_same_day"] = -(
+        PENALTY_INCOMPATIBLE_GROUP_SAME_DAY
+        * ((prio[first] + prio[second]) / 2 * overlap).sum())
+
+    counts = np.bincount(g_idx, minlength=len(groups))
+    n_min = np.array([g.minimum_number_of_activities for g in groups])
+    shortfall = np.maximum(0, n_min - counts)
+    tiers = (
+        np.minimum(1, shortfall),
+        np.clip(shortfall - 1, 0, 1),
+        np.maximum(0, shortfall - 2),
+    )
+    breakdown["shortfall"] = -sum(
+        penalty * (tier * prio).sum() for penalty, tier in zip(PENALTY_SHORTFALL_TIERS, tiers))
+
+    return ScoredSchedule(
+        breakdown={name: float(value) for name, value in breakdown.items()},
+        activity_counts={g.id: int(c) for g, c in zip(groups, counts) if c},
+        shortfalls={g.id: float(s) for g, s in zip(groups, shortfall) if s},
+    )
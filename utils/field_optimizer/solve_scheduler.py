@@ -0,0 +1,202 @@
+import asyncio
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from threading import Condition, Lock
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+Lane = Literal["interactive", "standard", "batch"]
+
+# Admission order: a waiting ticket of an earlier lane always goes first
+LANES: tuple[Lane, ...] = ("interactive", "standard", "batch")
+
+# Solves running at once in this worker
+SOLVE_CONCURRENCY_ENV = "SOLVE_CONCURRENCY"
+DEFAULT_CONCURRENCY = 2
+
+# Slots only interactive solves may use
+SOLVE_INTERACTIVE_RESERVED_ENV = "SOLVE_INTERACTIVE_RESERVED"
+DEFAULT_INTERACTIVE_RESERVED = 1
+
+# Batch solves running at once, within the unreserved slots
+SOLVE_BATCH_CONCURRENCY_ENV = "SOLVE_BATCH_CONCURRENCY"
+DEFAULT_BATCH_CONCURRENCY = 1
+
+
+@dataclass(eq=False)
+class SolveTicket:
+    """A request's place in the scheduler, from enqueue to release"""
+    lane: Lane
+    expected_seconds: float
+    sequence: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    initial_position: int = 0  # waiting tickets ahead when enqueued
+
+    @property
+    def admitted(self) -> bool:
+        return self.started_at is not None
+
+
+class SolveScheduler:
+    """
+    Admits solves by lane with strict priority: interactive before standard
+    before batch, first come first served within a lane. Interactive solves
+    may use every slot, standard and batch solves only the unreserved ones,
+    and batch at most batch_concurrency of those. A waiting higher lane
+    defers every lower one; running solves are never interrupted.
+    """
+
+    def __init__(self, concurrency: int, interactive_reserved: int, batch_concurrency: int):
+        shared = max(1, concurrency - interactive_reserved)
+        self.concurrency = max(1, concurrency)
+        self.limits: dict[Lane, int] = {
+            "interactive": self.concurrency,
+            "standard": shared,
+            "batch": max(1, min(batch_concurrency, shared)),
+        }
+        # Slots of the whole worker each lane may count on
+        self._total_limits: dict[Lane, int] = {
+            "interactive": self.concurrency,
+            "standard": shared,
+            "batch": shared,
+        }
+        self._waiting: list[SolveTicket] = []
+        self._running: list[SolveTicket] = []
+        # Tasks suspended in wait_async, resolved from whichever thread admits
+        self._async_waiters: dict[
+            SolveTicket, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._sequence = itertools.count()
+        self._condition = Condition(Lock())
+
+    def enqueue(self, lane: Lane, expected_seconds: float) -> SolveTicket:
+        """Queue a solve; it is admitted right away when a slot is free."""
+        with self._condition:
+            ticket = SolveTicket(lane=lane, expected_seconds=expected_seconds,
+                                 sequence=next(self._sequence))
+            self._waiting.append(ticket)
+            self._waiting.sort(key=lambda t: (LANES.index(t.lane), t.sequence))
+            self._admit()
+            if not ticket.admitted:
+                ticket.initial_position = self._waiting.index(ticket)
+                logger.info("Queued %s solve at position %d", lane, ticket.initial_position)
+            return ticket
+
+    def wait(self, ticket: SolveTicket, timeout: float | None = None) -> bool:
+        """Block until the ticket is admitted or timeout seconds passed.
+        Returns whether it was admitted."""
+        with self._condition:
+            return self._condition.wait_for(lambda: ticket.admitted, timeout)
+
+    async def wait_async(self, ticket: SolveTicket, timeout: float | None = None) -> bool:
+        """Like wait, but suspends the calling task instead of blocking a
+        thread, so queued requests do not hold thread pool workers."""
+        loop = asyncio.get_running_loop()
+        admitted = loop.create_future()
+        waiter = (loop, admitted)
+        with self._condition:
+            if ticket.admitted:
+                return True
+            self._async_waiters.setdefault(ticket, []).append(waiter)
+        try:
+            await asyncio.wait_for(admitted, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                waiters = self._async_waiters.get(ticket, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._async_waiters.pop(ticket, None)
+        return ticket.admitted
+
+    def release(self, ticket: SolveTicket):
+        """Free the slot of a finished solve, or drop a ticket still waiting
+        (e.g. the client disconnected)."""
+        with self._condition:
+            if ticket in self._running:
+                self._running.remove(ticket)
+            elif ticket in self._waiting:
+                self._waiting.remove(ticket)
+            self._async_waiters.pop(ticket, None)
+            self._admit()
+
+    def position(self, ticket: SolveTicket) -> int:
+        """Waiting tickets that will be admitted before this one."""
+        with self._condition:
+            return self._waiting.index(ticket) if ticket in self._waiting else 0
+
+    def estimated_wait_seconds(self, ticket: SolveTicket) -> float:
+        """
+        Rough wait until the ticket starts: the expected remaining time of
+        the running solves and the expected time of the tickets ahead,
+        spread over the slots the ticket's lane may use.
+        """
+        with self._condition:
+            if ticket.admitted or ticket not in self._waiting:
+                return 0.0
+            now = time.monotonic()
+            remaining = sum(max(0.0, t.expected_seconds - (now - t.started_at))
+                            for t in self._running)
+            ahead = sum(t.expected_seconds for t in self._waiting[:self._waiting.index(ticket)])
+            return (remaining + ahead) / self._total_limits[ticket.lane]
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                lane: {
+                    "running": sum(t.lane == lane for t in self._running),
+                    "waiting": sum(t.lane == lane for t in self._waiting),
+                    "limit": self.limits[lane],
+                }
+                for lane in LANES
+            }
+
+    def _can_run(self, lane: Lane) -> bool:
+        running_in_lane = sum(t.lane == lane for t in self._running)
+        return (len(self._running) < self._total_limits[lane]
+                and running_in_lane < self.limits[lane])
+
+    def _admit(self):
+        admitted = False
+        while self._waiting and self._can_run(self._waiting[0].lane):
+            ticket = self._waiting.pop(0)
+            ticket.started_at = time.monotonic()
+            self._running.append(ticket)
+            admitted = True
+            for loop, future in self._async_waiters.pop(ticket, []):
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                except RuntimeError:
+                    pass  # the waiting loop is closed
+        if admitted:
+            self._condition.notify_all()
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+_shared_scheduler: SolveScheduler | None = None
+_shared_scheduler_lock = Lock()
+
+
+def get_solve_scheduler() -> SolveScheduler:
+    """The process-wide solve scheduler, configured from the environment."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = SolveScheduler(
+                concurrency=int(os.getenv(SOLVE_CONCURRENCY_ENV, DEFAULT_CONCURRENCY)),
+                interactive_reserved=int(os.getenv(
+                    SOLVE_INTERACTIVE_RESERVED_ENV, DEFAULT_INTERACTIVE_RESERVED)),
+                batch_concurrency=int(os.getenv(
+                    SOLVE_BATCH_CONCURRENCY_ENV, DEFAULT_BATCH_CONCURRENCY)),
+            )
+        return _shared_scheduler
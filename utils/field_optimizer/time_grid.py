@@ -0,0 +1,75 @@
+from models.field_optimizer.field_optimizer_payload import FieldOptimizerPayload
+from utils.datetime import time_string_to_minutes
+
+# Payload timeslot ids are always on the 15-minute grid (96 per day)
+BASE_TIME_SLOT_MINUTES = 15
+BASE_SLOTS_PER_DAY = (24 * 60) // BASE_TIME_SLOT_MINUTES
+
+# Coarser grids tried from coarsest to finest
+CANDIDATE_GRID_MINUTES = (60, 30)
+
+
+def _is_aligned(payload: FieldOptimizerPayload, grid_minutes: int) -> bool:
+    factor = grid_minutes // BASE_TIME_SLOT_MINUTES
+
+    times = [payload.start_time, payload.end_time]
+    for team in payload.teams:
+        if team.duration % factor:
+            return False
+        for tr in team.time_ranges or [team.time_range]:
+            times.extend((tr.start_time, tr.end_time))
+    if any(time_string_to_minutes(t) % grid_minutes for t in times):
+        return False
+
+    for activity in payload.existing_team_activities:
+        if (activity.start_timeslot - 1) % factor or activity.duration_slots % factor:
+            return False
+
+    # Closures must cover whole grid slots
+    for stadium in payload.stadiums:
+        unavailable = set(stadium.unavailable_start_times)
+        for timeslot_id in unavailable:
+            block_start = timeslot_id - (timeslot_id - 1) % factor
+            if any(block_start + i not in unavailable for i in range(factor)):
+                return False
+
+    return True
+
+
+def detect_time_grid_minutes(payload: FieldOptimizerPayload) -> int:
+    """
+    Find the coarsest grid (60, 30 or 15 minutes) on which every time in
+    the payload falls exactly: window, team ranges and durations,
+    predefined activities and field closures.
+
+    On that grid activities only start on whole grid slots. Rounding the
+    starts of any feasible 15-minute plan down to the grid keeps it feasible
+    (windows, closures and durations are on the grid), so the same number
+    of activities fits with a half or a quarter of the timeslots. Soft
+    terms (start-time weights, overlap of incompatible groups) may score
+    slightly differently; set auto_time_grid=False to keep 15 minutes.
+
+    Args:
+        payload: The request payload (timeslot ids on the 15-minute grid)
+
+    Returns:
+        Grid size in minutes
+    """
+    for grid_minutes in CANDIDATE_GRID_MINUTES:
+        if _is_aligned(payload, grid_minutes):
+            return grid_minutes
+    return BASE_TIME_SLOT_MINUTES
+
+
+def convert_timeslot_id_to_grid(timeslot_id: int, grid_minutes: int) -> int:
+    """Map a 15-minute timeslot id to the id of the grid slot containing it."""
+    factor = grid_minutes // BASE_TIME_SLOT_MINUTES
+    day_index, offset = divmod(timeslot_id - 1, BASE_SLOTS_PER_DAY)
+    return day_index * (BASE_SLOTS_PER_DAY // factor) + offset // factor + 1
+
+
+def convert_grid_timeslot_id_to_base(grid_timeslot_id: int, grid_minutes: int) -> int:
+    """Map a grid timeslot id back to the 15-minute id where it starts."""
+    factor = grid_minutes // BASE_TIME_SLOT_MINUTES
+    day_index, offset = divmod(grid_timeslot_id - 1, BASE_SLOTS_PER_DAY // factor)
+    return day_index * BASE_SLOTS_PER_DAY + offset * factor + 1
@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from threading import Lock
+from models.field_optimizer.field_optimizer_payload import TimeRange
+from .convert_time_range_to_timeslot_ids import (
+    TIME_SLOT_DURATION_MINUTES,
+    convert_time_range_to_timeslot_ids,
+)
+
+MAX_SHARED_MEMOS = 32
+
+# Signatures remembered per memo and kind (ranges, unions), least recently
+# used dropped first; a club uses a handful, a long-running worker many
+MAX_MEMO_ENTRIES = 1024
+
+RangeSignature = tuple[str, str, tuple[int, ...]]
+
+
+def fingerprint_timeslot_map(timeslot_to_index_map: dict[int, int]) -> int:
+    """Hash of a timeslot map, identical for maps built from the same window."""
+    return hash(tuple(timeslot_to_index_map.items()))
+
+
+class TimeslotIdMemo:
+    """
+    Memo of time range -> start index conversions for one timeslot map.
+
+    Teams in a club mostly share a handful of (start, end, days, duration)
+    combinations, so each distinct signature is converted once and the
+    result is shared as an immutable tuple.
+    """
+
+    def __init__(
+        self,
+        timeslot_to_index_map: dict[int, int],
+        fingerprint: int | None = None,
+        time_slot_minutes: int = TIME_SLOT_DURATION_MINUTES
+    ):
+        self.timeslot_to_index_map = timeslot_to_index_map
+        self.time_slot_minutes = time_slot_minutes
+        self.fingerprint = (
+            fingerprint if fingerprint is not None
+            else fingerprint_timeslot_map(timeslot_to_index_map)
+        )
+        self._ranges: OrderedDict[tuple[RangeSignature, int], tuple[int, ...]] = OrderedDict()
+        self._unions: OrderedDict[tuple[tuple[RangeSignature, ...], int], tuple[int, ...]] = OrderedDict()
+        self._lock = Lock()
+
+    def _lookup(self, entries: OrderedDict, key) -> tuple[int, ...] | None:
+        with self._lock:
+            ids = entries.get(key)
+            if ids is not None:
+                entries.move_to_end(key)
+            return ids
+
+    def _store(self, entries: OrderedDict, key, ids: tuple[int, ...]):
+        with self._lock:
+            entries[key] = ids
+            entries.move_to_end(key)
+            while len(entries) > MAX_MEMO_ENTRIES:
+                entries.popitem(last=False)
+
+    @staticmethod
+    def _signature(time_range: TimeRange) -> RangeSignature:
+        return (time_range.start_time, time_range.end_time,
+                tuple(sorted(time_range.day_indexes)))
+
+    def convert_time_range(self, time_range: TimeRange, duration_slots: int = 1) -> tuple[int, ...]:
+        """Memoized convert_time_range_to_timeslot_ids."""
+        key = (self._signature(time_range), duration_slots)
+        ids = self._lookup(self._ranges, key)
+        if ids is None:
+            ids = tuple(convert_time_range_to_timeslot_ids(
+                time_range, self.timeslot_to_index_map, duration_slots,
+                self.time_slot_minutes))
+            self._store(self._ranges, key, ids)
+        return ids
+
+    def convert_time_ranges(self, time_ranges: list[TimeRange], duration_slots: int = 1) -> tuple[int, ...]:
+        """Memoized convert_time_ranges_to_timeslot_ids (sorted union)."""
+        key = (tuple(self._signature(tr) for tr in time_ranges), duration_slots)
+        ids = self._lookup(self._unions, key)
+        if ids is None:
+            if len(time_ranges) == 1:
+                ids = tuple(sorted(set(self.convert_time_range(time_ranges[0], duration_slots))))
+            else:
+                all_ids: set[int] = set()
+                for tr in time_ranges:
+                    all_ids.update(self.convert_time_range(tr, duration_slots))
+                ids = tuple(sorted(all_ids))
+            self._store(self._unions, key, ids)
+        return ids
+
+
+_shared_memos: OrderedDict[tuple[int, int], TimeslotIdMemo] = OrderedDict()
+_shared_memos_lock = Lock()
+
+
+def get_timeslot_id_memo(
+    timeslot_to_index_map: dict[int, int],
+    time_slot_minutes: int = TIME_SLOT_DURATION_MINUTES
+) -> TimeslotIdMemo:
+    """
+    Get the memo for a timeslot map, shared between requests whose
+    optimization window and grid produce the same map (bounded LRU).
+    """
+    fingerprint = fingerprint_timeslot_map(timeslot_to_index_map)
+    key = (fingerprint, time_slot_minutes)
+
+    with _shared_memos_lock:
+        memo = _shared_memos.get(key)
+        if memo is not None and memo.timeslot_to_index_map == timeslot_to_index_map:
+            _shared_memos.move_to_end(key)
+            return memo
+
+        memo = TimeslotIdMemo(timeslot_to_index_map, fingerprint, time_slot_minutes)
+        _shared_memos[key] = memo
+        if len(_shared_memos) > MAX_SHARED_MEMOS:
+            _shared_memos.popitem(last=False)
+        return memo
@@ -0,0 +1,99 @@
+import logging
+from typing import TYPE_CHECKING
+from utils.field_optimizer.build_ampl_data import AmplData
+
+if TYPE_CHECKING:
+    from amplpy import AMPL
+
+logger = logging.getLogger(__name__)
+
+# Sets that index variables and derived params; a change means a new model
+STRUCTURAL_SETS = ("F", "G", "T", "D", "ST")
+STRUCTURAL_INDEXED_SETS = ("DT",)
+
+
+def requires_model_rebuild(previous: AmplData, data: AmplData) -> bool:
+    """True when the model's indexing sets differ and data cannot be patched in."""
+    return (
+        any(previous.sets.get(name) != data.sets.get(name) for name in STRUCTURAL_SETS)
+        or any(previous.indexed_sets.get(name) != data.indexed_sets.get(name)
+               for name in STRUCTURAL_INDEXED_SETS)
+    )
+
+
+def update_ampl_data(ampl: "AMPL", previous: AmplData, data: AmplData) -> int:
+    """
+    Send only what changed between two AmplData with the same structure.
+
+    Variable values of the previous solve are kept, so they serve as the
+    starting point of the next one. Fixed variables that disappeared are
+    unfixed and new ones are fixed. A param that lost entries (e.g.
+    start_value after a group's allowed times shrank) is reset to its
+    defaults and sent whole, as AMPL cannot unset single entries.
+
+    Args:
+        ampl: AMPL instance holding previous
+        previous: Data currently loaded
+        data: Data to load; requires_model_rebuild(previous, data) must be False
+
+    Returns:
+        Number of sets, set members, param values and fixings sent
+    """
+    changes = 0
+
+    for name, members in data.sets.items():
+        if name not in STRUCTURAL_SETS and previous.sets.get(name) != members:
+            ampl.set[name] = members
+            changes += 1
+    for name in previous.sets.keys() - data.sets.keys():
+        ampl.set[name] = []
+        changes += 1
+
+    for name, members_by_index in data.indexed_sets.items():
+        if name in STRUCTURAL_INDEXED_SETS:
+            continue
+        previous_members = previous.indexed_sets.get(name, {})
+        indexed_set = ampl.set[name]
+        for index, members in members_by_index.items():
+            if previous_members.get(index) != members:
+                indexed_set[index] = members
+                changes += 1
+
+    for name, values_by_index in data.params.items():
+        previous_values = previous.params.get(name, {})
+        param = ampl.param[name]
+        if previous_values.keys() - values_by_index.keys():
+            ampl.eval(f"reset data {name};")
+            param.set_values(values_by_index)
+            changes += len(values_by_index)
+            continue
+        for index, value in values_by_index.items():
+            if previous_values.get(index) != value:
+                param[index] = value
+                changes += 1
+
+    for name in previous.params.keys() - data.params.keys():
+        ampl.eval(f"reset data {name};")
+        changes += 1
+
+    for name, value in data.scalar_params.items():
+        if previous.scalar_params.get(name) != value:
+            ampl.param[name] = value
+            changes += 1
+
+    previous_fixed = set(previous.fixed_variables)
+    fixed = set(data.fixed_variables)
+    for var_name, index in previous_fixed - fixed:
+        try:
+            ampl.var[var_name][index].unfix()
+            changes += 1
+        except Exception as e:
+            logger.error("Could not unfix %s%s: %s", var_name, list(index), e)
+    for var_name, index in fixed - previous_fixed:
+        try:
+            ampl.var[var_name][index].fix(1)
+            changes += 1
+        except Exception as e:
+            logger.error("Could not fix %s%s: %s", var_name, list(index), e)
+
+    return changes
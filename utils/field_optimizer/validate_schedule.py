@@ -0,0 +1,161 @@
+from models.field_optimizer.field_optimizer_result import Activity
+from models.field_optimizer.schedule_validation import ScheduleViolation
+from utils.datetime import minutes_to_time_string
+from utils.field_optimizer.convert_result_activities_to_starts import (
+    convert_result_activities_to_starts
+)
+from utils.field_optimizer.field_occupancy import FieldOccupancy
+from utils.field_optimizer.handle_existing_activities import ProcessedActivity
+from utils.field_optimizer.time_grid import BASE_SLOTS_PER_DAY, BASE_TIME_SLOT_MINUTES
+
+
+def _overloaded_runs(
+    overloaded: list[tuple[str, int, int, int]],
+    day_of_index: dict[int, int]
+) -> list[tuple[str, list[int], int, int]]:
+    """Merge consecutive overloaded timeslots of a field within a day:
+    (field, indexes, max demand, capacity)."""
+    runs = []
+    for field_id, index, demand, capacity in overloaded:
+        previous = runs[-1] if runs else None
+        if (previous and previous[0] == field_id and previous[1][-1] == index - 1
+                and day_of_index[index - 1] == day_of_index[index]):
+            runs[-1][1].append(index)
+            runs[-1][2] = max(runs[-1][2], demand)
+        else:
+            runs.append([field_id, [index], demand, capacity])
+    return [tuple(run) for run in runs]
+
+
+def validate_schedule(
+    converted_payload,
+    activities: list[Activity],
+    fixed_activities: list[ProcessedActivity]
+) -> list[ScheduleViolation]:
+    """
+    Check a schedule against the hard constraints of field_optimizer.mod:
+    field capacity (with predefined activities), unavailable field times,
+    allowed starts, duration, no late starts, one activity per day and
+    the maximum number of activities.
+
+    Args:
+        converted_payload: ConvertedPayload of a 15-minute conversion, after
+            preprocess_existing_activities
+        activities: The schedule as in FieldOptimizerResult.activities
+        fixed_activities: Predefined activities from preprocessing
+
+    Returns:
+        Every violation found, empty for a feasible schedule
+    """
+    field_optimizer_input = converted_payload.field_optimizer_input
+    index_to_timeslot_map = converted_payload.index_to_timeslot_map
+    groups_by_id = {g.id: g for g in field_optimizer_input.groups}
+    fields_by_id = {f.id: f for f in field_optimizer_input.fields}
+
+    day_of_index = {}
+    last_index_of_day = {}
+    for day_idx, day_slots in enumerate(field_optimizer_input.time_slots):
+        for t in day_slots:
+            day_of_index[t] = day_idx
+        last_index_of_day[day_idx] = day_slots[-1]
+
+    def week_day(index: int) -> int:
+        return (index_to_timeslot_map[index] - 1) // BASE_SLOTS_PER_DAY
+
+    def time_range(indexes: list[int]) -> str:
+        start, end = (
+            ((index_to_timeslot_map[t] - 1) % BASE_SLOTS_PER_DAY) * BASE_TIME_SLOT_MINUTES
+            for t in (indexes[0], indexes[-1]))
+        return f"{minutes_to_time_string(start)}-{minutes_to_time_string(end + BASE_TIME_SLOT_MINUTES)}"
+
+    violations = []
+    occupancy = FieldOccupancy(field_optimizer_input.fields, list(day_of_index))
+    # (activity position or None, start) of everything occupying a field
+    placed: list[tuple[int | None, ProcessedActivity]] = [(None, a) for a in fixed_activities]
+
+    for position, activity in enumerate(activities):
+        team_id, stadium_id = activity.team.id, activity.stadium.id
+        group = groups_by_id.get(team_id)
+        field = fields_by_id.get(stadium_id)
+        if group is None or field is None:
+            violations.append(ScheduleViolation(
+                type="unknown_reference",
+                message=(f"Team '{team_id}' is not included" if group is None
+                         else f"Stadium '{stadium_id}' not found"),
+                team_id=team_id, stadium_id=stadium_id,
+                index_week_day=activity.index_week_day, activity_indexes=[position]))
+            continue
+        try:
+            start = convert_result_activities_to_starts(
+                [activity], converted_payload.timeslot_to_index_map)[0]
+        except ValueError as e:
+            violations.append(ScheduleViolation(
+                type="outside_window", message=str(e),
+                team_id=team_id, stadium_id=stadium_id,
+                index_week_day=activity.index_week_day, activity_indexes=[position]))
+            continue
+
+        def add(violation_type: str, message: str):
+            violations.append(ScheduleViolation(
+                type=violation_type, message=message,
+                team_id=team_id, stadium_id=stadium_id,
+                index_week_day=activity.index_week_day, activity_indexes=[position]))
+
+        indexes = start.timeslot_indexes
+        if start.start_index not in group.possible_start_times:
+            add("start_not_allowed",
+                f"Team '{team_id}' may not start at {activity.start_time} on day {activity.index_week_day}")
+        if len(indexes) != group.duration:
+            add("duration",
+                f"Activity of team '{team_id}' lasts {len(indexes)} slots instead of {group.duration}")
+        if start.start_index + group.duration - 1 > last_index_of_day[day_of_index[start.start_index]]:
+            add("late_start",
+                f"Activity of team '{team_id}' at {activity.start_time} runs past the end of the day")
+        closed = sorted(set(indexes).intersection(field.unavailable_start_times))
+        if closed:
+            add("unavailable", f"Stadium '{stadium_id}' is unavailable {time_range(closed)}")
+
+        placed.append((position, start))
+
+    for _, start in placed:
+        occupancy.add(start.field_id, start.timeslot_indexes,
+                      groups_by_id[start.group_id].size_required)
+
+    for field_id, indexes, demand, capacity in _overloaded_runs(occupancy.overloaded(), day_of_index):
+        positions = [
+            position for position, start in placed
+            if position is not None and start.field_id == field_id
+            and not set(start.timeslot_indexes).isdisjoint(indexes)
+        ]
+        violations.append(ScheduleViolation(
+            type="capacity",
+            message=(f"Stadium '{field_id}' needs {demand} of {capacity} "
+                     f"on day {week_day(indexes[0])} {time_range(indexes)}"),
+            stadium_id=field_id, index_week_day=week_day(indexes[0]),
+            activity_indexes=positions))
+
+    positions_by_group_day: dict[tuple[str, int], list[int | None]] = {}
+    positions_by_group: dict[str, list[int | None]] = {}
+    for position, start in placed:
+        day_idx = day_of_index[start.start_index]
+        positions_by_group_day.setdefault((start.group_id, day_idx), []).append(position)
+        positions_by_group.setdefault(start.group_id, []).append(position)
+
+    for (group_id, day_idx), positions in positions_by_group_day.items():
+        if len(positions) > 1:
+            index_week_day = field_optimizer_input.week_day_indexes[day_idx]
+            violations.append(ScheduleViolation(
+                type="one_per_day",
+                message=f"Team '{group_id}' has {len(positions)} activities on day {index_week_day}",
+                team_id=group_id, index_week_day=index_week_day,
+                activity_indexes=[p for p in positions if p is not None]))
+
+    for group_id, positions in positions_by_group.items():
+        maximum = groups_by_id[group_id].maximum_number_of_activities
+        if len(positions) > maximum:
+            violations.append(ScheduleViolation(
+                type="max_activities",
+                message=f"Team '{group_id}' has {len(positions)} activities, at most {maximum} allowed",
+                team_id=group_id, activity_indexes=[p for p in positions if p is not None]))
+
+    return violations
@@ -0,0 +1,17 @@
+from utils.serialization.convert_result_to_compact import convert_result_to_compact
+from utils.serialization.decode_request_middleware import DecodeRequestMiddleware
+from utils.serialization.encode_response import encode_response
+from utils.serialization.wire_format import (
+    decode_request_body,
+    encode_model,
+    negotiate_media_type,
+)
+
+__all__ = [
+    "convert_result_to_compact",
+    "DecodeRequestMiddleware",
+    "encode_response",
+    "decode_request_body",
+    "encode_model",
+    "negotiate_media_type",
+]
@@ -0,0 +1,83 @@
+from models.field_optimizer.compact_field_optimizer_result import (
+    CompactActivities,
+    CompactAlternativeSchedule,
+    CompactFieldOptimizerResult,
+)
+from models.field_optimizer.field_optimizer_result import (
+    Activity,
+    FieldOptimizerResult,
+    Stadium,
+    Team,
+)
+
+
+def convert_result_to_compact(
+    result: FieldOptimizerResult
+) -> CompactFieldOptimizerResult:
+    """
+    Dictionary-encode teams and stadiums and store activities column-wise.
+
+    Args:
+        result: The regular optimizer result
+
+    Returns:
+        CompactFieldOptimizerResult where each team and stadium appears once
+        and activities reference them by position
+    """
+    stadiums: list[Stadium] = []
+    stadium_positions: dict[str, int] = {}
+    teams: list[Team] = []
+    team_positions: dict[str, int] = {}
+
+    def encode(activities: list[Activity]) -> CompactActivities:
+        columns = CompactActivities(
+            stadium=[], team=[], index_week_day=[],
+            start_time=[], end_time=[], size=[])
+
+        for activity in activities:
+            stadium_position = stadium_positions.get(activity.stadium.id)
+            if stadium_position is None:
+                stadium_position = stadium_positions[activity.stadium.id] = len(stadiums)
+                stadiums.append(activity.stadium)
+
+            team_position = team_positions.get(activity.team.id)
+            if team_position is None:
+                team_position = team_positions[activity.team.id] = len(teams)
+                teams.append(activity.team)
+
+            columns.stadium.append(stadium_position)
+            columns.team.append(team_position)
+            columns.index_week_day.append(activity.index_week_day)
+            columns.start_time.append(activity.start_time)
+            columns.end_time.append(activity.end_time)
+            columns.size.append(activity.size)
+
+        return columns
+
+    columns = encode(result.activities)
+    # Alternatives share the stadium and team tables of the main schedule
+    alternatives = None
+    if result.alternatives is not None:
+        alternatives = [
+            CompactAlternativeSchedule(
+                rank=alternative.rank,
+                preference_score=alternative.preference_score,
+                activities=encode(alternative.activities),
+                activities_not_generated=alternative.activities_not_generated,
+            )
+            for alternative in result.alternatives
+        ]
+
+    return CompactFieldOptimizerResult(
+        result=result.result,
+        duration_ms=result.duration_ms,
+        preference_score=result.preference_score,
+        stadiums=stadiums,
+        teams=teams,
+        activities=columns,
+        activities_not_generated=result.activities_not_generated,
+        error_message=result.error_message,
+        iterations=result.iterations,
+        alternatives=alternatives,
+        capacity_analysis=result.capacity_analysis,
+    )
@@ -0,0 +1,65 @@
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.serialization.wire_format import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    decode_request_body,
+)
+
+
+class DecodeRequestMiddleware:
+    """
+    ASGI middleware that accepts msgpack and gzip request bodies by decoding
+    them to JSON before FastAPI validates the payload.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        content_encoding = headers.get("content-encoding", "").strip().lower()
+        if content_type not in MSGPACK_MEDIA_TYPES and content_encoding != "gzip":
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        try:
+            body = decode_request_body(body, content_type, content_encoding)
+        except ValueError as e:
+            response = JSONResponse(status_code=400, content={"detail": str(e)})
+            await response(scope, receive, send)
+            return
+
+        decoded_headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length", b"content-type")
+        ]
+        if content_type in MSGPACK_MEDIA_TYPES:
+            content_type = JSON_MEDIA_TYPE
+        if content_type:
+            decoded_headers.append((b"content-type", content_type.encode("latin-1")))
+        decoded_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        body_sent = False
+
+        async def receive_decoded() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(dict(scope, headers=decoded_headers), receive_decoded, send)
@@ -0,0 +1,26 @@
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from utils.serialization.wire_format import (
+    GZIP_MIN_BYTES,
+    accepts_gzip,
+    encode_model,
+    gzip_body,
+    negotiate_media_type,
+)
+
+
+def encode_response(model: BaseModel, request: Request) -> Response:
+    """
+    Encode a result model according to the request's Accept and
+    Accept-Encoding headers (JSON or msgpack, gzip for large bodies).
+    """
+    media_type = negotiate_media_type(request.headers.get("accept"))
+    body = encode_model(model, media_type)
+    headers = {"Vary": "Accept, Accept-Encoding"}
+
+    if len(body) >= GZIP_MIN_BYTES and accepts_gzip(request.headers.get("accept-encoding")):
+        body = gzip_body(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,61 @@
+import gzip
+import zlib
+import msgpack
+import orjson
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+GZIP_MIN_BYTES = 4096  # smaller bodies are not worth compressing
+GZIP_LEVEL = 5
+MAX_DECODED_BYTES = 64 * 1024 * 1024  # guards against compressed bombs
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """Pick the response media type from an Accept header (JSON by default)."""
+    if accept and any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    return bool(accept_encoding) and "gzip" in accept_encoding.lower()
+
+
+def encode_model(model: BaseModel, media_type: str) -> bytes:
+    """Serialize a pydantic model as msgpack or JSON (orjson)."""
+    data = model.model_dump()
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(data)
+    return orjson.dumps(data)
+
+
+def gzip_body(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def decode_request_body(body: bytes, content_type: str, content_encoding: str) -> bytes:
+    """
+    Turn a gzip and/or msgpack request body into the JSON body FastAPI expects.
+
+    Raises:
+        ValueError: If the body cannot be decoded or is too large once decoded
+    """
+    if content_encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(body, MAX_DECODED_BYTES)
+        except zlib.error as e:
+            raise ValueError(f"Invalid gzip body: {e}")
+        if decompressor.unconsumed_tail:
+            raise ValueError("Decoded body too large")
+
+    if content_type in MSGPACK_MEDIA_TYPES:
+        try:
+            body = orjson.dumps(msgpack.unpackb(body))
+        except (ValueError, TypeError, msgpack.UnpackException, orjson.JSONEncodeError) as e:
+            raise ValueError(f"Invalid msgpack body: {e}")
+
+    return body
@@ -1,14 +1,26 @@
 from utils.time_slots.generate_time_slots import generate_time_slots
+from utils.time_slots.get_time_slot_table import (
+    TimeSlotTable, get_time_slot_table, get_day_offsets_in_range
+)
 from utils.time_slots.generate_time_slots_for_week import generate_time_slots_for_week
-from utils.time_slots.generate_time_slots_in_range import generate_time_slots_in_range
+from utils.time_slots.generate_time_slots_in_range import (
+    generate_time_slots_in_range,
+    generate_time_slots_in_minute_range,
+    generate_time_slots_in_day_windows
+)
 from utils.time_slots.get_timeslot_ids_by_week_day import get_timeslot_ids_by_week_day
 from utils.time_slots.get_day_for_timeslot import get_day_for_timeslot
 
 
 __all__ = [
+    "TimeSlotTable",
     "generate_time_slots",
     "generate_time_slots_for_week",
     "generate_time_slots_in_range",
+    "generate_time_slots_in_minute_range",
+    "generate_time_slots_in_day_windows",
+    "get_time_slot_table",
+    "get_day_offsets_in_range",
     "get_timeslot_ids_by_week_day",
     "get_day_for_timeslot",
 ]
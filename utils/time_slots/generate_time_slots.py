@@ -1,4 +1,6 @@
-from utils.datetime import convert_time_to_datetime
+from utils.datetime import minutes_to_time_string, time_string_to_minutes
+
+MINUTES_PER_DAY = 24 * 60
 
 
 def generate_time_slots(
@@ -21,28 +23,11 @@ def generate_time_slots(
     if min_interval not in valid_min_intervals:
         raise ValueError("min_interval must be 15, 30 or 60")
 
-    slots = []
-    start_datetime = convert_time_to_datetime(start_time)
-    end_datetime = convert_time_to_datetime(end_time)
-
-    current_slot = start_datetime
-    while current_slot <= end_datetime:
-        slots.append(current_slot.strftime("%H:%M"))
-
-        # Calculate new minute value and handle overflow
-        new_minute = current_slot.minute + min_interval
-        new_hour = current_slot.hour + new_minute // 60
-        new_minute = new_minute % 60
-
-        # Handle hour overflow (hours can go beyond 23)
-        if new_hour >= 24:
-            # If we go beyond 23:59, we should stop the loop
-            # This happens when we've generated all slots for the day
-            break
-
-        current_slot = current_slot.replace(
-            hour=new_hour,
-            minute=new_minute
-        )
+    start_minutes = time_string_to_minutes(start_time)
+    # Slots never run past the end of the day
+    end_minutes = min(time_string_to_minutes(end_time), MINUTES_PER_DAY - 1)
 
-    return slots
+    return [
+        minutes_to_time_string(minutes)
+        for minutes in range(start_minutes, end_minutes + 1, min_interval)
+    ]
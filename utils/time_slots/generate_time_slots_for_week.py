@@ -1,5 +1,5 @@
 from models.field_optimizer.time_slot import TimeSlot
-from utils.time_slots import generate_time_slots
+from utils.time_slots.get_time_slot_table import get_time_slot_table
 
 
 def generate_time_slots_for_week(min_interval: int) -> list[TimeSlot]:
@@ -12,23 +12,4 @@ def generate_time_slots_for_week(min_interval: int) -> list[TimeSlot]:
     Returns:
         List of TimeSlot objects for the entire week
     """
-    start_time = "00:00"
-    end_time = "23:59"
-    time_slots = generate_time_slots(start_time, end_time, min_interval)
-
-    days = 7
-    current_time_slot = 1
-
-    time_slots_map = []
-
-    for i in range(days):
-        for current_time in time_slots:
-            time_slots_map.append(TimeSlot(
-                id=current_time_slot,
-                time=current_time,
-                week_day_index=i,
-                duration_minutes=min_interval
-            ))
-            current_time_slot += 1
-
-    return time_slots_map
+    return list(get_time_slot_table(min_interval).time_slots)
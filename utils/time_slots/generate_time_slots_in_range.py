@@ -1,6 +1,66 @@
 from models.field_optimizer.time_slot import TimeSlot
-from utils.time_slots import generate_time_slots_for_week
-from utils.datetime import is_time_between
+from utils.datetime import time_string_to_minutes
+from utils.time_slots.get_time_slot_table import (
+    DAYS_PER_WEEK, get_time_slot_table, get_day_offsets_in_range
+)
+
+
+def generate_time_slots_in_minute_range(
+    start_minutes: int,
+    end_minutes: int,
+    min_interval: int
+) -> list[TimeSlot]:
+    """
+    Minute-of-day variant of generate_time_slots_in_range.
+
+    Args:
+        start_minutes: Start of the range as minute of day
+        end_minutes: End of the range as minute of day (exclusive)
+        min_interval: Interval in minutes (15, 30 or 60)
+
+    Returns:
+        List of TimeSlot objects filtered by time range
+    """
+    table = get_time_slot_table(min_interval)
+    day_offsets = get_day_offsets_in_range(
+        start_minutes, end_minutes, min_interval)
+
+    available_time_slots = []
+    for week_day_index in range(DAYS_PER_WEEK):
+        day_base = week_day_index * table.slots_per_day
+        for offsets in day_offsets:
+            available_time_slots.extend(
+                table.time_slots[day_base + offsets.start:day_base + offsets.stop])
+
+    return available_time_slots
+
+
+def generate_time_slots_in_day_windows(
+    day_windows: dict[int, tuple[int, int]],
+    min_interval: int
+) -> list[TimeSlot]:
+    """
+    Get time slots for a separate window per week day.
+
+    Args:
+        day_windows: (start_minutes, end_minutes) per week day index, end
+            exclusive; days without a window get no slots
+        min_interval: Interval in minutes (15, 30 or 60)
+
+    Returns:
+        List of TimeSlot objects ordered by day and time
+    """
+    table = get_time_slot_table(min_interval)
+
+    available_time_slots = []
+    for week_day_index in sorted(day_windows):
+        start_minutes, end_minutes = day_windows[week_day_index]
+        day_base = week_day_index * table.slots_per_day
+        for offsets in get_day_offsets_in_range(start_minutes, end_minutes, min_interval):
+            available_time_slots.extend(
+                table.time_slots[day_base + offsets.start:day_base + offsets.stop])
+
+    return available_time_slots
 
 
 def generate_time_slots_in_range(
@@ -19,10 +79,8 @@ def generate_time_slots_in_range(
     Returns:
         List of TimeSlot objects filtered by time range
     """
-    all_weekly_time_slots = generate_time_slots_for_week(min_interval)
-    available_time_slots = [
-        time_slot for time_slot in all_weekly_time_slots
-        if is_time_between(time_slot.time, start_time, end_time)
-    ]
-
-    return available_time_slots
+    return generate_time_slots_in_minute_range(
+        time_string_to_minutes(start_time),
+        time_string_to_minutes(end_time),
+        min_interval
+    )
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import NamedTuple
+from models.field_optimizer.time_slot import TimeSlot
+from utils.time_slots.generate_time_slots import generate_time_slots
+
+DAYS_PER_WEEK = 7
+MINUTES_PER_DAY = 24 * 60
+
+
+class TimeSlotTable(NamedTuple):
+    """Weekly time slots for one granularity. Slot id N lives at position N - 1."""
+    min_interval: int
+    slots_per_day: int
+    time_slots: tuple[TimeSlot, ...]
+    minutes: tuple[int, ...]  # minute of day for each slot
+    week_day_indexes: tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def get_time_slot_table(min_interval: int) -> TimeSlotTable:
+    """
+    Build the weekly time slot table for a granularity once and cache it.
+
+    Args:
+        min_interval: Interval in minutes (15, 30 or 60)
+
+    Returns:
+        TimeSlotTable shared by every caller using the same interval
+    """
+    day_times = generate_time_slots("00:00", "23:59", min_interval)
+    slots_per_day = len(day_times)
+
+    time_slots = []
+    minutes = []
+    week_day_indexes = []
+    for week_day_index in range(DAYS_PER_WEEK):
+        for offset, current_time in enumerate(day_times):
+            time_slots.append(TimeSlot(
+                id=week_day_index * slots_per_day + offset + 1,
+                time=current_time,
+                minutes=offset * min_interval,
+                week_day_index=week_day_index,
+                duration_minutes=min_interval
+            ))
+            minutes.append(offset * min_interval)
+            week_day_indexes.append(week_day_index)
+
+    return TimeSlotTable(
+        min_interval=min_interval,
+        slots_per_day=slots_per_day,
+        time_slots=tuple(time_slots),
+        minutes=tuple(minutes),
+        week_day_indexes=tuple(week_day_indexes),
+    )
+
+
+def get_day_offsets_in_range(
+    start_minutes: int,
+    end_minutes: int,
+    min_interval: int
+) -> list[range]:
+    """
+    Get the in-day slot offsets whose start lies in [start, end).
+    A range that crosses midnight (start > end) yields two ranges.
+
+    Args:
+        start_minutes: Start of the range as minute of day
+        end_minutes: End of the range as minute of day (exclusive)
+        min_interval: Interval in minutes (15, 30 or 60)
+
+    Returns:
+        Ascending, non-overlapping ranges of in-day slot offsets
+    """
+    slots_per_day = MINUTES_PER_DAY // min_interval
+    first = -(-start_minutes // min_interval)
+    stop = min(-(-end_minutes // min_interval), slots_per_day)
+
+    if start_minutes <= end_minutes:
+        return [range(first, stop)] if first < stop else []
+
+    return [r for r in (range(0, stop), range(first, slots_per_day)) if r]